@@ -0,0 +1,680 @@
+import json
+import os
+
+import pytest
+from playwright.sync_api import sync_playwright
+
+from data.constants import SWEEPER_NAME_PREFIXES, SWEEPER_MIN_AGE_MINUTES
+from pageObjects.documentsInsightsPage import DocumentsInsightsPage
+from utilities.api.api_client import dispose_api_clients, set_api_base_url
+from utilities.asset_cache import ASSET_CACHE_DIR, AssetCache, asset_cache_stats
+from utilities.auth_state import get_cached_user_token, get_storage_state
+from utilities.browser_profile import BROWSERS, PROFILES, build_launch_options, get_default_profile, get_peak_rss_mb
+from utilities.endpoint_latency import ENDPOINT_LATENCY_FILE, EndpointLatencyCollector, endpoint_samples, \
+    summarize_endpoints
+from utilities.perf_budgets import PERF_BUDGET_MODES, PERF_BUDGETS_FILE, budget_breaches, configure_budgets
+from utilities.phase_timing import PHASE_TIMING_FILE, finish_test_timer, get_current_timer, install_expect_timing, \
+    phase_records, start_test_timer, summarize_phases
+from utilities.polling import hub_settle_times
+from utilities.request_blocking import BLOCKING_MODES, BLOCKING_PRESETS, RequestBlocker, blocking_stats
+from utilities.route_table import route_timings, summarize_critical_path, warm_up_routes
+from utilities.sharding import DURATIONS_FILE, load_durations, save_durations, split_into_shards
+from utilities.stubs.api_stub import API_CASSETTE_DIR, API_CASSETTE_VERSION, API_STUB_MODES, UPSTREAM_API_URLS, \
+    ApiStub, get_cassette_paths, route_browser_to_stub
+from utilities.stubs.mailslurp_stub import MailSlurpStub
+from utilities.sweeper import sweep_orphans
+from utilities.teardown_registry import TeardownRegistry, teardown_results
+from utilities.web_vitals import WEB_VITALS_FILE, WebVitalsCollector, summarize_web_vitals, web_vitals_records
+from utilities.utils import create_hub
+
+# Peak RSS reported by every worker, filled at the end of the session
+peak_rss_by_worker = {}
+# Hub settle waits of all workers, filled at the end of the session
+all_hub_settle_times = []
+# Teardown deletions of all workers, filled at the end of the session
+all_teardown_results = []
+# Result of the orphaned-resource sweep, filled at the start of the session
+sweep_summary = {}
+# Savings of the static asset cache of all workers, filled at the end of the session
+all_asset_cache_stats = {}
+# Traffic per request blocking preset of all workers, filled at the end of the session
+all_blocking_stats = {}
+# Phase timings of all tests of all workers, filled at the end of the session
+all_phase_records = []
+# Backend requests measured in the UI tests of all workers, filled at the end of the session
+all_endpoint_samples = []
+# Navigation timings and web vitals of all workers, filled at the end of the session
+all_web_vitals_records = []
+# Arrival of the required API calls of the page transitions of all workers, filled at the end of the session
+all_route_timings = []
+# Performance budget breaches of all workers, filled at the end of the session
+all_budget_breaches = []
+# Duration of every test run in this process (setup + call + teardown)
+test_durations = {}
+# Durations of the tests of all workers and the total per worker, filled at the end of the session
+all_test_durations = {}
+actual_load_by_worker = {}
+# Shards computed from the historical durations: predicted seconds per shard and the shard run here
+shard_plan = {}
+
+
+def pytest_addoption(parser):
+    # The options have their own prefix, pytest-playwright already registers --headed, --browser and --slowmo
+    group = parser.getgroup("browser", "Browser execution profile")
+    group.addoption("--ui-headed", action="store_true", default=False, dest="ui_headed",
+                    help="Run the browser with a visible window. Headless by default.")
+    group.addoption("--ui-browser", action="store", default="chromium", choices=BROWSERS, dest="ui_browser",
+                    help="Browser engine to run the tests in. Default: chromium.")
+    group.addoption("--ui-slow-mo", action="store", type=float, default=0, dest="ui_slow_mo",
+                    help="Slow down every Playwright operation by the given amount of milliseconds.")
+    group.addoption("--ui-browser-arg", action="append", default=[], dest="ui_browser_arg",
+                    help="Extra command line argument for the browser. Can be passed several times.")
+    group.addoption("--profile", action="store", default=get_default_profile(), choices=PROFILES,
+                    help="Execution profile. 'ci' adds container friendly launch flags. "
+                         "Default: 'ci' when the CI environment variable is set, else 'local'.")
+    group.addoption("--asset-cache", action="store_true", default=False, dest="asset_cache",
+                    help="Serve the static resources of the Studio frontend from a disk cache shared by all tests.")
+    group.addoption("--asset-cache-dir", action="store", default=ASSET_CACHE_DIR, dest="asset_cache_dir",
+                    help=f"Folder of the static asset cache. Default: {ASSET_CACHE_DIR}.")
+    group.addoption("--warm-up-routes", action="store_true", default=False, dest="warm_up_routes",
+                    help="Open every page of the route table once per worker before the first test, so the asset "
+                         "cache and the backend caches are warm.")
+    group.addoption("--blocking-report", action="store_true", default=False, dest="blocking_report",
+                    help="Run every test with the block_requests marker twice, blocked and as an unblocked "
+                         "baseline, and report what every preset saves in these tests.")
+    group = parser.getgroup("timing", "Test timing")
+    group.addoption("--phase-timing", action="store", nargs="?", const=PHASE_TIMING_FILE, default=None,
+                    dest="phase_timing",
+                    help=f"Split every test into phases (setup, authentication, first_goto, actions, expect, "
+                         f"teardown), write them to the given JSONL file (default: {PHASE_TIMING_FILE}) "
+                         f"and print the slowest phases.")
+    group.addoption("--endpoint-latency", action="store", nargs="?", const=ENDPOINT_LATENCY_FILE, default=None,
+                    dest="endpoint_latency",
+                    help=f"Measure every backend request sent by the frontend and write count, p50, p95 and max "
+                         f"latency per endpoint to the given JSON file (default: {ENDPOINT_LATENCY_FILE}).")
+    group.addoption("--web-vitals", action="store", nargs="?", const=WEB_VITALS_FILE, default=None,
+                    dest="web_vitals",
+                    help=f"Collect Navigation Timing, Resource Timing, LCP, CLS and long tasks of every page load "
+                         f"and sidebar navigation and write them to the given JSONL file (default: {WEB_VITALS_FILE}).")
+    group.addoption("--perf-budgets", action="store", default=None, choices=PERF_BUDGET_MODES, dest="perf_budgets",
+                    help="Check page transitions and backend calls of the page objects against the performance "
+                         "budgets. 'warn' reports a breach as PerfBudgetWarning, 'fail' fails the test. "
+                         "Disabled by default.")
+    group.addoption("--perf-budgets-file", action="store", default=PERF_BUDGETS_FILE, dest="perf_budgets_file",
+                    help=f"File with the performance budgets. Default: {PERF_BUDGETS_FILE}.")
+    group = parser.getgroup("sharding", "Duration-aware sharding")
+    group.addoption("--durations-path", action="store", default=DURATIONS_FILE, dest="durations_path",
+                    help=f"File with the historical test durations. Default: {DURATIONS_FILE}.")
+    group.addoption("--store-durations", action="store_true", default=False, dest="store_durations",
+                    help="Merge the durations of this run into the durations file.")
+    group.addoption("--shard-count", action="store", type=int, default=1, dest="shard_count",
+                    help="Split the tests into this number of shards with about the same total duration, "
+                         "for example one shard per CI machine.")
+    group.addoption("--shard-index", action="store", type=int, default=0, dest="shard_index",
+                    help="Run only the shard with this index, from 0 to --shard-count - 1.")
+    group.addoption("--balance-workers", action="store_true", default=False, dest="balance_workers",
+                    help="Give every pytest-xdist worker one shard with about the same total duration. "
+                         "Use together with -n <workers> --dist loadgroup.")
+    group = parser.getgroup("sweeper", "Orphaned-resource sweeper")
+    group.addoption("--sweep-orphans", action="store_true", default=False,
+                    help="Delete hubs, web automations and organizations left by previous runs before the tests start.")
+    group.addoption("--sweep-prefix", action="append", default=[], dest="sweep_prefix",
+                    help="Name prefix of the resources to sweep. Can be passed several times. "
+                         "Default: SWEEPER_NAME_PREFIXES from data/constants.py.")
+    group.addoption("--sweep-min-age", action="store", type=float, default=SWEEPER_MIN_AGE_MINUTES,
+                    dest="sweep_min_age",
+                    help=f"Sweep only resources older than this amount of minutes. Default: {SWEEPER_MIN_AGE_MINUTES}.")
+    group.addoption("--sweep-default-hub-names", action="store_true", default=False, dest="sweep_default_hub_names",
+                    help="Sweep also the hubs that kept the default name of the hub wizard. Hubs created by hand "
+                         "and never renamed have the same names, use it only on a stage without manual hubs.")
+    group = parser.getgroup("stubs", "Local stand-ins for external services")
+    group.addoption("--mail-stub", action="store_true", default=False, dest="mail_stub",
+                    help="Send the MailSlurp requests to an in-process stand-in instead of api.mailslurp.com.")
+    group.addoption("--mail-stub-smtp-port", action="store", type=int, default=None, dest="mail_stub_smtp_port",
+                    help="Also accept emails for the stand-in over SMTP on this port. Disabled by default.")
+    group.addoption("--api-stub", action="store", default=None, choices=API_STUB_MODES, dest="api_stub",
+                    help="Send the Plextera and OCRG API requests to local stand-ins. 'record' forwards them to "
+                         "the real APIs and saves scrubbed responses to data/api_cassettes, 'replay' serves them "
+                         "offline. Disabled by default.")
+    group.addoption("--api-cassette-version", action="store", default=API_CASSETTE_VERSION,
+                    dest="api_cassette_version",
+                    help=f"Folder in {API_CASSETTE_DIR} with the recorded responses. Default: {API_CASSETTE_VERSION}.")
+    group.addoption("--frontend-only", action="store_true", default=False, dest="frontend_only",
+                    help="Answer all browser requests to the Plextera and OCRG APIs from the API stand-ins, "
+                         "so the real frontend runs without the stage backend. Implies --api-stub replay "
+                         "unless --api-stub record is given.")
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "user_profile(name): open the test context already logged in as the given user_credentials.json profile")
+    config.addinivalue_line(
+        "markers", f"block_requests(preset): block requests the test does not need, preset is one of "
+                   f"{', '.join(BLOCKING_PRESETS)}")
+    configure_budgets(config.getoption("perf_budgets"), config.getoption("perf_budgets_file"))
+    if config.getoption("phase_timing"):
+        install_expect_timing()
+    if config.getoption("frontend_only") and config.getoption("api_stub") != "record":
+        cassette_dir = os.path.join(API_CASSETTE_DIR, config.getoption("api_cassette_version"))
+        missing = [path for path in get_cassette_paths(cassette_dir).values() if not os.path.exists(path)]
+        if missing:
+            raise pytest.UsageError(
+                f"--frontend-only replays the recorded API responses, but {', '.join(missing)} "
+                f"{'is' if len(missing) == 1 else 'are'} missing. Record them once against the stage APIs with "
+                f"--frontend-only --api-stub record --api-cassette-version {config.getoption('api_cassette_version')}")
+
+
+def pytest_generate_tests(metafunc):
+    # With --blocking-report the marked tests also run unblocked, as the baseline of their preset
+    if (metafunc.config.getoption("blocking_report") and "request_blocking_mode" in metafunc.fixturenames
+            and metafunc.definition.get_closest_marker("block_requests")):
+        metafunc.parametrize("request_blocking_mode", BLOCKING_MODES, indirect=True)
+
+
+# Runs before the pytest-xdist worker hook, which turns the xdist_group markers into '@<group>' node ID suffixes
+@pytest.hookimpl(tryfirst=True)
+def pytest_collection_modifyitems(config, items):
+    shard_count = config.getoption("shard_count")
+    worker_count = config.workerinput["workercount"] if hasattr(config, "workerinput") else 1
+    if shard_count == 1 and not (config.getoption("balance_workers") and worker_count > 1):
+        return
+    durations = load_durations(config.getoption("durations_path"))
+    if shard_count > 1:
+        shard_index = config.getoption("shard_index")
+        if not 0 <= shard_index < shard_count:
+            raise pytest.UsageError(f"--shard-index must be from 0 to {shard_count - 1}")
+        shards = split_into_shards([item.nodeid for item in items], durations, shard_count)
+        selected = set(shards[shard_index]["nodeids"])
+        config.hook.pytest_deselected(items=[item for item in items if item.nodeid not in selected])
+        items[:] = [item for item in items if item.nodeid in selected]
+        shard_plan["shards"] = [shard["predicted"] for shard in shards]
+        shard_plan["shard_index"] = shard_index
+    if config.getoption("balance_workers") and worker_count > 1:
+        # Every worker collects the same tests and computes the same split, xdist sends one group to one worker
+        worker_shards = split_into_shards([item.nodeid for item in items], durations, worker_count)
+        for index, shard in enumerate(worker_shards):
+            group_nodeids = set(shard["nodeids"])
+            for item in items:
+                if item.nodeid in group_nodeids:
+                    item.add_marker(pytest.mark.xdist_group(f"duration-shard-{index}"))
+        shard_plan["workers"] = [shard["predicted"] for shard in worker_shards]
+
+
+def pytest_runtest_logreport(report):
+    test_durations[report.nodeid] = test_durations.get(report.nodeid, 0) + report.duration
+
+
+def pytest_sessionstart(session):
+    config = session.config
+    # Sweep once per run: in the xdist controller or in the single process, never in the workers
+    if not config.getoption("sweep_orphans") or hasattr(config, "workerinput") or config.option.collectonly:
+        return
+    with sync_playwright() as playwright:
+        user_token = get_cached_user_token(playwright, "support")
+        dispose_api_clients(playwright)
+    sweep_summary.update(sweep_orphans(
+        user_token,
+        config.getoption("sweep_prefix") or SWEEPER_NAME_PREFIXES,
+        config.getoption("sweep_min_age"),
+        default_hub_names=config.getoption("sweep_default_hub_names")
+    ))
+
+
+def pytest_sessionfinish(session):
+    peak_rss = get_peak_rss_mb()
+    if hasattr(session.config, "workeroutput"):
+        # Running inside an xdist worker, hand the numbers over to the controller
+        session.config.workeroutput["peak_rss"] = peak_rss
+        session.config.workeroutput["hub_settle_times"] = hub_settle_times
+        session.config.workeroutput["teardown_results"] = teardown_results
+        session.config.workeroutput["asset_cache_stats"] = asset_cache_stats
+        session.config.workeroutput["blocking_stats"] = blocking_stats
+        session.config.workeroutput["phase_records"] = phase_records
+        session.config.workeroutput["endpoint_samples"] = endpoint_samples
+        session.config.workeroutput["web_vitals_records"] = web_vitals_records
+        session.config.workeroutput["budget_breaches"] = budget_breaches
+        session.config.workeroutput["route_timings"] = route_timings
+        session.config.workeroutput["test_durations"] = test_durations
+        session.config.workeroutput["shard_plan"] = shard_plan
+        return
+    if peak_rss_by_worker == {}:
+        peak_rss_by_worker["main"] = peak_rss
+        all_hub_settle_times.extend(hub_settle_times)
+        all_teardown_results.extend(teardown_results)
+        add_asset_cache_stats(asset_cache_stats)
+        add_blocking_stats(blocking_stats)
+        all_phase_records.extend(phase_records)
+        all_endpoint_samples.extend(endpoint_samples)
+        all_web_vitals_records.extend(web_vitals_records)
+        all_budget_breaches.extend(budget_breaches)
+        all_route_timings.extend(route_timings)
+        all_test_durations.update(test_durations)
+        actual_load_by_worker["main"] = round(sum(test_durations.values()), 2)
+    if session.config.getoption("store_durations") and all_test_durations:
+        save_durations(all_test_durations, session.config.getoption("durations_path"))
+    phase_timing_file = session.config.getoption("phase_timing")
+    if phase_timing_file and all_phase_records:
+        with open(phase_timing_file, "w") as f:
+            for record in all_phase_records:
+                f.write(json.dumps(record) + "\n")
+    endpoint_latency_file = session.config.getoption("endpoint_latency")
+    if endpoint_latency_file and all_endpoint_samples:
+        with open(endpoint_latency_file, "w") as f:
+            json.dump(summarize_endpoints(all_endpoint_samples), f, indent=4)
+    web_vitals_file = session.config.getoption("web_vitals")
+    if web_vitals_file and all_web_vitals_records:
+        with open(web_vitals_file, "w") as f:
+            for record in all_web_vitals_records:
+                f.write(json.dumps(record) + "\n")
+
+
+def add_asset_cache_stats(stats):
+    for key, value in stats.items():
+        all_asset_cache_stats[key] = all_asset_cache_stats.get(key, 0) + value
+
+
+def add_blocking_stats(stats):
+    for preset, preset_stats in stats.items():
+        for mode, mode_stats in preset_stats.items():
+            totals = all_blocking_stats.setdefault(preset, {}).setdefault(mode, {})
+            for key, value in mode_stats.items():
+                totals[key] = totals.get(key, 0) + value
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    worker_output = getattr(node, "workeroutput", {})
+    peak_rss_by_worker[node.gateway.id] = worker_output.get("peak_rss")
+    all_hub_settle_times.extend(worker_output.get("hub_settle_times", []))
+    all_teardown_results.extend(worker_output.get("teardown_results", []))
+    add_asset_cache_stats(worker_output.get("asset_cache_stats", {}))
+    add_blocking_stats(worker_output.get("blocking_stats", {}))
+    all_phase_records.extend(worker_output.get("phase_records", []))
+    all_endpoint_samples.extend(worker_output.get("endpoint_samples", []))
+    all_web_vitals_records.extend(worker_output.get("web_vitals_records", []))
+    all_budget_breaches.extend(worker_output.get("budget_breaches", []))
+    all_route_timings.extend(worker_output.get("route_timings", []))
+    worker_durations = worker_output.get("test_durations", {})
+    all_test_durations.update(worker_durations)
+    actual_load_by_worker[node.gateway.id] = round(sum(worker_durations.values()), 2)
+    if not shard_plan:
+        shard_plan.update(worker_output.get("shard_plan", {}))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_setup(item):
+    if not item.config.getoption("phase_timing"):
+        yield
+        return
+    with start_test_timer(item.nodeid).phase("setup"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item):
+    timer = get_current_timer()
+    if timer is None:
+        yield
+        return
+    with timer.phase("actions"):
+        yield
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_teardown(item):
+    timer = get_current_timer()
+    if timer is None:
+        yield
+        return
+    with timer.phase("teardown"):
+        yield
+    finish_test_timer()
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if not peak_rss_by_worker or config.option.collectonly:
+        return
+    if sweep_summary:
+        removed = ", ".join(f"{count} {resource_type}" for resource_type, count in sweep_summary["removed"].items())
+        terminalreporter.section("orphaned-resource sweep")
+        terminalreporter.write_line(
+            f"removed {removed or 'nothing'} in {sweep_summary['seconds']} s, {len(sweep_summary['failed'])} failed")
+    if all_hub_settle_times:
+        waits = [item["seconds"] for item in all_hub_settle_times]
+        terminalreporter.section("hub settle waits before delete")
+        terminalreporter.write_line(
+            f"{len(waits)} waits, total {sum(waits):.2f} s, average {sum(waits) / len(waits):.2f} s, "
+            f"max {max(waits):.2f} s")
+        slowest = max(all_hub_settle_times, key=lambda item: item["seconds"])
+        terminalreporter.write_line(f"slowest: hub {slowest['hub_id']}, {slowest['attempts']} attempts")
+    if all_teardown_results:
+        failed = [result for result in all_teardown_results if result["error"]]
+        terminalreporter.section("resource teardown")
+        terminalreporter.write_line(f"{len(all_teardown_results) - len(failed)} resources deleted, {len(failed)} failed")
+        for result in failed:
+            terminalreporter.write_line(f"FAILED {result['type']} {result['id']}: {result['error']}", red=True)
+    if config.getoption("asset_cache"):
+        stats = all_asset_cache_stats
+        terminalreporter.section("static asset cache")
+        terminalreporter.write_line(
+            f"{stats.get('hits', 0)} hits ({stats.get('revalidated', 0)} revalidated), {stats.get('misses', 0)} misses, "
+            f"saved {stats.get('bytes_saved', 0) / 1024 / 1024:.1f} MB and {stats.get('seconds_saved', 0):.1f} s, "
+            f"downloaded {stats.get('bytes_downloaded', 0) / 1024 / 1024:.1f} MB")
+    if all_blocking_stats:
+        terminalreporter.section("request blocking (per test averages)")
+        for preset, preset_stats in sorted(all_blocking_stats.items()):
+            averages = {}
+            for mode, stats in preset_stats.items():
+                tests = stats["tests"] or 1
+                averages[mode] = {
+                    "kb": stats["bytes"] / tests / 1024,
+                    "load": stats["load_seconds"] / stats["loads"] if stats["loads"] else 0,
+                }
+                terminalreporter.write_line(
+                    f"{preset} {mode}: {stats['tests']} tests, {stats['requests'] / tests:.0f} requests, "
+                    f"{stats['blocked'] / tests:.0f} blocked, {averages[mode]['kb']:.0f} KB, "
+                    f"page load {averages[mode]['load']:.2f} s")
+            if len(averages) == len(BLOCKING_MODES):
+                terminalreporter.write_line(
+                    f"{preset} saves {averages['baseline']['kb'] - averages['blocked']['kb']:.0f} KB and "
+                    f"{averages['baseline']['load'] - averages['blocked']['load']:.2f} s page load per test")
+    if all_phase_records:
+        totals, slowest = summarize_phases(all_phase_records)
+        terminalreporter.section(f"slowest test phases (all phases in {config.getoption('phase_timing')})")
+        terminalreporter.write_line(", ".join(f"{name} {seconds:.1f} s" for name, seconds in totals.items()))
+        for nodeid, name, seconds in slowest:
+            terminalreporter.write_line(f"{seconds:8.2f} s  {name:<15} {nodeid}")
+    if all_endpoint_samples:
+        terminalreporter.section(f"backend endpoint latency, slowest by p95 (all endpoints in "
+                                 f"{config.getoption('endpoint_latency')})")
+        terminalreporter.write_line(f"{'count':>6} {'errors':>6} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8}  endpoint")
+        for row in summarize_endpoints(all_endpoint_samples)[:15]:
+            terminalreporter.write_line(
+                f"{row['count']:>6} {row['errors']:>6} {row['p50'] or 0:>8.0f} {row['p95'] or 0:>8.0f} "
+                f"{row['max'] or 0:>8.0f}  {row['endpoint']}")
+    if all_web_vitals_records:
+        terminalreporter.section(f"page navigations, slowest first (all records in {config.getoption('web_vitals')})")
+        terminalreporter.write_line(
+            f"{'count':>6} {'ms':>8} {'LCP ms':>8} {'CLS':>6} {'long ms':>8} {'KB':>8}  page")
+        for row in summarize_web_vitals(all_web_vitals_records):
+            lcp = f"{row['lcp']:>8.0f}" if row["lcp"] is not None else f"{'-':>8}"
+            terminalreporter.write_line(
+                f"{row['count']:>6} {row['duration']:>8.0f} {lcp} {row['cls']:>6.3f} {row['long_tasks']:>8.0f} "
+                f"{row['transfer_size'] / 1024:>8.0f}  {row['page']} ({row['kind']})")
+    if all_route_timings and config.getoption("web_vitals"):
+        terminalreporter.section("critical path of the page transitions (median ms after the click)")
+        for row in summarize_critical_path(all_route_timings):
+            terminalreporter.write_line(f"{row['page']}: ready after {row['ready']:.0f} ms, {row['count']} transitions")
+            for call in row["calls"]:
+                terminalreporter.write_line(
+                    f"    {call['arrival']:>8.0f} ms, last in {call['critical']} of {row['count']}  {call['api_call']}")
+    if all_budget_breaches:
+        mode = config.getoption("perf_budgets")
+        terminalreporter.section(f"performance budget breaches ({mode})")
+        for breach in all_budget_breaches:
+            terminalreporter.write_line(
+                f"{breach['page']}: {breach['name']} {breach['metric']} {breach['value']} > {breach['budget']}",
+                red=mode == "fail", yellow=mode == "warn")
+    if shard_plan:
+        terminalreporter.section("duration-aware sharding")
+        actual_makespan = max(actual_load_by_worker.values(), default=0)
+        if "shards" in shard_plan:
+            terminalreporter.write_line(
+                f"shard {shard_plan['shard_index']} of {len(shard_plan['shards'])}: predicted "
+                f"{shard_plan['shards'][shard_plan['shard_index']]:.1f} s, actual {sum(actual_load_by_worker.values()):.1f} s; "
+                f"predicted makespan of all shards {max(shard_plan['shards']):.1f} s")
+        if "workers" in shard_plan:
+            terminalreporter.write_line(
+                f"workers: predicted makespan {max(shard_plan['workers']):.1f} s "
+                f"({', '.join(f'{seconds:.1f}' for seconds in shard_plan['workers'])}), "
+                f"actual makespan {actual_makespan:.1f} s "
+                f"({', '.join(f'{worker_id} {seconds:.1f}' for worker_id, seconds in sorted(actual_load_by_worker.items()))})")
+    terminalreporter.section(f"peak RSS per worker ({config.getoption('profile')} profile, "
+                             f"{'headed' if config.getoption('ui_headed') else 'headless'})")
+    for worker_id, peak_rss in sorted(peak_rss_by_worker.items()):
+        if peak_rss is None:
+            terminalreporter.write_line(f"{worker_id}: not available on this platform")
+        else:
+            terminalreporter.write_line(
+                f"{worker_id}: runner {peak_rss['runner']} MB, largest child process {peak_rss['largest_child']} MB")
+
+
+@pytest.fixture(scope="module")
+def shared_data():
+    return {}
+
+
+@pytest.fixture(scope="session")
+def playwright_session():
+    """
+    Starts Playwright once per session (once per worker when running with pytest-xdist).
+    API request contexts shared by the helpers in utilities/api are disposed at the end of the session.
+
+    :return: Playwright instance
+    """
+    with sync_playwright() as playwright:
+        yield playwright
+        dispose_api_clients(playwright)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mail_stub(pytestconfig):
+    """
+    Starts the local MailSlurp stand-in when the run is started with --mail-stub
+    and points the helpers in utilities/api/api_temp_email.py to it.
+
+    :param pytestconfig: a fixture
+    :return: MailSlurpStub instance, or None when the real MailSlurp API is used
+    """
+    if not pytestconfig.getoption("mail_stub"):
+        yield None
+        return
+    with MailSlurpStub(smtp_port=pytestconfig.getoption("mail_stub_smtp_port")) as stub:
+        previous_base_url = set_api_base_url("mailslurp", stub.url)
+        yield stub
+        set_api_base_url("mailslurp", previous_base_url)
+
+
+@pytest.fixture(scope="session", autouse=True)
+def api_stubs(pytestconfig):
+    """
+    Starts local stand-ins for the Plextera and OCRG APIs when the run is started with --api-stub
+    or --frontend-only and points the helpers in utilities/api/api_base.py to them.
+
+    :param pytestconfig: a fixture
+    :return: dict with ApiStub instance per API name, empty when the real APIs are used
+    """
+    mode = pytestconfig.getoption("api_stub") or ("replay" if pytestconfig.getoption("frontend_only") else None)
+    if mode is None:
+        yield {}
+        return
+    cassette_dir = os.path.join(API_CASSETTE_DIR, pytestconfig.getoption("api_cassette_version"))
+    stubs = {api_name: ApiStub(api_name, mode, cassette_dir).start() for api_name in UPSTREAM_API_URLS}
+    previous_base_urls = {api_name: set_api_base_url(api_name, stub.url) for api_name, stub in stubs.items()}
+    yield stubs
+    for api_name, stub in stubs.items():
+        set_api_base_url(api_name, previous_base_urls[api_name])
+        stub.stop()
+
+
+@pytest.fixture(scope="session")
+def browser_session(playwright_session, pytestconfig):
+    """
+    Launches the browser once per session and shares it between all tests of the worker.
+    Browser type and launch options come from the command line, see pytest_addoption.
+
+    :param playwright_session: a fixture
+    :param pytestconfig: a fixture
+    :return: Browser instance
+    """
+    browser_type = getattr(playwright_session, pytestconfig.getoption("ui_browser"))
+    browser = browser_type.launch(**build_launch_options(pytestconfig))
+    yield browser
+    browser.close()
+
+
+@pytest.fixture(scope="session")
+def asset_cache(pytestconfig):
+    """
+    Disk cache of the static frontend resources, enabled with --asset-cache
+
+    :param pytestconfig: a fixture
+    :return: AssetCache instance or None
+    """
+    if not pytestconfig.getoption("asset_cache"):
+        return None
+    return AssetCache(pytestconfig.getoption("asset_cache_dir"))
+
+
+def install_routes(context, config, api_stubs, asset_cache):
+    if config.getoption("frontend_only"):
+        for stub in api_stubs.values():
+            route_browser_to_stub(context, stub)
+    if asset_cache is not None:
+        asset_cache.install(context)
+
+
+@pytest.fixture(scope="session")
+def warmed_up_routes(browser_session, playwright_session, api_stubs, asset_cache, pytestconfig):
+    """
+    Opens every page of the route table once as the support user, before the first test of the worker
+
+    :param browser_session: a fixture
+    :param playwright_session: a fixture
+    :param api_stubs: a fixture
+    :param asset_cache: a fixture
+    :param pytestconfig: a fixture
+    """
+    context = browser_session.new_context(storage_state=get_storage_state(playwright_session, "support"))
+    install_routes(context, pytestconfig, api_stubs, asset_cache)
+    warm_up_routes(context.new_page())
+    context.close()
+
+
+@pytest.fixture
+def browser_context(browser_session, playwright_session, api_stubs, asset_cache, request_blocking_mode, request):
+    """
+    Creates a fresh, isolated browser context for every test.
+    If the test is marked with @pytest.mark.user_profile("<profile>"), the context is created
+    with the cached storage state of that profile, so the user is already logged in.
+    With --frontend-only the backend requests of the context are answered by the API stand-ins,
+    with --asset-cache the static frontend resources are served from the disk cache,
+    with --web-vitals the page loads and sidebar navigations are measured.
+    With --warm-up-routes every page is opened once per worker before the first context is created.
+    Tests marked with @pytest.mark.block_requests("<preset>") run with the requests of the preset blocked,
+    with --blocking-report they run a second time unblocked as the baseline of the preset.
+
+    :param browser_session: a fixture
+    :param playwright_session: a fixture
+    :param api_stubs: a fixture
+    :param asset_cache: a fixture
+    :param request_blocking_mode: a fixture
+    :param request: a fixture
+    :return: BrowserContext instance
+    """
+    if request.config.getoption("warm_up_routes"):
+        request.getfixturevalue("warmed_up_routes")
+    marker = request.node.get_closest_marker("user_profile")
+    if marker:
+        context = browser_session.new_context(storage_state=get_storage_state(playwright_session, marker.args[0]))
+    else:
+        context = browser_session.new_context()
+    install_routes(context, request.config, api_stubs, asset_cache)
+    timer = get_current_timer()
+    if timer is not None:
+        timer.watch_first_navigation(context)
+    if request.config.getoption("endpoint_latency"):
+        EndpointLatencyCollector().install(context)
+    if request.config.getoption("web_vitals"):
+        WebVitalsCollector(request.node.nodeid).install(context)
+    marker = request.node.get_closest_marker("block_requests")
+    if marker:
+        RequestBlocker(marker.args[0], request_blocking_mode).install(context)
+    yield context
+    context.close()
+
+
+@pytest.fixture
+def request_blocking_mode(request):
+    """
+    :return: 'blocked', or 'baseline' in the extra unblocked run of a block_requests test with --blocking-report
+    """
+    return getattr(request, "param", "blocked")
+
+
+@pytest.fixture
+def context_and_playwright(browser_context, playwright_session):
+    yield browser_context, playwright_session
+
+
+@pytest.fixture(scope="session")
+def teardown_registry_session():
+    """
+    Session-level registry of created resources. All deletions are finished before the session ends.
+
+    :return: TeardownRegistry instance
+    """
+    registry = TeardownRegistry()
+    yield registry
+    registry.wait()
+
+
+@pytest.fixture
+def teardown_registry(teardown_registry_session):
+    """
+    Registry for resources created by the test. Registered resources are deleted in the background
+    after the test is finished, also when the test failed.
+
+    Usage: teardown_registry.register_hub(hub_id, user_token)
+
+    :param teardown_registry_session: a fixture
+    :return: TeardownRegistry instance
+    """
+    yield teardown_registry_session
+    teardown_registry_session.flush()
+
+
+@pytest.fixture
+def outline_hub(context_and_playwright, teardown_registry):
+    """
+    Factory that creates an outline based hub through the API and opens the hub page.
+    All created hubs are registered in the teardown registry.
+
+    Usage: outline_hub_data = outline_hub(page)
+
+    :return: function that accepts a page, user profile, hub name and description and returns hub ID and hub name
+    """
+    _, playwright = context_and_playwright
+
+    def create_outline_hub(page, user_profile="support", name=None, description=""):
+        user_token = get_cached_user_token(playwright, user_profile)
+        hub_data = create_hub(playwright, user_token, "create_outline_hub_payload", name, description)
+        teardown_registry.register_hub(hub_data["id"], user_token)
+        DocumentsInsightsPage.HubsPage(page).open_hub_page(hub_data["id"])
+        return hub_data
+
+    return create_outline_hub
+
+
+@pytest.fixture
+def value_hub(context_and_playwright, teardown_registry):
+    """
+    Factory that creates a value based hub through the API and opens the hub page.
+    All created hubs are registered in the teardown registry.
+
+    Usage: value_hub_data = value_hub(page) or value_hub(page, label_based=True)
+
+    :return: function that accepts a page, extractor type, user profile, hub name and description
+    and returns hub ID and hub name
+    """
+    _, playwright = context_and_playwright
+
+    def create_value_hub(page, label_based=False, user_profile="support", name=None, description=""):
+        user_token = get_cached_user_token(playwright, user_profile)
+        payload_key = "create_label_based_hub" if label_based else "create_key_value_hub"
+        hub_data = create_hub(playwright, user_token, payload_key, name, description)
+        teardown_registry.register_hub(hub_data["id"], user_token)
+        DocumentsInsightsPage.HubsPage(page).open_hub_page(hub_data["id"])
+        return hub_data
+
+    return create_value_hub
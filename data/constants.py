@@ -54,6 +54,7 @@ HUBS_PAGE_DELETE_POPUP_DESCRIPTION_PART_ONE = "Are you sure you want to delete h
 HUBS_PAGE_DELETE_POPUP_DESCRIPTION_PART_TWO = " and all related channels and automation?"
 HUBS_PAGE_RENAME_POPUP_TITLE = "Rename"
 HUBS_PAGE_TAGS_POPUP_TITLE = "Tags for hub"
+HUB_PAGE_URL = "/document-insights/hubs/{hub_id}"
 
 # Hub
 HUB_PAGE_OUTLINE_NO_FIELDS_TEXT = "There aren't any fields yet."
@@ -105,6 +106,22 @@ ERROR_TEXT_PASSWORD_SAME_WITH_CURRENT = "Your new password cannot be the same as
 SUCCESS_POPUP_TITLE = "Success!"
 
 
+# Test data
+# Name prefix of every resource created by the autotests through the API
+AUTOTEST_NAME_PREFIX = "autotest "
+# Names of resources left by the autotests, removed by the orphaned-resource sweeper.
+# Hubs that kept the default name of the hub wizard are swept only with --sweep-default-hub-names
+SWEEPER_NAME_PREFIXES = [
+    AUTOTEST_NAME_PREFIX,
+    "update outline hub",
+    "automation_for_import",
+    "create_web_automation_test",
+    "autotest_create_company",
+]
+# Resources younger than this amount of minutes are not swept, they can belong to a run in progress
+SWEEPER_MIN_AGE_MINUTES = 60
+
+
 # API
 PLEXTERA_STAGE_API_URL = "https://api.dev.plextera.com"
 OCRG_STAGE_API_URL = "https://ocrf.ocrgateway.com"
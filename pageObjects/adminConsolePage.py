@@ -1,8 +1,14 @@
+from functools import cached_property
+
 from playwright.sync_api import Page
+from pageObjects.lazyLocator import lazy
 
 
 class AdminConsolePage:
 
+    sidebar_internal_users_tab = lazy.locator('div.tab__left').filter(has_text="Internal Users")
+    sidebar_companies_tab = lazy.locator('div.tab__left').filter(has_text="Companies")
+
     def __init__(self, page: Page):
         """
         Initializes the Admin Console object with web element locators.
@@ -10,15 +16,21 @@ class AdminConsolePage:
         :param page: Playwright Page object representing the browser tab or frame.
         """
         self.page = page
-        self.sidebar_internal_users_tab = page.locator('div.tab__left').filter(has_text="Internal Users")
-        self.sidebar_companies_tab = page.locator('div.tab__left').filter(has_text="Companies")
-        self.companies_tab = self.CompaniesTab(page)
+
+    @cached_property
+    def companies_tab(self):
+        return self.CompaniesTab(self.page)
 
     def open_companies_tab(self):
         self.sidebar_companies_tab.click()
 
     class CompaniesTab:
 
+        invite_new_owner_button = lazy.get_by_role("button", name="Invite new owner")
+        filter_button = lazy.get_by_role("button", name="Filter")
+        table_row = lazy.locator('tbody tr')
+        company_row = lazy.locator('tbody div')
+
         def __init__(self, page: Page):
             """
             Companies tab component within the Admin Console page.
@@ -26,13 +38,18 @@ class AdminConsolePage:
             :param page: Playwright Page object.
             """
             self.page = page
-            self.invite_new_owner_button = page.get_by_role("button", name="Invite new owner")
-            self.filter_button = page.get_by_role("button", name="Filter")
-            self.filter_tab = AdminConsolePage.CompaniesTab.FilterTab(page)
-            self.invite_new_owner_user_popup = AdminConsolePage.CompaniesTab.InviteNewOwnerUserPopUp(page)
-            self.table_row = page.locator('tbody tr')
-            self.company_row = page.locator('tbody div')
-            self.success_popup = AdminConsolePage.CompaniesTab.SuccessPopUp(page)
+
+        @cached_property
+        def filter_tab(self):
+            return AdminConsolePage.CompaniesTab.FilterTab(self.page)
+
+        @cached_property
+        def invite_new_owner_user_popup(self):
+            return AdminConsolePage.CompaniesTab.InviteNewOwnerUserPopUp(self.page)
+
+        @cached_property
+        def success_popup(self):
+            return AdminConsolePage.CompaniesTab.SuccessPopUp(self.page)
 
         def navigate_to_company_page(self, company_name):
             from pageObjects.companyPage import CompanyPage
@@ -53,6 +70,9 @@ class AdminConsolePage:
 
         class FilterTab:
 
+            company_input = lazy.locator('input[name="organizationName"]')
+            apply_button = lazy.get_by_role("button", name="Apply")
+
             def __init__(self, page: Page):
                 """
                 Filter Tab component within the Companies tab.
@@ -60,11 +80,12 @@ class AdminConsolePage:
                 :param page: Playwright Page object.
                 """
                 self.page = page
-                self.company_input = page.locator('input[name="organizationName"]')
-                self.apply_button = page.get_by_role("button", name="Apply")
 
         class InviteNewOwnerUserPopUp:
 
+            email_input = lazy.get_by_role("textbox", name="Email address")
+            invite_button = lazy.get_by_role("button", name="Invite")
+
             def __init__(self, page: Page):
                 """
                 Popup Invite New Owner User component within the Companies tab.
@@ -72,11 +93,11 @@ class AdminConsolePage:
                 :param page: Playwright Page object.
                 """
                 self.page = page
-                self.email_input = page.get_by_role("textbox", name="Email address")
-                self.invite_button = page.get_by_role("button", name="Invite")
 
         class SuccessPopUp:
 
+            title = lazy.locator('div[role="presentation"] h3')
+
             def __init__(self, page: Page):
                 """
                 Popup Invite New Owner User component within the Companies tab.
@@ -84,4 +105,3 @@ class AdminConsolePage:
                 :param page: Playwright Page object.
                 """
                 self.page = page
-                self.title = page.locator('div[role="presentation"] h3')
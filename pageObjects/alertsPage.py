@@ -1,17 +1,19 @@
 from playwright.sync_api import Page
 from pageObjects.basePage import BasePage
+from pageObjects.lazyLocator import lazy
 
 class AlertsPage(BasePage):
 
+    page_title = lazy.locator('.page-content .header')
+    filter_button = lazy.get_by_role("button", name="Filter").filter(has_not_text="Reset Filters")
+    reset_filters_button = lazy.get_by_role("button", name="Reset Filters")
+    table = lazy.locator(".page-content table")
+    no_data_available_text = lazy.locator(".content p")
+
     def __init__(self, page: Page):
         """
         Initializes the Alers page object with web element locators.
 
         :param page: Playwright Page object representing the browser tab or frame.
         """
-        super().__init__(page)
-        self.page_title = page.locator('.page-content .header')
-        self.filter_button = page.get_by_role("button", name="Filter").filter(has_not_text="Reset Filters")
-        self.reset_filters_button = page.get_by_role("button", name="Reset Filters")
-        self.table = page.locator(".page-content table")
-        self.no_data_available_text = page.locator(".content p")
\ No newline at end of file
+        super().__init__(page)
\ No newline at end of file
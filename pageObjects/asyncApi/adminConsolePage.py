@@ -0,0 +1,91 @@
+from functools import cached_property
+
+from playwright.async_api import Page
+
+from pageObjects import adminConsolePage
+from pageObjects.lazyLocator import locators_of
+
+
+@locators_of(adminConsolePage.AdminConsolePage)
+class AdminConsolePage:
+    """
+    Async variant of pageObjects.adminConsolePage.AdminConsolePage, with the same locators.
+    """
+
+    def __init__(self, page: Page):
+        """
+        :param page: async Playwright Page object representing the browser tab or frame.
+        """
+        self.page = page
+
+    @cached_property
+    def companies_tab(self):
+        return self.CompaniesTab(self.page)
+
+    async def open_companies_tab(self):
+        await self.sidebar_companies_tab.click()
+
+    @locators_of(adminConsolePage.AdminConsolePage.CompaniesTab)
+    class CompaniesTab:
+
+        def __init__(self, page: Page):
+            """
+            Companies tab component within the Admin Console page.
+
+            :param page: async Playwright Page object.
+            """
+            self.page = page
+
+        @cached_property
+        def filter_tab(self):
+            return AdminConsolePage.CompaniesTab.FilterTab(self.page)
+
+        @cached_property
+        def invite_new_owner_user_popup(self):
+            return AdminConsolePage.CompaniesTab.InviteNewOwnerUserPopUp(self.page)
+
+        @cached_property
+        def success_popup(self):
+            return AdminConsolePage.CompaniesTab.SuccessPopUp(self.page)
+
+        async def send_invite_new_company_owner_form(self, email):
+            await self.invite_new_owner_button.click()
+            await self.invite_new_owner_user_popup.email_input.fill(email)
+            # Wait until request is finished and then continue
+            async with self.page.expect_response("**/api/account-service/auth-user/create-invite-owner") as resp_info:
+                await self.invite_new_owner_user_popup.invite_button.click()
+            response = await resp_info.value
+            assert response.ok
+
+        @locators_of(adminConsolePage.AdminConsolePage.CompaniesTab.FilterTab)
+        class FilterTab:
+
+            def __init__(self, page: Page):
+                """
+                Filter Tab component within the Companies tab.
+
+                :param page: async Playwright Page object.
+                """
+                self.page = page
+
+        @locators_of(adminConsolePage.AdminConsolePage.CompaniesTab.InviteNewOwnerUserPopUp)
+        class InviteNewOwnerUserPopUp:
+
+            def __init__(self, page: Page):
+                """
+                Popup Invite New Owner User component within the Companies tab.
+
+                :param page: async Playwright Page object.
+                """
+                self.page = page
+
+        @locators_of(adminConsolePage.AdminConsolePage.CompaniesTab.SuccessPopUp)
+        class SuccessPopUp:
+
+            def __init__(self, page: Page):
+                """
+                Success popup component within the Companies tab.
+
+                :param page: async Playwright Page object.
+                """
+                self.page = page
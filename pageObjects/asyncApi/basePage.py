@@ -0,0 +1,17 @@
+from functools import cached_property
+
+from pageObjects.asyncApi.components.popups import Popups
+from pageObjects.asyncApi.components.sidebar import Sidebar
+
+
+class BasePage:
+    def __init__(self, page):
+        self.page = page
+
+    @cached_property
+    def sidebar(self):
+        return Sidebar(self.page)
+
+    @cached_property
+    def popups(self):
+        return Popups(self.page)
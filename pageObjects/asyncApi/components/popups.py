@@ -0,0 +1,17 @@
+from playwright.async_api import Page
+
+from pageObjects.components import popups
+from pageObjects.lazyLocator import locators_of
+
+
+@locators_of(popups.Popups)
+class Popups:
+    """
+    Async variant of pageObjects.components.popups.Popups, with the same locators.
+    """
+
+    def __init__(self, page: Page):
+        """
+        :param page: async Playwright Page object representing the browser tab or frame.
+        """
+        self.page = page
@@ -0,0 +1,64 @@
+from playwright.async_api import Page
+
+from pageObjects.components import sidebar
+from pageObjects.lazyLocator import locators_of
+from utilities.route_table import async_expect_route_ready, get_route_url
+
+
+@locators_of(sidebar.Sidebar)
+class Sidebar:
+    """
+    Async variant of pageObjects.components.sidebar.Sidebar, with the same locators.
+    Pages without an async page object are opened with open_page.
+    """
+
+    def __init__(self, page: Page):
+        self.page = page
+
+    async def open_sidebar(self):
+        await self.sidebar_bottom_section.hover()
+        await self.toggle_button.click()
+
+    async def open_page(self, page_name, menu_point, fast=False):
+        """
+        Opens the page from the sidebar menu, or directly by its URL when fast is True,
+        and waits until the API calls the page needs (see utilities/route_table.py) are finished successfully.
+
+        :param page_name: A key of ROUTES
+        :param menu_point: Locator of the sidebar menu point of the page
+        :param fast: True to open the page by URL
+        """
+        if not fast:
+            await self.open_sidebar()
+        async with async_expect_route_ready(self.page, page_name):
+            if fast:
+                await self.page.goto(get_route_url(page_name))
+            else:
+                await menu_point.click()
+
+    async def logout(self):
+        await self.sidebar_bottom_section.hover()
+        await self.user_menu_dropdown.click()
+        await self.user_menu_log_out_point.click()
+
+    async def open_user_menu(self):
+        await self.sidebar_bottom_section.hover()
+        await self.toggle_button.click()
+        await self.user_menu_dropdown.click()
+
+    async def navigate_to_admin_console_page(self):
+        from pageObjects.asyncApi.adminConsolePage import AdminConsolePage
+
+        await self.open_user_menu()
+        await self.user_menu_admin_console_point.click()
+        admin_console_page = AdminConsolePage(self.page)
+
+        return admin_console_page
+
+    async def navigate_to_documents_insights_page(self, fast=False):
+        from pageObjects.asyncApi.documentsInsightsPage import DocumentsInsightsPage
+
+        await self.open_page("Documents Insights", self.document_insights_point, fast)
+        documents_insights_page = DocumentsInsightsPage(self.page)
+
+        return documents_insights_page
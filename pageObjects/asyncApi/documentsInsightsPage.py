@@ -0,0 +1,144 @@
+from functools import cached_property
+
+from playwright.async_api import Page
+
+from data.constants import DOMAIN_STAGE_URL, HUB_PAGE_URL
+from pageObjects import documentsInsightsPage
+from pageObjects.asyncApi.basePage import BasePage
+from pageObjects.lazyLocator import locators_of
+from utilities.route_table import async_expect_route_ready
+
+SyncDocumentsInsightsPage = documentsInsightsPage.DocumentsInsightsPage
+
+
+@locators_of(SyncDocumentsInsightsPage)
+class DocumentsInsightsPage(BasePage):
+    """
+    Async variant of pageObjects.documentsInsightsPage.DocumentsInsightsPage, with the same locators.
+    """
+
+    def __init__(self, page: Page):
+        """
+        :param page: async Playwright Page object representing the browser tab or frame.
+        """
+        super().__init__(page)
+
+    @cached_property
+    def hubs_page(self):
+        return self.HubsPage(self.page)
+
+    @locators_of(SyncDocumentsInsightsPage.HubsPage)
+    class HubsPage(BasePage):
+
+        def __init__(self, page: Page):
+            """
+            :param page: async Playwright Page object representing the browser tab or frame.
+            """
+            super().__init__(page)
+
+        @cached_property
+        def hub_page(self):
+            return DocumentsInsightsPage.HubsPage.HubPage(self.page)
+
+        async def create_outline_based_hub(self, all_field_populated: bool = False):
+            """
+            Creates an outline based hub and returns hub id and name
+            If received value is 'true', then all fields will be populated, else only required fields will be populated.
+
+            :param all_field_populated: Can be True or False. Default value is False
+            :return: hub ID and hub name
+            """
+            await self.create_a_hub_button.click()
+            await self.popups.create_hub_outline_based_type_card.click()
+            # Wait until after the click on the Next button the '/api/hubs/default-name' request will be finished successfully
+            async with self.page.expect_response("**/api/hubs/default-name") as resp_info:
+                await self.popups.next_button.click()
+            assert (await resp_info.value).ok
+            if all_field_populated:
+                await self.popups.create_hub_description_input.fill("description")
+            async with self.page.expect_response("**/api/hubs/create") as create_resp_info, \
+                    self.page.expect_response("**/api/hubs/**?include=short_outline,channels") as data_resp:
+                await self.popups.next_button.click()
+            create_response = await create_resp_info.value
+            assert create_response.ok
+            assert (await data_resp.value).ok
+            created_hub = await create_response.json()
+            return {"id": created_hub["id"], "name": created_hub["name"]}
+
+        async def create_value_based_hub(self, all_field_populated: bool = False, extractor_type: bool = False):
+            """
+            Creates a value based hub and returns hub id and name
+            If received value is 'true', then all fields will be populated, else only required fields will be populated.
+
+            :param all_field_populated: Can be True or False. Default value is False
+            :param extractor_type: Can be True or False. Default value is False
+            :return: hub ID and hub name
+            """
+            await self.create_a_hub_button.click()
+            await self.popups.create_hub_value_based_type_card.click()
+            # Wait until after the click on the Next button the '/api/hubs/default-name' request will be finished successfully
+            async with self.page.expect_response("**/api/hubs/default-name") as resp_info:
+                await self.popups.next_button.click()
+            assert (await resp_info.value).ok
+            if all_field_populated:
+                await self.popups.create_hub_description_input.fill("description")
+                await self.popups.create_hub_additional_options_checkbox.click()
+                if extractor_type:
+                    await self.popups.create_hub_label_based_extractor_radiobutton.click()
+            async with self.page.expect_response("**/api/hubs/create") as create_resp_info, \
+                    self.page.expect_response("**/api/hubs/**?include=short_outline,channels") as data_resp, \
+                    self.page.expect_response("**/api/classification-classes/**") as smth_resp:
+                await self.popups.next_button.click()
+            create_response = await create_resp_info.value
+            assert create_response.ok
+            assert (await data_resp.value).ok
+            assert (await smth_resp.value).ok
+            created_hub = await create_response.json()
+            return {"id": created_hub["id"], "name": created_hub["name"]}
+
+        async def open_hub_page(self, hub_id):
+            """
+            Opens the hub page by its URL and waits until the hub data is loaded
+
+            :param hub_id: Hub ID
+            :return: Instance of HubPage object
+            """
+            async with self.page.expect_response(f"**/api/hubs/{hub_id}?include=**") as resp_info:
+                await self.page.goto(DOMAIN_STAGE_URL + HUB_PAGE_URL.format(hub_id=hub_id))
+            assert (await resp_info.value).ok
+            return self.hub_page
+
+        @locators_of(SyncDocumentsInsightsPage.HubsPage.HubPage)
+        class HubPage(BasePage):
+
+            def __init__(self, page: Page):
+                """
+                :param page: async Playwright Page object representing the browser tab or frame.
+                """
+                super().__init__(page)
+
+            async def navigate_to_hubs_page(self):
+                """
+                Goes back to the Hubs page with the button in the hub header and waits until the hubs are loaded
+
+                :return: Instance of HubsPage object
+                """
+                async with async_expect_route_ready(self.page, "Hubs"):
+                    await self.navigate_to_hubs_page_button.click()
+                return DocumentsInsightsPage.HubsPage(self.page)
+
+            async def upload_file(self, document):
+                """
+                Uploads a pdf file
+
+                :param document: Document name with its type, example 'document.pdf'
+                """
+                await self.file_input.set_input_files("data/" + document)
+
+            async def click_the_edit_button_on_the_field_label(self, field_name):
+                """
+                Click the Edit button on the field label
+
+                :param field_name: Name of the field
+                """
+                await self.page.locator(f"//span[contains(@id, 'hubs_edit-data-point_{field_name}')]").click()
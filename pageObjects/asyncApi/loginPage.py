@@ -0,0 +1,33 @@
+from playwright.async_api import Page
+
+from pageObjects import loginPage
+from pageObjects.asyncApi.basePage import BasePage
+from pageObjects.lazyLocator import locators_of
+
+
+@locators_of(loginPage.LoginPage)
+class LoginPage:
+    """
+    Async variant of pageObjects.loginPage.LoginPage, with the same locators.
+    """
+
+    def __init__(self, page: Page):
+        """
+        :param page: async Playwright Page object representing the browser tab or frame.
+        """
+        self.page = page
+
+    async def login_with_user_credentials(self, user_email, user_password):
+        """
+        Performs login action using the provided user credentials.
+
+        :param user_email: Email address to input in the Email address field in the login form
+        :param user_password: Password to input in the Password field in the login form
+        :return: Instance of BasePage object of the Home page, assuming login is successful
+        """
+        await self.email_input.fill(user_email)
+        await self.password_input.fill(user_password)
+        await self.login_button.click()
+
+        home_page = BasePage(self.page)
+        return home_page
@@ -1,8 +1,16 @@
+from functools import cached_property
+
 from pageObjects.components.popups import Popups
 from pageObjects.components.sidebar import Sidebar
 
 class BasePage:
     def __init__(self, page):
         self.page = page
-        self.sidebar = Sidebar(page)
-        self.popups = Popups(page)
\ No newline at end of file
+
+    @cached_property
+    def sidebar(self):
+        return Sidebar(self.page)
+
+    @cached_property
+    def popups(self):
+        return Popups(self.page)
\ No newline at end of file
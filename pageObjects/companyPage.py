@@ -1,10 +1,16 @@
+from functools import cached_property
+
 from playwright.sync_api import Page
 
 from pageObjects.basePage import BasePage
+from pageObjects.lazyLocator import lazy
 
 
 class CompanyPage(BasePage):
 
+    sidebar_add_ons = lazy.locator('div.tab__left').filter(has_text="Add-ons")
+    invite_company_user_button = lazy.locator(".tab__content-header .link")
+
     def __init__(self, page: Page):
         """
         Filter Tab component within the Companies tab.
@@ -12,9 +18,10 @@ class CompanyPage(BasePage):
         :param page: Playwright Page object.
         """
         super().__init__(page)
-        self.sidebar_add_ons = page.locator('div.tab__left').filter(has_text="Add-ons")
-        self.add_ons_tab = self.AddOns(page)
-        self.invite_company_user_button = page.locator(".tab__content-header .link")
+
+    @cached_property
+    def add_ons_tab(self):
+        return self.AddOns(self.page)
 
     def send_invite_company_user_form(self, user_email):
         self.popups.invite_company_user_email_address_input.fill(user_email)
@@ -34,8 +41,15 @@ class CompanyPage(BasePage):
         response = resp_info.value
         assert response.ok
 
-
     class AddOns:
+        web_automation_checkbox = lazy.locator('label span').filter(has_text="Web Automations")
+        documents_insights_checkbox = lazy.locator('label span').filter(has_text="Document Insights")
+        sides_checkbox = lazy.locator('label span').filter(has_text="SIDES")
+        datastores_checkbox = lazy.locator('label span').filter(has_text="Datastores")
+        forms_checkbox = lazy.locator('label span').filter(has_text="Forms")
+        save_button = lazy.get_by_role("button", name="Save")
+        popup_save_button = lazy.locator('div[width = "720"][tabindex = "-1"] button').filter(has_text="Save")
+
         def __init__(self, page: Page):
             """
             Filter Tab component within the Companies tab.
@@ -43,12 +57,5 @@ class CompanyPage(BasePage):
             :param page: Playwright Page object.
             """
             self.page = page
-            self.web_automation_checkbox = page.locator('label span').filter(has_text="Web Automations")
-            self.documents_insights_checkbox = page.locator('label span').filter(has_text="Document Insights")
-            self.sides_checkbox = page.locator('label span').filter(has_text="SIDES")
-            self.datastores_checkbox = page.locator('label span').filter(has_text="Datastores")
-            self.forms_checkbox = page.locator('label span').filter(has_text="Forms")
-            self.save_button = page.get_by_role("button", name="Save")
-            self.popup_save_button = page.locator('div[width = "720"][tabindex = "-1"] button').filter(has_text="Save")
 
 
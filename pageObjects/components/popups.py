@@ -1,4 +1,5 @@
 from playwright.sync_api import Page
+from pageObjects.lazyLocator import lazy
 
 
 class Popups:
@@ -8,51 +9,52 @@ class Popups:
     This class provides access to common popup elements and actions
     that can appear across different page
     """
+    # Buttons
+    cancel_button = lazy.get_by_role("button", name="Cancel")
+    delete_button = lazy.get_by_role("button", name="Delete")
+    disable_button = lazy.get_by_role("button", name="Disable")
+    save_button = lazy.get_by_role("button", name="Save")
+    next_button = lazy.get_by_role("button", name="Next")
+    tags_for_hub_add_another_tag_button = lazy.get_by_role("button", name="+ Add another tag")
+    import_automation_import_button = lazy.get_by_role("button", name="Import")
+    import_automation_remove_file = lazy.get_by_role("button", name=" Remove file ")
+    invite_button = lazy.get_by_role("button", name="Invite")
+    # Inputs
+    rename_input = lazy.locator('input[placeholder="Hub name"]')
+    tags_for_hub_key_input = lazy.locator(".key")
+    tags_for_hub_value_input = lazy.locator(".value")
+    create_hub_description_input = lazy.get_by_role("textbox", name="Enter description")
+    create_automation_name_input = lazy.locator("//input[contains(@class, 'this-input')]")
+    invite_company_user_email_address_input = lazy.locator('[name="email"]')
+    invite_company_user_role_selector = lazy.locator(".MuiSelect-select:has(.placeholder)")
+    invite_company_user_role_selector_list_administrator_point = lazy.locator("#\:r2ec\: li").filter(has_text="Administrator")
+    invite_company_user_role_selector_list_user_point = lazy.locator("#\:r2ec\: li").filter(has_text="User")
+    # Checkboxes
+    create_hub_additional_options_checkbox = lazy.locator('input[type="checkbox"]')
+    # Radiobuttons
+    create_hub_key_value_extractor_radiobutton = lazy.locator(
+        "//label[contains(@class, 'radio-button-label')]").filter(has_text="Key-value Extractor")
+    create_hub_label_based_extractor_radiobutton = lazy.locator(
+        "//label[contains(@class, 'radio-button-label')]").filter(has_text="Label-based Extractor")
+    # Lists
+    verification_settings_list_item = lazy.locator(
+        "//div[contains(@class, 'sub-item')]//label[contains(@class, 'radio-button-label')]")
+    verification_settings_number_format_list_item = lazy.locator(
+        "//div[contains(@class, 'sub-item')]//label[contains(@class, 'radio-button-label')]").filter(
+        has_text="Number format")
+    # Cards
+    create_hub_outline_based_type_card = lazy.locator('div[class="menu"] div[class="menu-item"]:nth-child(1)')
+    create_hub_value_based_type_card = lazy.locator('div[class="menu"] div[class="menu-item"]:nth-child(2)')
+    # Elements
+    body = lazy.locator('div[tabindex="-1"]')
+    view_details_content_section = lazy.locator("#view-details")
+
     def __init__(self, page: Page):
         """
         Initializes the popups object with web element locators.
         :param page: Playwright Page object representing the browser tab or frame.
         """
         self.page = page
-        # Buttons
-        self.cancel_button = page.get_by_role("button", name="Cancel")
-        self.delete_button = page.get_by_role("button", name="Delete")
-        self.disable_button = page.get_by_role("button", name="Disable")
-        self.save_button = page.get_by_role("button", name="Save")
-        self.next_button = page.get_by_role("button", name="Next")
-        self.tags_for_hub_add_another_tag_button = page.get_by_role("button", name="+ Add another tag")
-        self.import_automation_import_button = page.get_by_role("button", name="Import")
-        self.import_automation_remove_file = page.get_by_role("button", name=" Remove file ")
-        self.invite_button = page.get_by_role("button", name="Invite")
-        # Inputs
-        self.rename_input = page.locator('input[placeholder="Hub name"]')
-        self.tags_for_hub_key_input = page.locator(".key")
-        self.tags_for_hub_value_input = page.locator(".value")
-        self.create_hub_description_input = page.get_by_role("textbox", name="Enter description")
-        self.create_automation_name_input = page.locator("//input[contains(@class, 'this-input')]")
-        self.invite_company_user_email_address_input = page.locator('[name="email"]')
-        self.invite_company_user_role_selector = page.locator(".MuiSelect-select:has(.placeholder)")
-        self.invite_company_user_role_selector_list_administrator_point = page.locator("#\:r2ec\: li").filter(has_text="Administrator")
-        self.invite_company_user_role_selector_list_user_point = page.locator("#\:r2ec\: li").filter(has_text="User")
-        # Checkboxes
-        self.create_hub_additional_options_checkbox = page.locator('input[type="checkbox"]')
-        # Radiobuttons
-        self.create_hub_key_value_extractor_radiobutton = page.locator(
-            "//label[contains(@class, 'radio-button-label')]").filter(has_text="Key-value Extractor")
-        self.create_hub_label_based_extractor_radiobutton = page.locator(
-            "//label[contains(@class, 'radio-button-label')]").filter(has_text="Label-based Extractor")
-        # Lists
-        self.verification_settings_list_item = page.locator(
-            "//div[contains(@class, 'sub-item')]//label[contains(@class, 'radio-button-label')]")
-        self.verification_settings_number_format_list_item = page.locator(
-            "//div[contains(@class, 'sub-item')]//label[contains(@class, 'radio-button-label')]").filter(
-            has_text="Number format")
-        # Cards
-        self.create_hub_outline_based_type_card = page.locator('div[class="menu"] div[class="menu-item"]:nth-child(1)')
-        self.create_hub_value_based_type_card = page.locator('div[class="menu"] div[class="menu-item"]:nth-child(2)')
-        # Elements
-        self.body = page.locator('div[tabindex="-1"]')
-        self.view_details_content_section = page.locator("#view-details")
 
 
 
@@ -1,25 +1,65 @@
+from contextlib import contextmanager
+
 from playwright.sync_api import Page
 
+from pageObjects.lazyLocator import lazy
+from utilities.perf_budgets import within_budget
+from utilities.route_table import expect_route_ready, get_route_url
+from utilities.web_vitals import measure_navigation
+
 
 class Sidebar:
+    company_selector = lazy.locator('.organization')
+    home_point = lazy.locator('li span').filter(has_text="Home")
+    workflows_point = lazy.locator('li span').filter(has_text="Workflows")
+    web_automation_point = lazy.locator('li span').filter(has_text="Web Automations")
+    document_insights_point = lazy.locator('li span').filter(has_text="Document Insights")
+    sides_point = lazy.locator('li span').filter(has_text="SIDES")
+    datastores_point = lazy.locator('li span').filter(has_text="Datastores")
+    forms_point = lazy.locator('li span').filter(has_text="Forms")
+    sidebar_bottom_section = lazy.locator('.bottom-section')
+    user_menu_dropdown = lazy.locator('.bottom-section .name')
+    user_menu_settings_point = lazy.locator('span').filter(has_text="Settings")
+    user_menu_admin_console_point = lazy.locator('span').filter(has_text="Admin Console")
+    user_menu_log_out_point = lazy.locator('span').filter(has_text="Log out")
+    toggle_button = lazy.locator('button[aria-label="toggle"]')
+    logo = lazy.locator('.logo')
+    alerts_point = lazy.locator('li span').filter(has_text="Alerts")
+
     def __init__(self, page: Page):
         self.page = page
-        self.company_selector = page.locator('.organization')
-        self.home_point = page.locator('li span').filter(has_text="Home")
-        self.workflows_point = page.locator('li span').filter(has_text="Workflows")
-        self.web_automation_point = page.locator('li span').filter(has_text="Web Automations")
-        self.document_insights_point = page.locator('li span').filter(has_text="Document Insights")
-        self.sides_point = page.locator('li span').filter(has_text="SIDES")
-        self.datastores_point = page.locator('li span').filter(has_text="Datastores")
-        self.forms_point = page.locator('li span').filter(has_text="Forms")
-        self.sidebar_bottom_section = page.locator('.bottom-section')
-        self.user_menu_dropdown = page.locator('.bottom-section .name')
-        self.user_menu_settings_point = page.locator('span').filter(has_text="Settings")
-        self.user_menu_admin_console_point = page.locator('span').filter(has_text="Admin Console")
-        self.user_menu_log_out_point = page.locator('span').filter(has_text="Log out")
-        self.toggle_button = page.locator('button[aria-label="toggle"]')
-        self.logo = page.locator('.logo')
-        self.alerts_point = page.locator('li span').filter(has_text="Alerts")
+
+    @contextmanager
+    def measure_transition(self, page_name):
+        """
+        Measures the transition to the given page started in the block and checks it against its performance budget
+
+        :param page_name: Name of the target page, for example 'Workflows'
+        """
+        with measure_navigation(self.page, page_name), within_budget(self.page, page_name):
+            yield
+
+    def open_sidebar(self):
+        self.sidebar_bottom_section.hover()
+        self.toggle_button.click()
+
+    def open_page(self, page_name, menu_point, fast=False):
+        """
+        Opens the page from the sidebar menu, or directly by its URL when fast is True,
+        and waits until the API calls the page needs (see utilities/route_table.py) are finished successfully.
+        Fast navigation skips the sidebar, use it in tests that are not about the sidebar.
+
+        :param page_name: A key of ROUTES
+        :param menu_point: Locator of the sidebar menu point of the page
+        :param fast: True to open the page by URL
+        """
+        if not fast:
+            self.open_sidebar()
+        with self.measure_transition(page_name), expect_route_ready(self.page, page_name):
+            if fast:
+                self.page.goto(get_route_url(page_name))
+            else:
+                menu_point.click()
 
     def logout(self):
         self.sidebar_bottom_section.hover()
@@ -40,45 +80,26 @@ class Sidebar:
 
         return admin_console_page
 
-    def navigate_to_documents_insights_page(self):
+    def navigate_to_documents_insights_page(self, fast=False):
         from pageObjects.documentsInsightsPage import DocumentsInsightsPage
 
-        self.sidebar_bottom_section.hover()
-        self.toggle_button.click()
-        # Wait until request is finished and then continue
-        with self.page.expect_response("**/api/ocr/history?status=done&size=10&searchBy=NAME") as resp_info:
-            self.document_insights_point.click()
-        response = resp_info.value
-        assert response.ok
+        self.open_page("Documents Insights", self.document_insights_point, fast)
         documents_insights_page = DocumentsInsightsPage(self.page)
 
         return documents_insights_page
 
-    def navigate_to_web_automations_page(self):
+    def navigate_to_web_automations_page(self, fast=False):
         from pageObjects.webAutomationsPage import WebAutomationsPage
 
-        self.sidebar_bottom_section.hover()
-        self.toggle_button.click()
-        # Wait until request is finished and then continue
-        with self.page.expect_response("**/api/sbb/automation/list?page=0&size=25&sortDirection=DESC&sortBy=createdOn") as resp_info, \
-                self.page.expect_response("**/api/sbb/automation/**") as resp2_info:
-            self.web_automation_point.click()
-        assert resp_info.value.ok
-        assert resp2_info.value.ok
+        self.open_page("Web Automations", self.web_automation_point, fast)
         web_automations_page = WebAutomationsPage(self.page)
 
         return web_automations_page
 
-    def navigate_to_workflows_page(self):
+    def navigate_to_workflows_page(self, fast=False):
         from pageObjects.workflowsPage import WorkflowsPage
 
-        self.sidebar_bottom_section.hover()
-        self.toggle_button.click()
-        # Wait until request is finished and then continue
-        with self.page.expect_response(
-                "**/api/studio/workflow/list") as resp_info:
-            self.workflows_point.click()
-        assert resp_info.value.ok
+        self.open_page("Workflows", self.workflows_point, fast)
         workflows_page = WorkflowsPage(self.page)
 
         return workflows_page
@@ -86,58 +107,31 @@ class Sidebar:
     def navigate_to_sides_page(self):
         from pageObjects.sidesPage import SidesPage
 
-        self.sidebar_bottom_section.hover()
-        self.toggle_button.click()
-        # Wait until request is finished and then continue
-        with self.page.expect_response(
-                "**/api/sides/schedules") as resp_info:
-            self.sides_point.click()
-        assert resp_info.value.ok
+        self.open_page("SIDES", self.sides_point)
         sides_page = SidesPage(self.page)
 
         return sides_page
 
-
     def navigate_to_datastores_page(self):
         from pageObjects.datastoresPage import DatastoresPage
 
-        self.sidebar_bottom_section.hover()
-        self.toggle_button.click()
-        # Wait until request is finished and then continue
-        with self.page.expect_response(
-                "**/api/studio/datasource/configuration?page=0&size=10") as resp_info:
-            self.datastores_point.click()
-        assert resp_info.value.ok
+        self.open_page("Datastores", self.datastores_point)
         datastores_page = DatastoresPage(self.page)
 
         return datastores_page
 
-
-    def navigate_to_forms_page(self):
+    def navigate_to_forms_page(self, fast=False):
         from pageObjects.formsPage import FormsPage
 
-        self.sidebar_bottom_section.hover()
-        self.toggle_button.click()
-        # Wait until request is finished and then continue
-        with self.page.expect_response(
-                "**/api/studio/forms?page=0&size=10") as resp_info:
-            self.forms_point.click()
-        assert resp_info.value.ok
+        self.open_page("Forms", self.forms_point, fast)
         forms_page = FormsPage(self.page)
 
         return forms_page
 
-
-    def navigate_to_alerts_page(self):
+    def navigate_to_alerts_page(self, fast=False):
         from pageObjects.alertsPage import AlertsPage
 
-        self.sidebar_bottom_section.hover()
-        self.toggle_button.click()
-        # Wait until request is finished and then continue
-        with self.page.expect_response(
-                "**/api/issues-service/issues?page=0&size=10&sortBy=severity&sortDirection=DESC&status=OPEN") as resp_info:
-            self.alerts_point.click()
-        assert resp_info.value.ok
+        self.open_page("Alerts", self.alerts_point, fast)
         alerts_page = AlertsPage(self.page)
 
-        return alerts_page
\ No newline at end of file
+        return alerts_page
@@ -1,9 +1,15 @@
 from playwright.sync_api import Page
 from pageObjects.basePage import BasePage
+from pageObjects.lazyLocator import lazy
 
 
 class DatastoresPage(BasePage):
 
+    page_title = lazy.locator('.page-content .header')
+    add_new_button = lazy.get_by_role("button", name="Add New")
+    table = lazy.locator(".table-wrapper table")
+    no_data_available_text = lazy.locator(".table-wrapper .content")
+
     def __init__(self, page: Page):
         """
         Initializes the Datastores page object with web element locators.
@@ -11,9 +17,5 @@ class DatastoresPage(BasePage):
         :param page: Playwright Page object representing the browser tab or frame.
         """
         super().__init__(page)
-        self.page_title = page.locator('.page-content .header')
-        self.add_new_button = page.get_by_role("button", name="Add New")
-        self.table = page.locator(".table-wrapper table")
-        self.no_data_available_text = page.locator(".table-wrapper .content")
 
 
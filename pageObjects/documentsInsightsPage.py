@@ -1,13 +1,25 @@
+from functools import cached_property
+
 from playwright.sync_api import Page
 
-from data.constants import DOCUMENTS_INSIGHTS_PROCESSED_TAB_TITLE, DOCUMENTS_INSIGHTS_PENDING_TAB_TITLE, \
+from data.constants import DOMAIN_STAGE_URL, HUB_PAGE_URL, DOCUMENTS_INSIGHTS_PROCESSED_TAB_TITLE, DOCUMENTS_INSIGHTS_PENDING_TAB_TITLE, \
     DOCUMENTS_INSIGHTS_QUEUED_TAB_TITLE, DOCUMENTS_INSIGHTS_REJECTED_TITLE, HUB_PAGE_VALUE_SINGLE_FIELD_NAME, \
     HUB_PAGE_VALUE_GROUP_FIELD_NAME, HUB_PAGE_VALUE_LIST_FIELD_NAME, HUB_PAGE_VALUE_NESTED_FIELD_NAME
 from pageObjects.basePage import BasePage
+from pageObjects.lazyLocator import lazy
+from utilities.route_table import expect_route_ready
 
 
 class DocumentsInsightsPage(BasePage):
 
+    hubs_button = lazy.get_by_role("button", name="Hubs")
+    page_title = lazy.locator('.header__content h1')
+    reports_button = lazy.get_by_role("button", name="Reports")
+    processed_tab = lazy.get_by_text(DOCUMENTS_INSIGHTS_PROCESSED_TAB_TITLE).first
+    pending_tab = lazy.get_by_text(DOCUMENTS_INSIGHTS_PENDING_TAB_TITLE)
+    queued_tab = lazy.get_by_text(DOCUMENTS_INSIGHTS_QUEUED_TAB_TITLE)
+    rejected_tab = lazy.get_by_text(DOCUMENTS_INSIGHTS_REJECTED_TITLE)
+
     def __init__(self, page: Page):
         """
         Initializes the Hubs page object with web element locators.
@@ -15,17 +27,28 @@ class DocumentsInsightsPage(BasePage):
         :param page: Playwright Page object representing the browser tab or frame.
         """
         super().__init__(page)
-        self.hubs_button = page.get_by_role("button", name="Hubs")
-        self.page_title = page.locator('.header__content h1')
-        self.reports_button = page.get_by_role("button", name="Reports")
-        self.processed_tab = page.get_by_text(DOCUMENTS_INSIGHTS_PROCESSED_TAB_TITLE).first
-        self.pending_tab = page.get_by_text(DOCUMENTS_INSIGHTS_PENDING_TAB_TITLE)
-        self.queued_tab = page.get_by_text(DOCUMENTS_INSIGHTS_QUEUED_TAB_TITLE)
-        self.rejected_tab = page.get_by_text(DOCUMENTS_INSIGHTS_REJECTED_TITLE)
-        self.hubs_page = self.HubsPage(page)
+
+    @cached_property
+    def hubs_page(self):
+        return self.HubsPage(self.page)
 
     class HubsPage(BasePage):
 
+        page_title = lazy.locator('div[class="page-content"] span[class="name"]')
+        create_a_hub_button = lazy.get_by_role("button", name="Create A Hub")
+        loading_popup_title = lazy.locator('.loading')
+        loading_popup_description = lazy.locator('.text')
+        empty_state_text = lazy.locator("#scroll div:nth-child(2) span")
+        hub_card = lazy.locator("//div[contains(@class, 'hub-item')]")
+        hub_card_meatball_menu = lazy.locator("//div[contains(@class, 'open-hub-actions')]")
+        hub_card_meatball_menu_delete_point = lazy.locator("//div[contains(@class, 'remove-hub')]")
+        hub_card_switch = lazy.locator("//div[contains(@class, 'toggle-enable')]")
+        hub_card_meatball_menu_view_details_point = lazy.locator("//div[contains(@id, 'hubs_menu-view-details')]")
+        hub_card_meatball_menu_rename_point = lazy.locator("//div[contains(@class, 'rename-hub')]")
+        hub_card_title = lazy.locator("(//div[contains(@class, 'hub-item')] //span[@title])[2]")
+        hub_card_meatball_menu_tags_point = lazy.locator("//div[contains(@id, 'hubs_menu-tags')]")
+        hub_card_description = lazy.locator('//div[contains(@id,"clamped-content-description-for-")]')
+
         def __init__(self, page: Page):
             """
             Initializes the Hubs page object with web element locators.
@@ -33,21 +56,10 @@ class DocumentsInsightsPage(BasePage):
             :param page: Playwright Page object representing the browser tab or frame.
             """
             super().__init__(page)
-            self.page_title = page.locator('div[class="page-content"] span[class="name"]')
-            self.create_a_hub_button = page.get_by_role("button", name="Create A Hub")
-            self.loading_popup_title = page.locator('.loading')
-            self.loading_popup_description = page.locator('.text')
-            self.hub_page = DocumentsInsightsPage.HubsPage.HubPage(page)
-            self.empty_state_text = page.locator("#scroll div:nth-child(2) span")
-            self.hub_card = page.locator("//div[contains(@class, 'hub-item')]")
-            self.hub_card_meatball_menu = page.locator("//div[contains(@class, 'open-hub-actions')]")
-            self.hub_card_meatball_menu_delete_point = page.locator("//div[contains(@class, 'remove-hub')]")
-            self.hub_card_switch = page.locator("//div[contains(@class, 'toggle-enable')]")
-            self.hub_card_meatball_menu_view_details_point = page.locator("//div[contains(@id, 'hubs_menu-view-details')]")
-            self.hub_card_meatball_menu_rename_point = page.locator("//div[contains(@class, 'rename-hub')]")
-            self.hub_card_title = page.locator("(//div[contains(@class, 'hub-item')] //span[@title])[2]")
-            self.hub_card_meatball_menu_tags_point = page.locator("//div[contains(@id, 'hubs_menu-tags')]")
-            self.hub_card_description = page.locator('//div[contains(@id,"clamped-content-description-for-")]')
+
+        @cached_property
+        def hub_page(self):
+            return DocumentsInsightsPage.HubsPage.HubPage(self.page)
 
         def create_outline_based_hub(self, all_field_populated: bool = False):
             """
@@ -72,7 +84,8 @@ class DocumentsInsightsPage(BasePage):
             if all_field_populated:
                 self.popups.create_hub_description_input.fill("description")
             # Wait until after the click on the Next button the '/api/hubs/default-name' request will be finished successfully
-            with self.page.expect_response("**/api/hubs/create") as create_resp_info, \
+            with self.sidebar.measure_transition("New Outline Hub"), \
+                    self.page.expect_response("**/api/hubs/create") as create_resp_info, \
                     self.page.expect_response("**/api/hubs/**?include=short_outline,channels") as data_resp:
                 self.popups.next_button.click()
             assert create_resp_info.value.ok
@@ -107,7 +120,8 @@ class DocumentsInsightsPage(BasePage):
                 if extractor_type:
                     self.popups.create_hub_label_based_extractor_radiobutton.click()
             # Wait until after the click on the Next button the '/api/hubs/default-name' request will be finished successfully
-            with self.page.expect_response("**/api/hubs/create") as create_resp_info, \
+            with self.sidebar.measure_transition("New Value Hub"), \
+                    self.page.expect_response("**/api/hubs/create") as create_resp_info, \
                     self.page.expect_response("**/api/hubs/**?include=short_outline,channels") as data_resp, \
                     self.page.expect_response("**/api/classification-classes/**") as smth_resp:
                 self.popups.next_button.click()
@@ -118,8 +132,83 @@ class DocumentsInsightsPage(BasePage):
             value_hub["name"] = create_resp_info.value.json()["name"]
             return value_hub
 
+        def open_hub_page(self, hub_id):
+            """
+            Opens the hub page by its URL and waits until the hub data is loaded
+
+            :param hub_id: Hub ID
+            :return: Instance of HubPage object
+            """
+            with self.page.expect_response(f"**/api/hubs/{hub_id}?include=**") as resp_info:
+                self.page.goto(DOMAIN_STAGE_URL + HUB_PAGE_URL.format(hub_id=hub_id))
+            assert resp_info.value.ok
+            return self.hub_page
+
         class HubPage(BasePage):
 
+            # General elements
+            gear_button = lazy.locator('.tab-header span[kind="greyOutlined"]')
+            edit_hub_name = lazy.locator('.page__header-left span[kind="greyOutlined"]')
+            save_button = lazy.get_by_role("button", name="Save")
+            single_radiobutton = lazy.locator(".radio-button-label .text").filter(has_text="Single")
+            group_radiobutton = lazy.locator(".radio-button-label .text").filter(has_text="Group")
+            list_radiobutton = lazy.locator(".radio-button-label .text").filter(has_text="List")
+            arrow_button = lazy.locator('.chevron.undefined')
+            nested_group_label = lazy.locator(".MuiTreeItem-group.MuiCollapse-entered")
+            delete_button = lazy.get_by_role("button", name="Delete")
+            delete_group_type_field_icon = lazy.locator(
+                '(//div[@class="MuiTreeItem-content"]//span[@kind="greyOutlined"])[2]')
+            file_input = lazy.locator("input[type='file']")
+            navigate_to_hubs_page_button = lazy.locator(".page__header-left div span")
+            # Outline based hub
+            add_new_field_button = lazy.get_by_role("button", name="+ Add new field")
+            drag_and_drop_files_button = lazy.locator(".direct-upload-dropzone")
+            browse_files_button = lazy.locator(".open-upload")
+            single_field_label_title = lazy.locator(".name_box")
+            list_group_field_label_title = lazy.locator('ul[role="tree"]')
+            nested_add_new_field = lazy.locator('//*[@id="scroll"]/div/div[2]/div[2]/div/div[1]/div/div/div/div[2]/div/div/div/ul/div/li/div/div[2]/div/div[2]/span[3]')
+            arrow_button = lazy.locator('.chevron.undefined')
+            nested_group_label = lazy.locator(".MuiTreeItem-group.MuiCollapse-entered")
+            delete_single_type_field_icon_outline = lazy.locator('(//div[@class="rigth_box"]//span[@kind="greyOutlined"])[2]')
+            meatball_menu = lazy.locator(".open-hub-actions")
+            no_fields_text = lazy.locator(".field_text")
+            fields_list_text_title = lazy.locator(".tab-content .name")
+            outline_template_name = lazy.locator(".box_name")
+            outline_template_switch = lazy.locator("//div[contains(@class, 'toggle-enable')]")
+            outline_template_meatball_menu = lazy.locator("//div[contains(@class, 'open-hub-actions')]")
+            outline_template_footer = lazy.locator(".box_container footer")
+            outline_template_meatball_menu_rename_point = lazy.locator("//div[contains(@class, 'rename-hub')]")
+            rename_popup_input = lazy.locator('input[placeholder="Outline name"]')
+            rename_popup_cancel_button = lazy.get_by_role("button", name="Cancel")
+            outline_template_meatball_menu_delete_point = lazy.locator("//div[contains(@class, 'remove-hub')]")
+            outline_template_card = lazy.locator(".box_container")
+            # Value based hub
+            upload_documents_button = lazy.get_by_role("button", name="Upload Documents")
+            add_data_points_button = lazy.get_by_role("button", name="ADD DATA POINTS")
+            import_data_points_in_json_format_button = lazy.get_by_role("button", name="import data points in json format")
+            data_points_tab = lazy.locator("[id*='hubs_data-points-tab']")
+            dictionary_tab = lazy.locator("[id*='hubs_synonyms-tab']")
+            nested_value_add_new_field = lazy.locator('//*[@id="scroll"]/div/div[2]/div[2]/div/div/div/ul/div/div/ul/li/div/div[2]/div/div[2]/span[3]')
+            classification_tab = lazy.locator("[id*='hubs_classificatio-tab']")
+            field_name_input = lazy.locator('input[placeholder="Add field name"]')
+            searchable_checkbox = lazy.locator('(//div[@class="option"] //span[@class="MuiIconButton-label"])[1] /input')
+            delete_single_type_field_icon = lazy.locator('span[id*="hubs_delete-data-point"]')
+            delete_group_type_field_icon = lazy.locator('(//div[@class="MuiTreeItem-content"]//span[@kind="greyOutlined"])[2]')
+            no_data_points_title_text = lazy.locator(".tab-content h4")
+            no_data_points_description_text = lazy.locator(".tab-content p")
+            added_field = lazy.locator('ul[role="tree"] .MuiTreeItem-content')
+            single_field = lazy.locator('ul[role="tree"] .MuiTreeItem-content').filter(has_text=HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
+            group_field = lazy.locator('ul[role="tree"] .MuiTreeItem-content').filter(has_text=HUB_PAGE_VALUE_GROUP_FIELD_NAME)
+            list_field = lazy.locator('ul[role="tree"] .MuiTreeItem-content').filter(has_text=HUB_PAGE_VALUE_LIST_FIELD_NAME)
+            nested_field = lazy.locator('ul[role="tree"] .MuiTreeItem-content').filter(has_text=HUB_PAGE_VALUE_NESTED_FIELD_NAME)
+            required_checkbox = lazy.locator('(//div[@class="option"] //span[@class="MuiIconButton-label"])[2] /input')
+            advanced_section = lazy.locator('.selection-strategy')
+            kve_checkbox = lazy.locator('(//span[@class="MuiIconButton-label"])[3] /input')
+            qna_checkbox = lazy.locator('(//span[@class="MuiIconButton-label"])[4] /input')
+            script_checkbox = lazy.locator('(//span[@class="MuiIconButton-label"])[5] /input')
+            qna_input = lazy.locator("input[name='question']")
+            verify_button = lazy.locator('//div[@class="options-wrapper"]/div').filter(has_text="Verify")
+
             def __init__(self, page: Page):
                 """
                 Initializes the Hubs page object with web element locators.
@@ -127,70 +216,16 @@ class DocumentsInsightsPage(BasePage):
                 :param page: Playwright Page object representing the browser tab or frame.
                 """
                 super().__init__(page)
-                # General elements
-                self.gear_button = page.locator('.tab-header span[kind="greyOutlined"]')
-                self.edit_hub_name = page.locator('.page__header-left span[kind="greyOutlined"]')
-                self.save_button = page.get_by_role("button", name="Save")
-                self.single_radiobutton = page.locator(".radio-button-label .text").filter(has_text="Single")
-                self.group_radiobutton = page.locator(".radio-button-label .text").filter(has_text="Group")
-                self.list_radiobutton = page.locator(".radio-button-label .text").filter(has_text="List")
-                self.arrow_button = page.locator('.chevron.undefined')
-                self.nested_group_label = page.locator(".MuiTreeItem-group.MuiCollapse-entered")
-                self.delete_button = page.get_by_role("button", name="Delete")
-                self.delete_group_type_field_icon = page.locator(
-                    '(//div[@class="MuiTreeItem-content"]//span[@kind="greyOutlined"])[2]')
-                self.file_input = page.locator("input[type='file']")
-                self.navigate_to_hubs_page_button = page.locator(".page__header-left div span")
-
-                # Outline based hub
-                self.add_new_field_button = page.get_by_role("button", name="+ Add new field")
-                self.drag_and_drop_files_button = page.locator(".direct-upload-dropzone")
-                self.browse_files_button = page.locator(".open-upload")
-                self.single_field_label_title = page.locator(".name_box")
-                self.list_group_field_label_title = page.locator('ul[role="tree"]')
-                self.nested_add_new_field = page.locator('//*[@id="scroll"]/div/div[2]/div[2]/div/div[1]/div/div/div/div[2]/div/div/div/ul/div/li/div/div[2]/div/div[2]/span[3]')
-                self.arrow_button = page.locator('.chevron.undefined')
-                self.nested_group_label = page.locator(".MuiTreeItem-group.MuiCollapse-entered")
-                self.delete_single_type_field_icon_outline = page.locator('(//div[@class="rigth_box"]//span[@kind="greyOutlined"])[2]')
-                self.meatball_menu = page.locator(".open-hub-actions")
-                self.no_fields_text = page.locator(".field_text")
-                self.fields_list_text_title = page.locator(".tab-content .name")
-                self.outline_template_name = page.locator(".box_name")
-                self.outline_template_switch = page.locator("//div[contains(@class, 'toggle-enable')]")
-                self.outline_template_meatball_menu = page.locator("//div[contains(@class, 'open-hub-actions')]")
-                self.outline_template_footer = page.locator(".box_container footer")
-                self.outline_template_meatball_menu_rename_point = page.locator("//div[contains(@class, 'rename-hub')]")
-                self.rename_popup_input = page.locator('input[placeholder="Outline name"]')
-                self.rename_popup_cancel_button = page.get_by_role("button", name="Cancel")
-                self.outline_template_meatball_menu_delete_point = page.locator("//div[contains(@class, 'remove-hub')]")
-                self.outline_template_card = page.locator(".box_container")
-
-                # Value based hub
-                self.upload_documents_button = page.get_by_role("button", name="Upload Documents")
-                self.add_data_points_button = page.get_by_role("button", name="ADD DATA POINTS")
-                self.import_data_points_in_json_format_button = page.get_by_role("button", name="import data points in json format")
-                self.data_points_tab = page.locator("[id*='hubs_data-points-tab']")
-                self.dictionary_tab = page.locator("[id*='hubs_synonyms-tab']")
-                self.nested_value_add_new_field = page.locator('//*[@id="scroll"]/div/div[2]/div[2]/div/div/div/ul/div/div/ul/li/div/div[2]/div/div[2]/span[3]')
-                self.classification_tab = page.locator("[id*='hubs_classificatio-tab']")
-                self.field_name_input = page.locator('input[placeholder="Add field name"]')
-                self.searchable_checkbox = page.locator('(//div[@class="option"] //span[@class="MuiIconButton-label"])[1] /input')
-                self.delete_single_type_field_icon = page.locator('span[id*="hubs_delete-data-point"]')
-                self.delete_group_type_field_icon = page.locator('(//div[@class="MuiTreeItem-content"]//span[@kind="greyOutlined"])[2]')
-                self.no_data_points_title_text = page.locator(".tab-content h4")
-                self.no_data_points_description_text = page.locator(".tab-content p")
-                self.added_field = page.locator('ul[role="tree"] .MuiTreeItem-content')
-                self.single_field = page.locator('ul[role="tree"] .MuiTreeItem-content').filter(has_text=HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
-                self.group_field = page.locator('ul[role="tree"] .MuiTreeItem-content').filter(has_text=HUB_PAGE_VALUE_GROUP_FIELD_NAME)
-                self.list_field = page.locator('ul[role="tree"] .MuiTreeItem-content').filter(has_text=HUB_PAGE_VALUE_LIST_FIELD_NAME)
-                self.nested_field = page.locator('ul[role="tree"] .MuiTreeItem-content').filter(has_text=HUB_PAGE_VALUE_NESTED_FIELD_NAME)
-                self.required_checkbox = page.locator('(//div[@class="option"] //span[@class="MuiIconButton-label"])[2] /input')
-                self.advanced_section = page.locator('.selection-strategy')
-                self.kve_checkbox = page.locator('(//span[@class="MuiIconButton-label"])[3] /input')
-                self.qna_checkbox = page.locator('(//span[@class="MuiIconButton-label"])[4] /input')
-                self.script_checkbox = page.locator('(//span[@class="MuiIconButton-label"])[5] /input')
-                self.qna_input = page.locator("input[name='question']")
-                self.verify_button = page.locator('//div[@class="options-wrapper"]/div').filter(has_text="Verify")
+
+            def navigate_to_hubs_page(self):
+                """
+                Goes back to the Hubs page with the button in the hub header and waits until the hubs are loaded
+
+                :return: Instance of HubsPage object
+                """
+                with self.sidebar.measure_transition("Hubs"), expect_route_ready(self.page, "Hubs"):
+                    self.navigate_to_hubs_page_button.click()
+                return DocumentsInsightsPage.HubsPage(self.page)
 
             def upload_file(self, document):
                 """
@@ -1,7 +1,16 @@
 from playwright.sync_api import Page
+from pageObjects.lazyLocator import lazy
 
 
 class ForgotPasswordPage:
+    email_input = lazy.locator('div[class="forgot"] input[name="email"]')
+    send_button = lazy.get_by_role("button", name="Send")
+    back_to_login_button = lazy.get_by_role("button", name="Back to log in")
+    page_title = lazy.locator('div.forgot__head h1')
+    error_message = lazy.locator('[type="ERROR"]')
+    description_text = lazy.locator('div.forgot__text p:nth-child(1)')
+    resend_reset_email_text = lazy.locator('div.forgot__text p:nth-child(2)')
+
     def __init__(self, page: Page):
         """
         Initializes the Home page object with web element locators.
@@ -9,14 +18,6 @@ class ForgotPasswordPage:
         :param page: Playwright Page object representing the browser tab or frame.
         """
         self.page = page
-        self.email_input = page.locator('div[class="forgot"] input[name="email"]')
-        self.send_button = page.get_by_role("button", name="Send")
-        self.back_to_login_button = page.get_by_role("button", name="Back to log in")
-        self.page_title = page.locator('div.forgot__head h1')
-        self.error_message = page.locator('[type="ERROR"]')
-        self.description_text = page.locator('div.forgot__text p:nth-child(1)')
-        self.resend_reset_email_text = page.locator('div.forgot__text p:nth-child(2)')
-
 
     def navigate_to_login_page(self):
         from pageObjects.loginPage import LoginPage
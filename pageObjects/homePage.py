@@ -1,9 +1,14 @@
 from playwright.sync_api import Page
 from pageObjects.basePage import BasePage
+from pageObjects.lazyLocator import lazy
 
 
 class HomePage(BasePage):
 
+    user_greeting_text = lazy.locator('.page-content .greeting').first
+    main_greeting_text = lazy.locator('.content .greeting')
+    description_text = lazy.locator('.content .info')
+
     def __init__(self, page: Page):
         """
         Initializes the HomePage object with web element locators.
@@ -11,8 +16,5 @@ class HomePage(BasePage):
         :param page: Playwright Page object representing the browser tab or frame.
         """
         super().__init__(page)
-        self.user_greeting_text = page.locator('.page-content .greeting').first
-        self.main_greeting_text = page.locator('.content .greeting')
-        self.description_text = page.locator('.content .info')
 
 
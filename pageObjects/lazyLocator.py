@@ -0,0 +1,145 @@
+import importlib
+import inspect
+import pkgutil
+from functools import cached_property
+
+
+class LazyLocator:
+    """
+    Locator of a page object, declared in the class body and built from self.page on the first access.
+    The built locator is stored in the instance __dict__, so every later access is a plain attribute lookup.
+
+    A locator is declared by chaining the Page and Locator calls on `lazy`, exactly as on a Page:
+
+        class HomePage(BasePage):
+            greeting_text = lazy.locator('.content .greeting').first
+
+    Page objects are created on every navigation, but most tests use only a few of their locators,
+    so nothing is built until it is used.
+    """
+
+    def __init__(self, steps=()):
+        """
+        :param steps: tuple of (attribute name, args, kwargs) applied to the page one after another,
+                      args is None for a property such as 'first'
+        """
+        self.steps = steps
+        self.attribute_name = None
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return LazyLocator(self.steps + ((name, None, None),))
+
+    def __call__(self, *args, **kwargs):
+        name, _, _ = self.steps[-1]
+        return LazyLocator(self.steps[:-1] + ((name, args, kwargs),))
+
+    def __set_name__(self, owner, name):
+        self.attribute_name = name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        locator = self.resolve(instance.page)
+        instance.__dict__[self.attribute_name] = locator
+        return locator
+
+    def resolve(self, page):
+        """
+        Builds the locator
+
+        :param page: Playwright Page object
+        :return: Locator
+        """
+        target = page
+        for name, args, kwargs in self.steps:
+            target = getattr(target, name)
+            if args is not None:
+                target = target(*args, **kwargs)
+        return target
+
+    def describe(self):
+        """
+        :return: the declaration as it is written in the page object, for example "locator('li span').first"
+        """
+        calls = []
+        for name, args, kwargs in self.steps:
+            if args is None:
+                calls.append(name)
+            else:
+                arguments = [repr(arg) for arg in args] + [f"{key}={value!r}" for key, value in kwargs.items()]
+                calls.append(f"{name}({', '.join(arguments)})")
+        return ".".join(calls)
+
+    def __repr__(self):
+        return f"<LazyLocator {self.attribute_name} = lazy.{self.describe()}>"
+
+
+# Root of every locator declaration
+lazy = LazyLocator()
+
+
+def locators_of(page_object_class):
+    """
+    Class decorator that declares the locators of the given page object class, and of its base classes,
+    on the decorated class. Locators are built with the same calls on the sync and on the async Page,
+    so the async page objects take them over from the sync ones and both stay in sync.
+
+        @locators_of(sync_login_page.LoginPage)
+        class LoginPage:
+            ...
+
+    :param page_object_class: Page object class the locators are declared in
+    :return: the decorator
+    """
+    def decorator(cls):
+        for name, lazy_locator in get_lazy_locators(page_object_class).items():
+            if name not in vars(cls):
+                locator = LazyLocator(lazy_locator.steps)
+                setattr(cls, name, locator)
+                locator.__set_name__(cls, name)
+        return cls
+    return decorator
+
+
+def get_page_object_classes():
+    """
+    :return: all page-object classes of pageObjects/ with lazy locators, nested classes included,
+             by name such as 'documentsInsightsPage.DocumentsInsightsPage.HubsPage'
+    """
+    import pageObjects
+    import pageObjects.components
+
+    classes = {}
+    module_names = [module_info.name for package in (pageObjects, pageObjects.components)
+                    for module_info in pkgutil.iter_modules(package.__path__, package.__name__ + ".")]
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        stack = [cls for _, cls in inspect.getmembers(module, inspect.isclass) if cls.__module__ == module.__name__]
+        while stack:
+            cls = stack.pop()
+            stack.extend(value for value in vars(cls).values() if inspect.isclass(value))
+            if get_lazy_locators(cls):
+                classes[f"{cls.__module__.split('.')[-1]}.{cls.__qualname__}"] = cls
+    return dict(sorted(classes.items()))
+
+
+def get_components(page_object):
+    """
+    :param page_object: Page object instance
+    :return: dict attribute name -> nested page object (functools.cached_property attributes such as 'sidebar')
+    """
+    return {name: getattr(page_object, name) for name, value in inspect.getmembers(type(page_object))
+            if isinstance(value, cached_property)}
+
+
+def get_lazy_locators(page_object_class):
+    """
+    :param page_object_class: Page object class
+    :return: dict attribute name -> LazyLocator of the class and its base classes
+    """
+    locators = {}
+    for cls in reversed(page_object_class.__mro__):
+        locators.update({name: value for name, value in vars(cls).items() if isinstance(value, LazyLocator)})
+    return locators
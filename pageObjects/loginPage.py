@@ -1,8 +1,16 @@
 from playwright.sync_api import Page
+from pageObjects.lazyLocator import lazy
 
 
 class LoginPage:
 
+    email_input = lazy.locator('#email')
+    password_input = lazy.locator('#password')
+    login_button = lazy.get_by_role("button", name="Log in")
+    page_title = lazy.locator('.MuiContainer-root h1')
+    forgot_password_button = lazy.locator('div[class="login__forgot"]')
+    error_message = lazy.locator('.MuiAlert-message')
+
     def __init__(self, page: Page):
         """
         Initializes the LoginPage object with web element locators.
@@ -10,12 +18,6 @@ class LoginPage:
         :param page: Playwright Page object representing the browser tab or frame.
         """
         self.page = page
-        self.email_input = page.locator('#email')
-        self.password_input = page.locator('#password')
-        self.login_button = page.get_by_role("button", name="Log in")
-        self.page_title = page.locator('.MuiContainer-root h1')
-        self.forgot_password_button = page.locator('div[class="login__forgot"]')
-        self.error_message = page.locator('.MuiAlert-message')
 
     def login_with_user_credentials(self, user_email, user_password):
         """
@@ -1,7 +1,18 @@
+from functools import cached_property
+
 from playwright.sync_api import Page
+from pageObjects.lazyLocator import lazy
 
 
 class RegisterCompanyUserPage:
+    first_name_input = lazy.locator('div[class="register"] input[name="firstName"]')
+    last_name_input = lazy.locator('div[class="register"] input[name="lastName"]')
+    password_input = lazy.locator('div[class="register"] input[name="password"]')
+    confirm_password_input = lazy.locator('div[class="register"] input[name="passwordConfirmation"]')
+    privacy_policy_checkbox = lazy.locator('div[class="register"] input[name="privacy"]')
+    terms_of_use_checkbox = lazy.locator('div[class="register"] input[name="terms"]')
+    register_button = lazy.get_by_role("button", name="Register")
+
     def __init__(self, page: Page):
         """
         Initializes the Register Company User page object with web element locators.
@@ -9,14 +20,10 @@ class RegisterCompanyUserPage:
         :param page: Playwright Page object representing the browser tab or frame.
         """
         self.page = page
-        self.first_name_input = page.locator('div[class="register"] input[name="firstName"]')
-        self.last_name_input = page.locator('div[class="register"] input[name="lastName"]')
-        self.password_input = page.locator('div[class="register"] input[name="password"]')
-        self.confirm_password_input = page.locator('div[class="register"] input[name="passwordConfirmation"]')
-        self.privacy_policy_checkbox = page.locator('div[class="register"] input[name="privacy"]')
-        self.terms_of_use_checkbox = page.locator('div[class="register"] input[name="terms"]')
-        self.register_button = page.get_by_role("button", name="Register")
-        self.success_page = RegisterCompanyUserPage.SuccessPage(page)
+
+    @cached_property
+    def success_page(self):
+        return RegisterCompanyUserPage.SuccessPage(self.page)
 
     def send_the_register_new_company_user_form(self, first_name, last_name, password):
         self.first_name_input.fill(first_name)
@@ -29,9 +36,12 @@ class RegisterCompanyUserPage:
         response = resp_info.value
         assert response.ok
 
-
     class SuccessPage:
 
+        title = lazy.locator('div[class="register"] h1')
+        description = lazy.locator('div[class="register"] div[class="register__text"] p')
+        go_to_log_in_button = lazy.get_by_role("button", name="Go to log in")
+
         def __init__(self, page: Page):
             """
             Initializes the Success page object with web element locators.
@@ -39,9 +49,6 @@ class RegisterCompanyUserPage:
             :param page: Playwright Page object representing the browser tab or frame.
             """
             self.page = page
-            self.title = page.locator('div[class="register"] h1')
-            self.description = page.locator('div[class="register"] div[class="register__text"] p')
-            self.go_to_log_in_button = page.get_by_role("button", name="Go to log in")
 
         def navigate_to_login_page(self):
             from pageObjects.loginPage import LoginPage
@@ -1,7 +1,16 @@
 from playwright.sync_api import Page
+from pageObjects.lazyLocator import lazy
 
 
 class UpdatePasswordPage:
+    page_title = lazy.locator('div[class="update"] h1')
+    page_description = lazy.locator('div[class="update"] p[class="update__text"]')
+    new_password_input = lazy.locator('#password')
+    confirm_new_password_input = lazy.locator('#passwordConfirmation')
+    update_button = lazy.get_by_role("button", name="Update")
+    back_to_login_button = lazy.get_by_role("button", name="Back to log in")
+    error_message = lazy.locator('[type="ERROR"]')
+
     def __init__(self, page: Page):
         """
         Initializes the Home page object with web element locators.
@@ -9,14 +18,6 @@ class UpdatePasswordPage:
         :param page: Playwright Page object representing the browser tab or frame.
         """
         self.page = page
-        self.page_title = page.locator('div[class="update"] h1')
-        self.page_description = page.locator('div[class="update"] p[class="update__text"]')
-        self.new_password_input = page.locator('#password')
-        self.confirm_new_password_input = page.locator('#passwordConfirmation')
-        self.update_button = page.get_by_role("button", name="Update")
-        self.back_to_login_button = page.get_by_role("button", name="Back to log in")
-        self.error_message = page.locator('[type="ERROR"]')
-
 
     def navigate_to_login_page(self):
         from pageObjects.loginPage import LoginPage
@@ -1,9 +1,21 @@
+from functools import cached_property
+
 from playwright.sync_api import Page
 from pageObjects.basePage import BasePage
+from pageObjects.lazyLocator import lazy
 
 
 class WebAutomationsPage(BasePage):
 
+    create_button = lazy.get_by_role("button", name="Create").filter(has_not_text="Created")
+    import_button = lazy.get_by_role("button", name="Import")
+    file_input = lazy.locator("input[type='file']")
+    table = lazy.locator('[tablename="automations"]')
+    automations_tab = lazy.locator(".nav-item.ng-star-inserted a").filter(has_text="Automations")
+    fragments_tab = lazy.locator(".nav-item.ng-star-inserted a").filter(has_text="Fragments")
+    credentials_tab = lazy.locator(".nav-item.ng-star-inserted a").filter(has_text="Credentials")
+    no_data_row = lazy.locator('.mat-cell')
+
     def __init__(self, page: Page):
         """
         Initializes the Web Automations page object with web element locators.
@@ -11,16 +23,10 @@ class WebAutomationsPage(BasePage):
         :param page: Playwright Page object representing the browser tab or frame.
         """
         super().__init__(page)
-        self.create_button = page.get_by_role("button", name="Create").filter(has_not_text="Created")
-        self.import_button = page.get_by_role("button", name="Import")
-        self.web_automation_page = self.WebAutomationPage(page)
-        self.file_input = page.locator("input[type='file']")
-        self.table = page.locator('[tablename="automations"]')
-        self.automations_tab = page.locator(".nav-item.ng-star-inserted a").filter(has_text="Automations")
-        self.fragments_tab = page.locator(".nav-item.ng-star-inserted a").filter(has_text="Fragments")
-        self.credentials_tab = page.locator(".nav-item.ng-star-inserted a").filter(has_text="Credentials")
-        self.no_data_row = page.locator('.mat-cell')
 
+    @cached_property
+    def web_automation_page(self):
+        return self.WebAutomationPage(self.page)
 
     def upload_file(self, document):
         """
@@ -31,6 +37,8 @@ class WebAutomationsPage(BasePage):
         self.file_input.set_input_files("data/" + document + "")
 
     class WebAutomationPage(BasePage):
+        save_button = lazy.get_by_role("button", name="Save")
+
         def __init__(self, page: Page):
             """
             Initializes the Web Automation page object with web element locators.
@@ -38,4 +46,3 @@ class WebAutomationsPage(BasePage):
             :param page: Playwright Page object representing the browser tab or frame.
             """
             super().__init__(page)
-            self.save_button = page.get_by_role("button", name="Save")
@@ -1,16 +1,18 @@
 from playwright.sync_api import Page
+from pageObjects.lazyLocator import lazy
 
 
 class WorkflowsPage:
+    workflows_tab = lazy.get_by_role("button", name="Workflows")
+    runs_tab = lazy.get_by_role("button", name="Runs")
+    page_title = lazy.locator(".content h1")
+    page_description = lazy.locator(".content p")
+    add_new_workflow_button = lazy.get_by_role("button", name="Add new workflow")
+
     def __init__(self, page: Page):
         """
                 Initializes the Home page object with web element locators.
 
                 :param page: Playwright Page object representing the browser tab or frame.
                 """
-        self.page = page
-        self.workflows_tab = page.get_by_role("button", name="Workflows")
-        self.runs_tab = page.get_by_role("button", name="Runs")
-        self.page_title = page.locator(".content h1")
-        self.page_description = page.locator(".content p")
-        self.add_new_workflow_button = page.get_by_role("button", name="Add new workflow")
\ No newline at end of file
+        self.page = page
\ No newline at end of file
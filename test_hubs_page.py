@@ -1,23 +1,23 @@
-import time
-
 import pytest
 from playwright.sync_api import expect
-from data.constants import DOMAIN_STAGE_URL, HUBS_PAGE_RENAME_POPUP_TITLE, HUBS_PAGE_TAGS_POPUP_TITLE
+from data.constants import HUBS_PAGE_RENAME_POPUP_TITLE, HUBS_PAGE_TAGS_POPUP_TITLE
+from pageObjects.documentsInsightsPage import DocumentsInsightsPage
 from pageObjects.homePage import HomePage
-from utilities.api.api_base import authenticate_with_user, delete_hub
-from utilities.data_processing import get_key_value_from_file
+from utilities.api.api_base import get_hub
+from utilities.auth_state import get_cached_user_token
+from utilities.polling import poll_until, is_hub_settled
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_create_an_outline_based_hub_only_required_fields(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_an_outline_based_hub_only_required_fields(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully create an outline based only required fields populated
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
     - Navigate to hubs page
 
@@ -25,58 +25,38 @@ def test_create_an_outline_based_hub_only_required_fields(context_and_playwright
     - Outline hub card is displayed on the Hubs page
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the teardown registry
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set token in cookies
-    context.add_cookies([{
-        "name": "access-token-plextera",
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Continue as before
-    page.goto(DOMAIN_STAGE_URL)
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
+    # Steps
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub(False)
+    teardown_registry.register_hub(outline_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.add_new_field_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.drag_and_drop_files_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.browse_files_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.edit_hub_name).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_create_an_outline_based_hub_all_fields(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_an_outline_based_hub_all_fields(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully create an outline based hub with all fields populated
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
     - Navigate to hubs page
 
@@ -84,58 +64,38 @@ def test_create_an_outline_based_hub_all_fields(context_and_playwright):
     - Outline hub card is displayed on the Hubs page
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the teardown registry
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set token in cookies
-    context.add_cookies([{
-        "name": "access-token-plextera",
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Continue as before
-    page.goto(DOMAIN_STAGE_URL)
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
+    # Steps
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub(True)
+    teardown_registry.register_hub(outline_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.add_new_field_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.drag_and_drop_files_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.browse_files_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.edit_hub_name).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_card_description).to_have_text("description")
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_disable_an_outline_based_hub_only_required_fields(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_disable_an_outline_based_hub_only_required_fields(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully disable an outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
     - Navigate to hubs page
     - Click the switch on the hub card
@@ -144,42 +104,25 @@ def test_disable_an_outline_based_hub_only_required_fields(context_and_playwrigh
     - Switch is disabled on the hub card
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the teardown registry
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set token in cookies
-    context.add_cookies([{
-        "name": "access-token-plextera",
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Continue as before
-    page.goto(DOMAIN_STAGE_URL)
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
+    # Steps
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub(False)
+    teardown_registry.register_hub(outline_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.add_new_field_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.drag_and_drop_files_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.browse_files_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.edit_hub_name).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     on_documents_insights_page.hubs_page.hub_card_switch.click()
     with page.expect_response("**/api/hubs/" + outline_hub_data["id"] + "") as resp_info:
@@ -187,22 +130,19 @@ def test_disable_an_outline_based_hub_only_required_fields(context_and_playwrigh
     assert resp_info.value.ok
     # Verification
 
-    # Delete hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_delete_outline_hub_using_delete_point_from_settings_menu(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_outline_hub_using_delete_point_from_settings_menu(context_and_playwright, teardown_registry):
     """
         Verify that a user can successfully delete an outline based hub from hubs page
 
         Steps:
-        - Load user credentials and payload from the JSON file.
-        - Send login request and set cookie
-        - Open home page and navigate to the 'Documents Insights' page
+        - Open a context logged in as the support user
+        - Open the 'Documents Insights' page by its URL
         - Open, fill in and send the 'Create a hub' form
         - Navigate to the Hubs page
         - Open settings menu on the hubs card and delete hub
@@ -212,38 +152,21 @@ def test_delete_outline_hub_using_delete_point_from_settings_menu(context_and_pl
         """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set token in cookies
-    context.add_cookies([{
-        "name": "access-token-plextera",
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Continue as before
-    page.goto(DOMAIN_STAGE_URL)
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
+    # Steps
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub(False)
+    teardown_registry.register_hub(outline_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.add_new_field_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.drag_and_drop_files_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.browse_files_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.edit_hub_name).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     on_documents_insights_page.hubs_page.hub_card_meatball_menu.click()
     on_documents_insights_page.hubs_page.hub_card_meatball_menu_delete_point.click()
@@ -257,14 +180,14 @@ def test_delete_outline_hub_using_delete_point_from_settings_menu(context_and_pl
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_open_view_details_popup_of_the_outline_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_open_view_details_popup_of_the_outline_hub(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully open the View Details popup using the settings menu of the outline hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
     - Navigate to hubs page
     - Open settings menu and click the View Details point
@@ -273,33 +196,18 @@ def test_open_view_details_popup_of_the_outline_hub(context_and_playwright):
     - The View Details popup is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the teardown registry
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set token in cookies
-    context.add_cookies([{
-        "name": "access-token-plextera",
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
     # Steps
-    page.goto(DOMAIN_STAGE_URL)
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub(False)
+    teardown_registry.register_hub(outline_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.add_new_field_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.drag_and_drop_files_button).to_be_visible()
@@ -307,9 +215,7 @@ def test_open_view_details_popup_of_the_outline_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.edit_hub_name).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
     # Navigate to Hubs page
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     # Open the View Detail popup
@@ -317,22 +223,18 @@ def test_open_view_details_popup_of_the_outline_hub(context_and_playwright):
     on_documents_insights_page.hubs_page.hub_card_meatball_menu_view_details_point.click()
     # Verification
     expect(on_documents_insights_page.hubs_page.popups.view_details_content_section).to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_rename_an_outline_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_rename_an_outline_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully rename an outline hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Navigate to hubs page
     - Open the Rename popup using settings menu from the outline hub card
     - Fill in the input field and send the form
@@ -341,33 +243,13 @@ def test_rename_an_outline_hub(context_and_playwright):
     - Updated outline hub card is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set token in cookies
-    context.add_cookies([{
-        "name": "access-token-plextera",
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub(False)
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.add_new_field_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.drag_and_drop_files_button).to_be_visible()
@@ -375,9 +257,7 @@ def test_rename_an_outline_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.edit_hub_name).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
     # Navigate to Hubs page
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     # Open the Rename popup
     on_documents_insights_page.hubs_page.hub_card_meatball_menu.click()
@@ -392,21 +272,18 @@ def test_rename_an_outline_hub(context_and_playwright):
     assert resp_info.value.ok
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card_title).to_have_text("update outline hub")
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_create_a_value_based_hub_only_required_fields(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_a_value_based_hub_only_required_fields(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully create a value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
 
     Expected:
@@ -414,34 +291,18 @@ def test_create_a_value_based_hub_only_required_fields(context_and_playwright):
     visible
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the teardown registry
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
     # Steps
-    page.goto(DOMAIN_STAGE_URL)
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    teardown_registry.register_hub(value_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.upload_documents_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
@@ -452,27 +313,21 @@ def test_create_a_value_based_hub_only_required_fields(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.dictionary_tab).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.classification_tab).to_be_visible()
     # Navigate to Hubs page
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
-    time.sleep(3)
-    # Delete created hub
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_create_a_value_based_hub_only_all_fields_key_value_extractor(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_a_value_based_hub_only_all_fields_key_value_extractor(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully create a value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
 
     Expected:
@@ -480,34 +335,18 @@ def test_create_a_value_based_hub_only_all_fields_key_value_extractor(context_an
     visible
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the teardown registry
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
     # Steps
-    page.goto(DOMAIN_STAGE_URL)
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(True, False)
+    teardown_registry.register_hub(value_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.upload_documents_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
@@ -518,28 +357,22 @@ def test_create_a_value_based_hub_only_all_fields_key_value_extractor(context_an
     expect(on_documents_insights_page.hubs_page.hub_page.dictionary_tab).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.classification_tab).to_be_visible()
     # Navigate to Hubs page
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_card_description).to_have_text("description")
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_create_a_value_based_hub_only_all_fields_label_based_extractor(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_a_value_based_hub_only_all_fields_label_based_extractor(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully create a value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
 
     Expected:
@@ -547,34 +380,18 @@ def test_create_a_value_based_hub_only_all_fields_label_based_extractor(context_
     visible
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the teardown registry
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
     # Steps
-    page.goto(DOMAIN_STAGE_URL)
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(True, True)
+    teardown_registry.register_hub(value_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.upload_documents_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
@@ -585,16 +402,10 @@ def test_create_a_value_based_hub_only_all_fields_label_based_extractor(context_
     expect(on_documents_insights_page.hubs_page.hub_page.dictionary_tab).not_to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.classification_tab).to_be_visible()
     # Navigate to Hubs page
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_card_description).to_have_text("description")
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 
@@ -602,14 +413,14 @@ def test_create_a_value_based_hub_only_all_fields_label_based_extractor(context_
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_delete_a_value_based_hub_using_delete_point_from_settings_menu(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_a_value_based_hub_using_delete_point_from_settings_menu(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully delete a value based hub from hubs page
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
     - Navigate to the Hubs page
     - Open settings menu on the hubs card and delete hub
@@ -619,30 +430,14 @@ def test_delete_a_value_based_hub_using_delete_point_from_settings_menu(context_
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
     # Steps
-    page.goto(DOMAIN_STAGE_URL)
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    teardown_registry.register_hub(value_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.upload_documents_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
@@ -652,13 +447,13 @@ def test_delete_a_value_based_hub_using_delete_point_from_settings_menu(context_
     expect(on_documents_insights_page.hubs_page.hub_page.data_points_tab).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.dictionary_tab).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.classification_tab).to_be_visible()
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     on_documents_insights_page.hubs_page.hub_card_meatball_menu.click()
     on_documents_insights_page.hubs_page.hub_card_meatball_menu_delete_point.click()
-    time.sleep(3)
+    # The value based hub is deleted only once the OCRG API reports it settled
+    poll_until(lambda: is_hub_settled(get_hub(playwright, value_hub_data["id"], user_token)))
+    expect(on_documents_insights_page.hubs_page.popups.delete_button).to_be_enabled()
     with page.expect_response(f"**/api/hubs/{value_hub_data["id"]}") as resp_info:
         on_documents_insights_page.hubs_page.popups.delete_button.click()
     assert resp_info.value.ok
@@ -667,15 +462,14 @@ def test_delete_a_value_based_hub_using_delete_point_from_settings_menu(context_
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_rename_a_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_rename_a_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully rename a value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Navigate to the Hubs page
     - Open the Rename popup using setting menu of the value based hub card
     - Fill in the input and send the form
@@ -684,34 +478,13 @@ def test_rename_a_value_based_hub(context_and_playwright):
     - Updated value hub card is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.upload_documents_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
@@ -722,9 +495,7 @@ def test_rename_a_value_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.dictionary_tab).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.classification_tab).to_be_visible()
     # Navigate to the Hubs page
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     # Open the Rename popup
@@ -740,23 +511,18 @@ def test_rename_a_value_based_hub(context_and_playwright):
     assert resp_info.value.ok
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card_title).to_have_text("update outline hub")
-    time.sleep(3)
-    # Delete created hub
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_add_tag_to_a_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_add_tag_to_a_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully add a tag to a value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Navigate to the Hubs page
     - Open the Tags for hub popup using setting menu of the value based hub card
     - Fill in the Enter Key, Enter Value inputs and send the form
@@ -766,34 +532,13 @@ def test_add_tag_to_a_value_based_hub(context_and_playwright):
     - Entered tags values are displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.upload_documents_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
@@ -804,9 +549,7 @@ def test_add_tag_to_a_value_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.dictionary_tab).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.classification_tab).to_be_visible()
     # Navigate to the Hubs page
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     # Open the Tags for hub popup
@@ -827,22 +570,18 @@ def test_add_tag_to_a_value_based_hub(context_and_playwright):
     # Verification
     expect(on_documents_insights_page.hubs_page.popups.tags_for_hub_key_input).to_have_value("key")
     expect(on_documents_insights_page.hubs_page.popups.tags_for_hub_value_input).to_have_value("value")
-    time.sleep(3)
-    # Delete created hub
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_open_view_details_popup_of_a_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_open_view_details_popup_of_a_value_based_hub(context_and_playwright, teardown_registry):
     """
     Verify that a user can successfully open View Details popup of a value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
     - Open, fill in and send the 'Create a hub' form
     - Navigate to Hubs page
     - Open the View Details popup using settings menu of a value based hub card
@@ -851,34 +590,18 @@ def test_open_view_details_popup_of_a_value_based_hub(context_and_playwright):
     - The View Details popup is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the teardown registry
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
+    # The context is opened with the cached support user session, get the token for API calls
+    user_token = get_cached_user_token(playwright, "support")
     # Steps
-    page.goto(DOMAIN_STAGE_URL)
     on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
     on_documents_insights_page.hubs_button.click()
     value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    teardown_registry.register_hub(value_hub_data["id"], user_token)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.upload_documents_button).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.gear_button).to_be_visible()
@@ -889,9 +612,7 @@ def test_open_view_details_popup_of_a_value_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.dictionary_tab).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.classification_tab).to_be_visible()
     # Navigate to Hubs page
-    with page.expect_response("**/api/hubs/page?sortBy=name") as resp_info:
-        on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page_button.click()
-    assert resp_info.value.ok
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
     # Open the View Detail popup
@@ -899,6 +620,3 @@ def test_open_view_details_popup_of_a_value_based_hub(context_and_playwright):
     on_documents_insights_page.hubs_page.hub_card_meatball_menu_view_details_point.click()
     # Verification
     expect(on_documents_insights_page.hubs_page.popups.view_details_content_section).to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
\ No newline at end of file
@@ -1,57 +1,31 @@
-import time
-
 import pytest
 from playwright.sync_api import expect
-from data.constants import DOMAIN_STAGE_URL, HUB_PAGE_OUTLINE_TEMPLATE_NAME
-from pageObjects.homePage import HomePage
-from utilities.api.api_base import authenticate_with_user, delete_hub
-from utilities.data_processing import get_key_value_from_file
+from data.constants import HUB_PAGE_OUTLINE_TEMPLATE_NAME
+from pageObjects.documentsInsightsPage import DocumentsInsightsPage
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_create_single_type_field_in_outline_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_single_type_field_in_outline_based_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully create a Single-type field for the outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form and send it
 
     Expected:
     - A Single-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_new_field_button.click()
     with page.expect_response(f"**/api/hubs/{outline_hub_data["id"]}/abstract-fields") as resp_info:
         on_documents_insights_page.hubs_page.hub_page.save_button.click()
@@ -60,56 +34,31 @@ def test_create_single_type_field_in_outline_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.no_fields_text).not_to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.fields_list_text_title).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.single_field_label_title).to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_create_group_type_field_in_outline_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_group_type_field_in_outline_based_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully create a Group-type field for the outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form, select Group type and send it
 
     Expected:
     - A Group-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_new_field_button.click()
     on_documents_insights_page.hubs_page.hub_page.group_radiobutton.click()
     with page.expect_response(f"**/api/hubs/{outline_hub_data["id"]}/abstract-fields") as resp_info:
@@ -119,55 +68,30 @@ def test_create_group_type_field_in_outline_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.no_fields_text).not_to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.fields_list_text_title).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.list_group_field_label_title).to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_create_list_type_field_in_outline_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_list_type_field_in_outline_based_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully create a List-type field for the outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form, select List type and send it
 
     Expected:
     - A List-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_new_field_button.click()
     on_documents_insights_page.hubs_page.hub_page.list_radiobutton.click()
     with page.expect_response(f"**/api/hubs/{outline_hub_data["id"]}/abstract-fields") as resp_info:
@@ -177,22 +101,18 @@ def test_create_list_type_field_in_outline_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.no_fields_text).not_to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.fields_list_text_title).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.list_group_field_label_title).to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_create_group_type_field_nested_inside_list_type_field_in_outline_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_group_type_field_nested_inside_list_type_field_in_outline_based_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully create a Group-type field nested inside the List-type field for the outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form, select List type and send it
     - Click + on the list-type field and create a group-type field
     - Click arrow button to reveal the nested group-type field
@@ -201,34 +121,13 @@ def test_create_group_type_field_nested_inside_list_type_field_in_outline_based_
     - A List-type field with nested Group-type filed is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_new_field_button.click()
     on_documents_insights_page.hubs_page.hub_page.list_radiobutton.click()
     with page.expect_response(f"**/api/hubs/{outline_hub_data["id"]}/abstract-fields") as resp_info:
@@ -247,22 +146,18 @@ def test_create_group_type_field_nested_inside_list_type_field_in_outline_based_
     expect(on_documents_insights_page.hubs_page.hub_page.fields_list_text_title).to_be_visible()
     on_documents_insights_page.hubs_page.hub_page.arrow_button.click()
     expect(on_documents_insights_page.hubs_page.hub_page.nested_group_label).to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_create_single_type_field_nested_inside_group_type_field_in_outline_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_single_type_field_nested_inside_group_type_field_in_outline_based_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully create a Single-type field nested inside the Group-type field for the outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form, select Group type and send it
     - Click + on the list-type field and create a single-type field
     - Click arrow button to reveal the nested single-type field
@@ -271,34 +166,13 @@ def test_create_single_type_field_nested_inside_group_type_field_in_outline_base
     - A Group-type field with nested Single-type filed is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_new_field_button.click()
     on_documents_insights_page.hubs_page.hub_page.group_radiobutton.click()
     with page.expect_response(f"**/api/hubs/{outline_hub_data["id"]}/abstract-fields") as resp_info:
@@ -316,22 +190,18 @@ def test_create_single_type_field_nested_inside_group_type_field_in_outline_base
     expect(on_documents_insights_page.hubs_page.hub_page.fields_list_text_title).to_be_visible()
     on_documents_insights_page.hubs_page.hub_page.arrow_button.click()
     expect(on_documents_insights_page.hubs_page.hub_page.nested_group_label).to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_delete_single_type_field_in_outline_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_single_type_field_in_outline_based_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully delete a Single-type field for the outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form and send it
     - Click the Delete button on the Single-type block
 
@@ -339,34 +209,13 @@ def test_delete_single_type_field_in_outline_based_hub(context_and_playwright):
     - A Single-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_new_field_button.click()
     with page.expect_response(f"**/api/hubs/{outline_hub_data["id"]}/abstract-fields") as resp_info:
         on_documents_insights_page.hubs_page.hub_page.save_button.click()
@@ -381,22 +230,18 @@ def test_delete_single_type_field_in_outline_based_hub(context_and_playwright):
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.no_fields_text).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.single_field_label_title).not_to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_delete_group_type_field_in_outline_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_group_type_field_in_outline_based_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully delete a Group-type field for the outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form, select Group type and send it
     - Click the Delete button on the Group-type block
 
@@ -404,34 +249,13 @@ def test_delete_group_type_field_in_outline_based_hub(context_and_playwright):
     - A Group-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_new_field_button.click()
     on_documents_insights_page.hubs_page.hub_page.group_radiobutton.click()
     with page.expect_response(f"**/api/hubs/{outline_hub_data["id"]}/abstract-fields") as resp_info:
@@ -447,22 +271,18 @@ def test_delete_group_type_field_in_outline_based_hub(context_and_playwright):
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.no_fields_text).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.list_group_field_label_title).not_to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_delete_list_type_field_in_outline_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_list_type_field_in_outline_based_hub(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully delete a List-type field for the outline based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form, select List type and send it
     - Click the Delete button on the Group-type block
 
@@ -470,34 +290,13 @@ def test_delete_list_type_field_in_outline_based_hub(context_and_playwright):
     - A List-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_new_field_button.click()
     on_documents_insights_page.hubs_page.hub_page.list_radiobutton.click()
     with page.expect_response(f"**/api/hubs/{outline_hub_data["id"]}/abstract-fields") as resp_info:
@@ -513,56 +312,31 @@ def test_delete_list_type_field_in_outline_based_hub(context_and_playwright):
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.no_fields_text).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.list_group_field_label_title).not_to_be_visible()
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_create_outline_document_template(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_outline_document_template(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully create outline document template
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Upload file
 
     Expected:
     - Outline template card is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     # Upload document
     with page.expect_response("**/api/outlines") as resp_info, \
             page.expect_response(f"**/api/hubs/smart/{outline_hub_data["id"]}/add-outline") as resp2_info, \
@@ -577,23 +351,18 @@ def test_create_outline_document_template(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.outline_template_switch).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.outline_template_meatball_menu).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.outline_template_footer).to_be_visible()
-    time.sleep(5)
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_rename_outline_template_card(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_rename_outline_template_card(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully rename outline document template
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Upload file
     - Open the Rename popup and update the name
 
@@ -601,34 +370,13 @@ def test_rename_outline_template_card(context_and_playwright):
     - Updated title of outline template card is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     # Upload document
     with page.expect_response("**/api/outlines") as resp_info, \
             page.expect_response(f"**/api/hubs/smart/{outline_hub_data["id"]}/add-outline") as add_outline_info, \
@@ -647,23 +395,18 @@ def test_rename_outline_template_card(context_and_playwright):
     assert resp_info.value.ok
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.outline_template_name).to_have_text("Update")
-    time.sleep(5)
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.outline_based
-def test_delete_outline_template_card(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_outline_template_card(context_and_playwright, outline_hub):
     """
     Verify that a user can successfully delete outline document template
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Upload file
     - Open the settings menu and delete the outline template card
 
@@ -671,34 +414,13 @@ def test_delete_outline_template_card(context_and_playwright):
     - Empty outline templates list is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the outline_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication_payload")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub()
+    # Create hub through the API and open its page
+    outline_hub_data = outline_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     # Upload document
     with page.expect_response("**/api/outlines") as resp_info, \
             page.expect_response(f"**/api/hubs/smart/{outline_hub_data["id"]}/add-outline") as add_outline_info, \
@@ -716,7 +438,3 @@ def test_delete_outline_template_card(context_and_playwright):
     assert resp_info.value.ok
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.outline_template_card).not_to_be_visible()
-    time.sleep(5)
-    # Delete created hub
-    response = delete_hub(playwright, outline_hub_data["id"], user_token)
-    assert response.ok
@@ -1,60 +1,33 @@
-import time
-
 import pytest
 from playwright.sync_api import expect
-from data.constants import DOMAIN_STAGE_URL, HUB_PAGE_VALUE_FIELDS_TITLE_TEXT, HUB_PAGE_VALUE_SINGLE_FIELD_NAME, \
+from data.constants import HUB_PAGE_VALUE_FIELDS_TITLE_TEXT, HUB_PAGE_VALUE_SINGLE_FIELD_NAME, \
     HUB_PAGE_VALUE_GROUP_FIELD_NAME, HUB_PAGE_VALUE_LIST_FIELD_NAME, HUB_PAGE_VALUE_NESTED_FIELD_NAME
-from pageObjects.homePage import HomePage
-from utilities.api.api_base import authenticate_with_user, delete_hub
-from utilities.data_processing import get_key_value_from_file
+from pageObjects.documentsInsightsPage import DocumentsInsightsPage
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_create_single_type_field_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_single_type_field_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully create a Single-type field for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form and send it
 
     Expected:
     - A Single-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     with page.expect_response(f"**/api/hubs/{value_hub_data["id"]}/abstract-fields") as resp_info:
@@ -64,58 +37,31 @@ def test_create_single_type_field_value_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.no_data_points_title_text).to_have_text(HUB_PAGE_VALUE_FIELDS_TITLE_TEXT)
     expect(on_documents_insights_page.hubs_page.hub_page.added_field).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.single_field).to_be_visible()
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_create_group_type_field_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_group_type_field_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully create a Group-type field for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form select Group type, enter name and send it
 
     Expected:
     - A Group-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     # Create group-type field
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_GROUP_FIELD_NAME)
@@ -129,58 +75,31 @@ def test_create_group_type_field_value_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.no_data_points_title_text).to_have_text(HUB_PAGE_VALUE_FIELDS_TITLE_TEXT)
     expect(on_documents_insights_page.hubs_page.hub_page.added_field).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.group_field).to_be_visible()
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_create_list_type_field_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_list_type_field_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully create a List-type field for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form select List type, enter name and send it
 
     Expected:
     - A List-type field block is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_LIST_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.list_radiobutton.click()
@@ -193,23 +112,18 @@ def test_create_list_type_field_value_based_hub(context_and_playwright):
     expect(on_documents_insights_page.hubs_page.hub_page.no_data_points_title_text).to_have_text(HUB_PAGE_VALUE_FIELDS_TITLE_TEXT)
     expect(on_documents_insights_page.hubs_page.hub_page.added_field).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.list_field).to_be_visible()
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_create_group_type_field_nested_inside_list_type_field_in_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_create_group_type_field_nested_inside_list_type_field_in_value_based_hub(context_and_playwright, value_hub):
     """
      Verify that a user can successfully create a Group-type field nested inside the List-type field for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form select List type, enter name and send it
     - Click + on the list-type field and create a group-type field
     - Click arrow button to reveal the nested group-type field
@@ -218,35 +132,13 @@ def test_create_group_type_field_nested_inside_list_type_field_in_value_based_hu
     - A List-type field with nested Group-type filed is displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_LIST_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.list_radiobutton.click()
@@ -268,23 +160,18 @@ def test_create_group_type_field_nested_inside_list_type_field_in_value_based_hu
     on_documents_insights_page.hubs_page.hub_page.arrow_button.click()
     # expect(on_documents_insights_page.hubs_page.hub_page.nested_group_label).to_be_visible()
     expect(on_documents_insights_page.hubs_page.hub_page.nested_field).to_be_visible()
-    time.sleep(3)
-    # Delete created hub
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_delete_single_type_field_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_single_type_field_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully delete a Single-type field for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form and send it
     - Click the Delete button on the Single-type field
 
@@ -292,35 +179,13 @@ def test_delete_single_type_field_value_based_hub(context_and_playwright):
     - A Single-type field block is not displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     with page.expect_response(f"**/api/hubs/{value_hub_data["id"]}/abstract-fields") as resp_info:
@@ -332,23 +197,18 @@ def test_delete_single_type_field_value_based_hub(context_and_playwright):
     assert resp_info.value.ok
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.import_data_points_in_json_format_button).to_be_visible()
-    time.sleep(3)
-    # Delete created hub
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_delete_group_type_field_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_group_type_field_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully delete a Group-type field on the value based hub page
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form select Group type, enter name and send it
     - Click the Delete button on the Group-type field
 
@@ -356,35 +216,13 @@ def test_delete_group_type_field_value_based_hub(context_and_playwright):
     - A Group-type field block is not displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_GROUP_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.group_radiobutton.click()
@@ -393,30 +231,25 @@ def test_delete_group_type_field_value_based_hub(context_and_playwright):
         on_documents_insights_page.hubs_page.hub_page.save_button.click()
     assert resp_info.value.ok
     assert resp2_info.value.ok
-    field_id = response.json()["id"]
+    field_id = resp_info.value.json()["id"]
     on_documents_insights_page.hubs_page.hub_page.delete_group_type_field_icon.click()
     with page.expect_response(f"**/api/hubs/{value_hub_data["id"]}/abstract-fields/{field_id}") as resp_info:
         on_documents_insights_page.hubs_page.hub_page.delete_button.click()
     assert resp_info.value.ok
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.import_data_points_in_json_format_button).to_be_visible()
-    time.sleep(3)
-    # Delete created hub
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_delete_list_type_field_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_delete_list_type_field_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully delete a List-type field for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form select List type, enter name and send it
     - Click the Delete button on the Group-type field
 
@@ -424,35 +257,13 @@ def test_delete_list_type_field_value_based_hub(context_and_playwright):
     - A List-type field block is not displayed
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_LIST_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.list_radiobutton.click()
@@ -461,30 +272,25 @@ def test_delete_list_type_field_value_based_hub(context_and_playwright):
         on_documents_insights_page.hubs_page.hub_page.save_button.click()
     assert resp_info.value.ok
     assert resp2_info.value.ok
-    field_id = response.json()["id"]
+    field_id = resp_info.value.json()["id"]
     on_documents_insights_page.hubs_page.hub_page.delete_group_type_field_icon.click()
     with page.expect_response(f"**/api/hubs/{value_hub_data["id"]}/abstract-fields/{field_id}") as resp_info:
         on_documents_insights_page.hubs_page.hub_page.delete_button.click()
     assert resp_info.value.ok
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.import_data_points_in_json_format_button).to_be_visible()
-    time.sleep(3)
-    # Delete created hub
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_check_uncheck_searchable_checkbox_in_create_single_type_field_form_on_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_check_uncheck_searchable_checkbox_in_create_single_type_field_form_on_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully create a Single-type field with searchable checkbox active for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form
     - Select Searchable checkbox and send the form
     - Click Edit button on the created field
@@ -493,35 +299,13 @@ def test_check_uncheck_searchable_checkbox_in_create_single_type_field_form_on_v
     - Searchable checkbox is checked
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.searchable_checkbox.click()
@@ -545,23 +329,18 @@ def test_check_uncheck_searchable_checkbox_in_create_single_type_field_form_on_v
         HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.searchable_checkbox).not_to_be_checked()
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_check_uncheck_required_checkbox_in_create_single_type_field_form_on_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_check_uncheck_required_checkbox_in_create_single_type_field_form_on_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully create a Single-type field with searchable checkbox active for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form
     - Select Searchable checkbox and send the form
     - Click Edit button on the created field
@@ -570,35 +349,13 @@ def test_check_uncheck_required_checkbox_in_create_single_type_field_form_on_val
     - Searchable checkbox is checked
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.required_checkbox.click()
@@ -622,23 +379,18 @@ def test_check_uncheck_required_checkbox_in_create_single_type_field_form_on_val
         HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.required_checkbox).not_to_be_checked()
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_check_uncheck_qna_checkbox_in_advanced_section_when_create_single_type_field_form_on_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_check_uncheck_qna_checkbox_in_advanced_section_when_create_single_type_field_form_on_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully create a Single-type field with searchable checkbox active for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form
     - Select Searchable checkbox and send the form
     - Click Edit button on the created field
@@ -647,35 +399,13 @@ def test_check_uncheck_qna_checkbox_in_advanced_section_when_create_single_type_
     - Searchable checkbox is checked
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.advanced_section.click()
@@ -702,23 +432,18 @@ def test_check_uncheck_qna_checkbox_in_advanced_section_when_create_single_type_
     on_documents_insights_page.hubs_page.hub_page.advanced_section.click()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.qna_checkbox).not_to_be_checked()
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 # NEED SCRIPT
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_check_uncheck_script_checkbox_in_advanced_section_when_create_single_type_field_form_on_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_check_uncheck_script_checkbox_in_advanced_section_when_create_single_type_field_form_on_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully create a Single-type field with searchable checkbox active for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form
     - Select Searchable checkbox and send the form
     - Click Edit button on the created field
@@ -727,35 +452,13 @@ def test_check_uncheck_script_checkbox_in_advanced_section_when_create_single_ty
     - Searchable checkbox is checked
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub_data = value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.advanced_section.click()
@@ -784,23 +487,18 @@ def test_check_uncheck_script_checkbox_in_advanced_section_when_create_single_ty
     on_documents_insights_page.hubs_page.hub_page.advanced_section.click()
     # Verification
     expect(on_documents_insights_page.hubs_page.hub_page.script_checkbox).not_to_be_checked()
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
 
 
 @pytest.mark.hubs
 @pytest.mark.value_based
-def test_verification_settings_when_create_single_type_field_form_on_value_based_hub(context_and_playwright):
+@pytest.mark.user_profile("support")
+def test_verification_settings_when_create_single_type_field_form_on_value_based_hub(context_and_playwright, value_hub):
     """
     Verify that a user can successfully create a Single-type field with searchable checkbox active for the value based hub
 
     Steps:
-    - Load user credentials and payload from the JSON file.
-    - Send login request and set cookie
-    - Open home page and navigate to the 'Documents Insights' page
-    - Open, fill in and send the 'Create a hub' form
+    - Open a context logged in as the support user
+    - Create a hub through the API and open the hub page
     - Open the 'Create a new field' form
     - Select Searchable checkbox and send the form
     - Click Edit button on the created field
@@ -809,35 +507,13 @@ def test_verification_settings_when_create_single_type_field_form_on_value_based
     - Searchable checkbox is checked
 
     Post-conditions:
-    - Get hub id and send 'Delete' request
+    - Created hub is deleted by the value_hub fixture
     """
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Get test_smth data from files
-    authentication_payload = get_key_value_from_file("payloads.json", "authentication")
-    support_data = get_key_value_from_file("user_credentials.json", "support")
-    authentication_payload["email"] = support_data["email"]
-    authentication_payload["password"] = support_data["password"]
-    # Get user token to set the cookies
-    response = authenticate_with_user(playwright, authentication_payload)
-    user_token = response.json()["accessToken"]
-    # Set the cookie with the token
-    context.add_cookies([{
-        "name": "access-token-plextera",  # or "auth_token", depending on your app
-        "value": user_token,
-        "domain": "studio.dev.plextera.com",
-        "path": "/",
-        "httpOnly": False,
-        "secure": True,
-        "sameSite": "Lax"
-    }])
-    # Steps
-    page.goto(DOMAIN_STAGE_URL)
-    on_home_page = HomePage(page)
-    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page()
-    on_documents_insights_page.hubs_button.click()
-    # Create hub
-    value_hub_data = on_documents_insights_page.hubs_page.create_value_based_hub(False)
+    # Create hub through the API and open its page
+    value_hub(page)
+    on_documents_insights_page = DocumentsInsightsPage(page)
     on_documents_insights_page.hubs_page.hub_page.add_data_points_button.click()
     on_documents_insights_page.hubs_page.hub_page.field_name_input.fill(HUB_PAGE_VALUE_SINGLE_FIELD_NAME)
     on_documents_insights_page.hubs_page.hub_page.verify_button.click()
@@ -867,7 +543,3 @@ def test_verification_settings_when_create_single_type_field_form_on_value_based
     # on_documents_insights_page.hubs_page.hub_page.advanced_section.click()
     # # Verification
     # expect(on_documents_insights_page.hubs_page.hub_page.script_checkbox).not_to_be_checked()
-    # Delete created hub
-    time.sleep(3)
-    response = delete_hub(playwright, value_hub_data["id"], user_token)
-    assert response.ok
\ No newline at end of file
@@ -5,9 +5,10 @@ from pageObjects.homePage import HomePage
 from pageObjects.registerCompanyOwnerPage import RegisterCompanyOwnerPage
 from pageObjects.registerCompanyUserPage import RegisterCompanyUserPage
 from utilities.api.api_base import authenticate_with_user
-from utilities.api.api_temp_email import wait_for_email_and_read, delete_emails_in_inbox
+from utilities.api.api_temp_email import wait_for_matching_email, delete_emails_in_inbox
 from utilities.data_processing import get_key_value_from_file, get_register_link_from_the_email_body
 import time
+from datetime import datetime, timezone
 
 from utilities.utils import authenticate_with_user_profile
 
@@ -63,14 +64,18 @@ def test_invite_and_register_new_owner(context_and_playwright):
     on_home_page = HomePage(page)
     on_admin_console_page = on_home_page.sidebar.navigate_to_admin_console_page()
     on_admin_console_page.sidebar_companies_tab.click()
+    requested_at = datetime.now(timezone.utc)
     on_admin_console_page.send_invite_new_company_owner_form(registration_owner_data["email"])
     # Verification Success popup is present
     expect(on_admin_console_page.companies_tab.success_popup.title).to_have_text(SUCCESS_POPUP_TITLE)
     # Steps to get register link from email
-    body = wait_for_email_and_read(
+    body = wait_for_matching_email(
         playwright,
         temp_email_data["email_id"],
-        temp_email_data["x_api_key"]
+        temp_email_data["x_api_key"],
+        recipient=registration_owner_data["email"],
+        link_type="register",
+        received_after=requested_at
     )
     link = get_register_link_from_the_email_body(body)
     # Steps to register a new owner
@@ -152,14 +157,18 @@ def test_invite_and_register_new_company_administrator(context_and_playwright):
     on_admin_console_page.open_companies_tab.click()
     on_company_page = on_admin_console_page.companies_tab.navigate_to_company_page("automation_testing")
     on_company_page.invite_company_user_button.click()
+    requested_at = datetime.now(timezone.utc)
     on_company_page.send_invite_company_administrator_form(registration_company_administrator_data["email"])
     # Verification Success popup is present
     expect(on_company_page.popups).to_have_text(SUCCESS_POPUP_TITLE)
     # Steps to get register link from email
-    body = wait_for_email_and_read(
+    body = wait_for_matching_email(
         playwright,
         temp_email_data["email_id"],
-        temp_email_data["x_api_key"]
+        temp_email_data["x_api_key"],
+        recipient=registration_company_administrator_data["email"],
+        link_type="register",
+        received_after=requested_at
     )
     link = get_register_link_from_the_email_body(body)
     # Steps to register a new owner
@@ -240,14 +249,18 @@ def test_invite_and_register_new_company_user(context_and_playwright):
     on_admin_console_page.open_companies_tab.click()
     on_company_page = on_admin_console_page.companies_tab.navigate_to_company_page("automation_testing")
     on_company_page.invite_company_user_button.click()
+    requested_at = datetime.now(timezone.utc)
     on_company_page.send_invite_company_user_form(registration_company_user_data["email"])
     # Verification Success popup is present
     expect(on_company_page.popups).to_have_text(SUCCESS_POPUP_TITLE)
     # Steps to get register link from email
-    body = wait_for_email_and_read(
+    body = wait_for_matching_email(
         playwright,
         temp_email_data["email_id"],
-        temp_email_data["x_api_key"]
+        temp_email_data["x_api_key"],
+        recipient=registration_company_user_data["email"],
+        link_type="register",
+        received_after=requested_at
     )
     link = get_register_link_from_the_email_body(body)
     # Steps to register a new owner
@@ -328,14 +341,18 @@ def test_invite_and_register_new_support_user(context_and_playwright):
     on_admin_console_page.open_companies_tab.click()
     on_company_page = on_admin_console_page.companies_tab.navigate_to_company_page("automation_testing")
     on_company_page.invite_company_user_button.click()
+    requested_at = datetime.now(timezone.utc)
     on_company_page.send_invite_company_user_form(registration_support_user_data["email"])
     # Verification Success popup is present
     expect(on_company_page.popups).to_have_text(SUCCESS_POPUP_TITLE)
     # Steps to get register link from email
-    body = wait_for_email_and_read(
+    body = wait_for_matching_email(
         playwright,
         temp_email_data["email_id"],
-        temp_email_data["x_api_key"]
+        temp_email_data["x_api_key"],
+        recipient=registration_support_user_data["email"],
+        link_type="register",
+        received_after=requested_at
     )
     link = get_register_link_from_the_email_body(body)
     # Steps to register a new owner
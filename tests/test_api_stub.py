@@ -0,0 +1,181 @@
+import pytest
+from playwright.sync_api import expect
+
+from pageObjects.homePage import HomePage
+from utilities.api.api_base import authenticate_with_user, get_hub, delete_hub, get_organization_list
+from utilities.api.api_client import ocrg_api, plextera_api
+from utilities.auth_state import get_cached_user_token, get_token_expiry
+from utilities.stubs.api_stub import SCRUBBED_EMAIL, get_cassette_key, scrub
+from utilities.teardown_registry import TeardownRegistry
+from utilities.utils import create_hub
+
+
+@pytest.fixture
+def stub_token(api_stubs, playwright_session):
+    """
+    Logs in to the Plextera API stand-in. Tests that use it are skipped when the run is not started
+    with --api-stub replay.
+
+    :return: user token issued by the stand-in
+    """
+    if not api_stubs or api_stubs["plextera"].mode != "replay":
+        pytest.skip("Needs the local API stand-ins, run with --api-stub replay")
+    response = authenticate_with_user(playwright_session, {"email": "support@example.com", "password": "password"})
+    assert response.ok
+    return response.json()["accessToken"]
+
+
+def test_hub_is_created_and_deleted_through_the_api(playwright_session, stub_token):
+    """
+    Verify that the API helpers create, read and delete a hub
+
+    Steps:
+    - Create an outline hub
+    - Get the hub
+    - Delete the hub and get it again
+
+    Expected:
+    - The token issued by the stand-in has an expiration time
+    - The created hub is returned with its name
+    - The deleted hub is not found
+    """
+    assert get_token_expiry(stub_token)
+    hub_data = create_hub(playwright_session, stub_token, "create_outline_hub_payload")
+    response = get_hub(playwright_session, hub_data["id"], stub_token)
+    assert response.ok
+    assert response.json()["name"] == hub_data["name"]
+    response = delete_hub(playwright_session, hub_data["id"], stub_token)
+    assert response.ok
+    response = get_hub(playwright_session, hub_data["id"], stub_token)
+    assert response.status == 404
+
+
+def test_hub_is_renamed_through_the_api(playwright_session, stub_token):
+    """
+    Verify that a hub update changes the hub kept by the stand-in
+
+    Steps:
+    - Create an outline hub
+    - Rename it with PUT and disable it with PATCH
+    - Get the hub
+
+    Expected:
+    - The hub is returned with the new name and the disabled flag, under the same ID
+    """
+    hub_data = create_hub(playwright_session, stub_token, "create_outline_hub_payload")
+    response = ocrg_api(playwright_session, stub_token).put(f"/api/hubs/{hub_data['id']}",
+                                                            data={**hub_data, "name": "update outline hub"})
+    assert response.ok
+    response = ocrg_api(playwright_session, stub_token).request("PATCH", f"/api/hubs/{hub_data['id']}",
+                                                                data={"enabled": False})
+    assert response.ok
+    response = get_hub(playwright_session, hub_data["id"], stub_token)
+    assert response.ok
+    assert response.json()["id"] == hub_data["id"]
+    assert response.json()["name"] == "update outline hub"
+    assert response.json()["enabled"] is False
+    assert delete_hub(playwright_session, hub_data["id"], stub_token).ok
+
+
+def test_hub_default_name_is_replayed_from_the_cassette(api_stubs, playwright_session, stub_token):
+    """
+    Verify that the default name request of the hub wizard is not taken for a request of a hub by ID
+
+    Steps:
+    - Put a default name response into the OCRG cassette
+    - Get the default hub name
+
+    Expected:
+    - The recorded default name is returned
+    """
+    api_stubs["ocrg"].cassette[get_cassette_key("GET", "/api/hubs/default-name", [])] = {
+        "status": 200,
+        "content_type": "application/json",
+        "body": {"name": "Hub 7"},
+    }
+    response = ocrg_api(playwright_session, stub_token).get("/api/hubs/default-name")
+    assert response.ok
+    assert response.json()["name"] == "Hub 7"
+
+
+def test_teardown_registry_deletes_hubs_in_the_stand_in(api_stubs, playwright_session, stub_token):
+    """
+    Verify that hubs registered in the teardown registry are deleted
+
+    Steps:
+    - Create an outline hub and register it
+    - Wait for the registry
+
+    Expected:
+    - The deletion succeeded and the hub is removed from the stand-in state
+    """
+    hub_data = create_hub(playwright_session, stub_token, "create_outline_hub_payload")
+    registry = TeardownRegistry(results=[])
+    registry.register_hub(hub_data["id"], stub_token)
+    results = registry.wait()
+    assert results[0]["error"] is None
+    assert hub_data["id"] not in api_stubs["ocrg"].state["hubs"]
+
+
+def test_recorded_response_is_replayed_without_secrets(api_stubs, playwright_session, stub_token):
+    """
+    Verify that a recorded response is replayed with the email scrubbed and a fresh token
+
+    Steps:
+    - Put a scrubbed response into the Plextera cassette
+    - Send the matching request with another ID
+
+    Expected:
+    - The email is replaced with a placeholder
+    - The token is replaced with a token issued by the stand-in
+    """
+    recorded_body = {"email": "real.user@plextera.com", "accessToken": "eyJhbGciOi.eyJzdWIiOi.signature"}
+    api_stubs["plextera"].cassette[get_cassette_key("GET", "/api/account-service/users/1", [])] = {
+        "status": 200,
+        "content_type": "application/json",
+        "body": scrub(recorded_body),
+    }
+    response = plextera_api(playwright_session, stub_token).get("/api/account-service/users/42")
+    assert response.ok
+    assert response.json()["email"] == SCRUBBED_EMAIL
+    assert get_token_expiry(response.json()["accessToken"])
+    response = get_organization_list(playwright_session, stub_token)
+    assert response.ok
+
+
+# Checked before the setup, so no browser is launched when the test is skipped
+@pytest.mark.skipif("not config.getoption('frontend_only')",
+                    reason="Needs the frontend routed to the API stand-ins, run with --frontend-only")
+@pytest.mark.user_profile("support")
+def test_hub_wizard_completes_frontend_only(api_stubs, context_and_playwright):
+    """
+    Verify that the real frontend creates an outline hub when its backend requests are answered by the stand-ins
+
+    Steps:
+    - Open a context logged in as the support user
+    - Open the 'Documents Insights' page by its URL
+    - Open, fill in and send the 'Create a hub' form
+    - Navigate to the Hubs page
+
+    Expected:
+    - The default hub name is served and the hub is created in the stand-in state
+    - Outline hub card is displayed on the Hubs page
+
+    Post-conditions:
+    - Created hub is deleted from the stand-in
+    """
+    context, playwright = context_and_playwright
+    page = context.new_page()
+    # Steps
+    on_home_page = HomePage(page)
+    on_documents_insights_page = on_home_page.sidebar.navigate_to_documents_insights_page(fast=True)
+    on_documents_insights_page.hubs_button.click()
+    outline_hub_data = on_documents_insights_page.hubs_page.create_outline_based_hub(False)
+    # Verification
+    assert outline_hub_data["id"] in api_stubs["ocrg"].state["hubs"]
+    expect(on_documents_insights_page.hubs_page.hub_page.edit_hub_name).to_be_visible()
+    on_documents_insights_page.hubs_page.hub_page.navigate_to_hubs_page()
+    expect(on_documents_insights_page.hubs_page.hub_card).to_be_visible()
+    # Delete created hub
+    response = delete_hub(playwright, outline_hub_data["id"], get_cached_user_token(playwright, "support"))
+    assert response.ok
@@ -1,10 +1,11 @@
 from playwright.sync_api import expect
+from datetime import datetime, timezone
 
 from data.constants import DOMAIN_STAGE_URL, FORGOT_PASSWORD_PAGE_ERROR_EMPTY_EMAIL, \
     FORGOT_PASSWORD_PAGE_ERROR_INVALID_FORMAT, FORGOT_PASSWORD_PAGE_SUCCESS, FORGOT_PASSWORD_PAGE_DESCRIPTION_PART_ONE, \
     FORGOT_PASSWORD_PAGE_DESCRIPTION_PART_TWO, FORGOT_PASSWORD_LETTER_LINK_PART
 from pageObjects.loginPage import LoginPage
-from utilities.api.api_temp_email import wait_for_email_and_read, delete_emails_in_inbox
+from utilities.api.api_temp_email import wait_for_matching_email, delete_emails_in_inbox
 from utilities.data_processing import get_create_new_password_link_from_the_email_body, get_key_value_from_file
 
 
@@ -41,6 +42,7 @@ def test_send_forgot_password_form(context_and_playwright):
     page.goto(DOMAIN_STAGE_URL)
     on_login_page = LoginPage(page)
     on_forgot_password_page = on_login_page.navigate_to_forgot_password_page()
+    requested_at = datetime.now(timezone.utc)
     on_forgot_password_page.send_forgot_password_form(temp_email_data["email"])
     # Verification
     expect(on_forgot_password_page.page_title).to_have_text(FORGOT_PASSWORD_PAGE_SUCCESS)
@@ -48,7 +50,9 @@ def test_send_forgot_password_form(context_and_playwright):
     expect(on_forgot_password_page.description_text).to_have_text(FORGOT_PASSWORD_PAGE_DESCRIPTION_PART_ONE)
     expect(on_forgot_password_page.resend_reset_email_text).to_have_text(FORGOT_PASSWORD_PAGE_DESCRIPTION_PART_TWO)
     # Steps to get update password link from email
-    body = wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
+    body = wait_for_matching_email(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"],
+                                   recipient=temp_email_data["email"], link_type="create_password",
+                                   received_after=requested_at)
     link = get_create_new_password_link_from_the_email_body(body)
     assert link.startswith(FORGOT_PASSWORD_LETTER_LINK_PART)
     # Delete all emails in the inbox
@@ -162,6 +166,7 @@ def test_navigate_to_the_login_page_successful_message_section(context_and_playw
     page.goto(DOMAIN_STAGE_URL)
     on_login_page = LoginPage(page)
     on_forgot_password_page = on_login_page.navigate_to_forgot_password_page()
+    requested_at = datetime.now(timezone.utc)
     on_forgot_password_page.send_forgot_password_form(temp_email_data["email"])
     # Verification
     expect(on_forgot_password_page.page_title).to_have_text(FORGOT_PASSWORD_PAGE_SUCCESS)
@@ -173,7 +178,8 @@ def test_navigate_to_the_login_page_successful_message_section(context_and_playw
     expect(on_login_page.password_input).to_be_visible()
     expect(on_login_page.login_button).to_be_visible()
     expect(on_login_page.forgot_password_button).to_be_visible()
-    # Delete all emails in the inbox
-    wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
+    # Delete all emails in the inbox once the email of the test is received
+    wait_for_matching_email(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"],
+                            recipient=temp_email_data["email"], received_after=requested_at)
     response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
     assert response.ok
@@ -1,3 +1,4 @@
+import pytest
 from playwright.sync_api import Playwright, expect
 
 from data.constants import LOGIN_PAGE_TITLE, DOCUMENTS_INSIGHTS_TITLE, WORKFLOWS_EMPTY_STATE_TITLE, \
@@ -6,6 +7,9 @@ from pageObjects.homePage import HomePage
 from pageObjects.loginPage import LoginPage
 from utilities.utils import authenticate_with_user_profile
 
+# The tests check texts, visibility and navigation, never images or fonts
+pytestmark = pytest.mark.block_requests("no-media")
+
 
 def test_log_out(context_and_playwright):
     """
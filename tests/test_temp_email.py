@@ -0,0 +1,87 @@
+import pytest
+from datetime import datetime, timezone, timedelta
+
+from data.constants import FORGOT_PASSWORD_LETTER_LINK_PART
+from utilities.api.api_temp_email import create_new_email_address, wait_for_email_and_read, delete_email, \
+    delete_emails_in_inbox, count_emails, wait_for_matching_email
+from utilities.data_processing import get_register_link_from_the_email_body, \
+    get_create_new_password_link_from_the_email_body
+
+REGISTER_LINK = "https://studio.dev.plextera.com/register-invite?token=register-token"
+CREATE_PASSWORD_LINK = FORGOT_PASSWORD_LETTER_LINK_PART + "create-password-token"
+
+
+@pytest.fixture
+def stub_inbox(mail_stub, playwright_session):
+    """
+    Creates an inbox in the local MailSlurp stand-in and deletes it after the test.
+    Tests that use it are skipped when the run is not started with --mail-stub.
+
+    :return: inbox email address and inbox ID
+    """
+    if mail_stub is None:
+        pytest.skip("Needs the local MailSlurp stand-in, run with --mail-stub")
+    email_address, inbox_id = create_new_email_address(playwright_session, "stub-api-key")
+    yield email_address, inbox_id
+    delete_email(playwright_session, inbox_id, "stub-api-key")
+
+
+def test_register_link_is_read_from_the_latest_email(mail_stub, playwright_session, stub_inbox):
+    """
+    Verify that the register link is read from the latest received email
+
+    Steps:
+    - Deliver an invitation email to the stand-in inbox
+    - Wait for the email and read it
+    - Get the register link from the email body
+
+    Expected:
+    - The link is the one sent in the email
+    """
+    _, inbox_id = stub_inbox
+    mail_stub.deliver(inbox_id, "Invitation", f'<a href="{REGISTER_LINK}">Register</a>')
+    body = wait_for_email_and_read(playwright_session, inbox_id, "stub-api-key")
+    assert get_register_link_from_the_email_body(body) == REGISTER_LINK
+
+
+def test_matching_email_is_selected_by_recipient_and_link_type(mail_stub, playwright_session, stub_inbox):
+    """
+    Verify that the email waiter skips old emails and emails with other links
+
+    Steps:
+    - Deliver an old create password email
+    - Deliver an invitation email and a new create password email
+    - Wait for a create password email received after the old one
+
+    Expected:
+    - The new create password email is returned
+    """
+    email_address, inbox_id = stub_inbox
+    old_email = mail_stub.deliver(email_address, "Old reset", f'<a href="{CREATE_PASSWORD_LINK}-old">Reset</a>')
+    old_email["createdAt"] = (datetime.now(timezone.utc) - timedelta(minutes=1)).isoformat()
+    requested_at = datetime.now(timezone.utc)
+    mail_stub.deliver(email_address, "Invitation", f'<a href="{REGISTER_LINK}">Register</a>')
+    mail_stub.deliver(email_address, "Reset", f'<a href="{CREATE_PASSWORD_LINK}">Reset</a>')
+    body = wait_for_matching_email(playwright_session, inbox_id, "stub-api-key", recipient=email_address,
+                                   link_type="create_password", received_after=requested_at, timeout=5)
+    assert get_create_new_password_link_from_the_email_body(body) == CREATE_PASSWORD_LINK
+
+
+def test_empty_inbox_is_counted_without_waiting(mail_stub, playwright_session, stub_inbox):
+    """
+    Verify that the inbox can be emptied and counted without waiting for new emails
+
+    Steps:
+    - Deliver an email
+    - Delete all emails in the inbox
+    - Count the emails
+
+    Expected:
+    - No emails are in the inbox
+    """
+    _, inbox_id = stub_inbox
+    mail_stub.deliver(inbox_id, "Invitation", f'<a href="{REGISTER_LINK}">Register</a>')
+    assert count_emails(playwright_session, inbox_id, "stub-api-key") == 1
+    response = delete_emails_in_inbox(playwright_session, inbox_id, "stub-api-key")
+    assert response.ok
+    assert count_emails(playwright_session, inbox_id, "stub-api-key") == 0
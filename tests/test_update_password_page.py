@@ -1,10 +1,10 @@
 from playwright.sync_api import expect
-from datetime import datetime
+from datetime import datetime, timezone
 from data.constants import DOMAIN_STAGE_URL, HOME_PAGE_USER_TITLE, ERROR_TEXT_PASSWORD_LENGTH_MIN, \
     ERROR_TEXT_PASSWORD_DIFFERS, ERROR_TEXT_PASSWORD_SAME_WITH_CURRENT
 from pageObjects.loginPage import LoginPage
 from pageObjects.updatePasswordPage import UpdatePasswordPage
-from utilities.api.api_temp_email import wait_for_email_and_read, delete_emails_in_inbox
+from utilities.api.api_temp_email import wait_for_matching_email, delete_emails_in_inbox
 from utilities.data_processing import get_create_new_password_link_from_the_email_body, get_key_value_from_file, \
     write_new_password_to_temp_email
 
@@ -43,10 +43,8 @@ def test_send_update_password(context_and_playwright):
     # Set the browser
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Delete inbox of email if there are letters
-    wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    assert response.ok
+    # Only emails received after this moment belong to the test
+    requested_at = datetime.now(timezone.utc)
     # Steps to send the forgot password form
     page.goto(DOMAIN_STAGE_URL)
     on_login_page = LoginPage(page)
@@ -55,7 +53,9 @@ def test_send_update_password(context_and_playwright):
     # Verification
     on_forgot_password_page.back_to_login_button.is_visible()
     # Steps to get update password link from email
-    body = wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
+    body = wait_for_matching_email(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"],
+                                   recipient=temp_email_data["email"], link_type="create_password",
+                                   received_after=requested_at)
     link = get_create_new_password_link_from_the_email_body(body)
     # Delete all emails in the inbox
     response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
@@ -98,10 +98,8 @@ def test_error_message_is_displayed_when_invalid_value_is_entered_in_the_new_pas
     # Set the browser
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Delete inbox of email if there are letters
-    wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    assert response.ok
+    # Only emails received after this moment belong to the test
+    requested_at = datetime.now(timezone.utc)
     # Steps to send the forgot password form
     page.goto(DOMAIN_STAGE_URL)
     on_login_page = LoginPage(page)
@@ -110,7 +108,9 @@ def test_error_message_is_displayed_when_invalid_value_is_entered_in_the_new_pas
     # Verification
     on_forgot_password_page.back_to_login_button.is_visible()
     # Steps to get update password link from email
-    body = wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
+    body = wait_for_matching_email(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"],
+                                   recipient=temp_email_data["email"], link_type="create_password",
+                                   received_after=requested_at)
     link = get_create_new_password_link_from_the_email_body(body)
     # Delete all emails in the inbox
     response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
@@ -151,10 +151,8 @@ def test_error_message_is_displayed_when_empty_value_is_entered_in_the_new_passw
     # Set the browser
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Delete inbox of email if there are letters
-    wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    assert response.ok
+    # Only emails received after this moment belong to the test
+    requested_at = datetime.now(timezone.utc)
     # Steps to send the forgot password form
     page.goto(DOMAIN_STAGE_URL)
     on_login_page = LoginPage(page)
@@ -163,7 +161,9 @@ def test_error_message_is_displayed_when_empty_value_is_entered_in_the_new_passw
     # Verification
     on_forgot_password_page.back_to_login_button.is_visible()
     # Steps to get update password link from email
-    body = wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
+    body = wait_for_matching_email(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"],
+                                   recipient=temp_email_data["email"], link_type="create_password",
+                                   received_after=requested_at)
     link = get_create_new_password_link_from_the_email_body(body)
     # Delete all emails in the inbox
     response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
@@ -203,10 +203,8 @@ def test_error_message_is_displayed_when_password_value_are_different(context_an
     # Set the browser
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Delete inbox of email if there are letters
-    wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    assert response.ok
+    # Only emails received after this moment belong to the test
+    requested_at = datetime.now(timezone.utc)
     # Steps to send the forgot password form
     page.goto(DOMAIN_STAGE_URL)
     on_login_page = LoginPage(page)
@@ -215,7 +213,9 @@ def test_error_message_is_displayed_when_password_value_are_different(context_an
     # Verification
     on_forgot_password_page.back_to_login_button.is_visible()
     # Steps to get update password link from email
-    body = wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
+    body = wait_for_matching_email(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"],
+                                   recipient=temp_email_data["email"], link_type="create_password",
+                                   received_after=requested_at)
     link = get_create_new_password_link_from_the_email_body(body)
     # Delete all emails in the inbox
     response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
@@ -257,10 +257,8 @@ def test_error_message_is_displayed_when_current_password_is_entered(context_and
     # Set the browser
     context, playwright = context_and_playwright
     page = context.new_page()
-    # Delete inbox of email if there are letters
-    wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
-    assert response.ok
+    # Only emails received after this moment belong to the test
+    requested_at = datetime.now(timezone.utc)
     # Steps to send the forgot password form
     page.goto(DOMAIN_STAGE_URL)
     on_login_page = LoginPage(page)
@@ -269,7 +267,9 @@ def test_error_message_is_displayed_when_current_password_is_entered(context_and
     # Verification
     on_forgot_password_page.back_to_login_button.is_visible()
     # Steps to get update password link from email
-    body = wait_for_email_and_read(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
+    body = wait_for_matching_email(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"],
+                                   recipient=temp_email_data["email"], link_type="create_password",
+                                   received_after=requested_at)
     link = get_create_new_password_link_from_the_email_body(body)
     # Delete all emails in the inbox
     response = delete_emails_in_inbox(playwright, temp_email_data["inbox_id"], temp_email_data["x_api_key"])
@@ -0,0 +1,144 @@
+from playwright.sync_api import Playwright, APIRequestContext
+
+from data.constants import PLEXTERA_STAGE_API_URL, OCRG_STAGE_API_URL
+
+MAILSLURP_API_URL = "https://api.mailslurp.com"
+
+# Base URL of every API. Can be pointed to a local stand-in, see utilities/stubs
+api_base_urls = {
+    "plextera": PLEXTERA_STAGE_API_URL,
+    "ocrg": OCRG_STAGE_API_URL,
+    "mailslurp": MAILSLURP_API_URL,
+}
+
+# One long-lived request context per Playwright instance and base URL
+_request_contexts = {}
+# One client per Playwright instance, base URL and credentials
+_api_clients = {}
+
+
+class ApiClient:
+    """
+    Sends API requests through a shared request context with default headers.
+
+    Clients are created with plextera_api, ocrg_api and mailslurp_api and are cached,
+    so the connection to the server and the default headers are reused between calls.
+    """
+
+    def __init__(self, request_context: APIRequestContext, headers=None):
+        """
+        :param request_context: Shared Playwright APIRequestContext
+        :param headers: Headers added to every request sent by the client
+        """
+        self.request_context = request_context
+        self.headers = headers or {}
+
+    def request(self, method, url, headers=None, **kwargs):
+        return self.request_context.fetch(url, method=method, headers={**self.headers, **(headers or {})}, **kwargs)
+
+    def get(self, url, **kwargs):
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url, **kwargs):
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url, **kwargs):
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url, **kwargs):
+        return self.request("DELETE", url, **kwargs)
+
+
+def get_request_context(playwright: Playwright, base_url):
+    """
+    Returns the shared request context for the base URL, creating it on the first call
+
+    :param playwright: a fixture
+    :param base_url: API base URL
+    :return: APIRequestContext
+    """
+    key = (id(playwright), base_url)
+    if key not in _request_contexts:
+        _request_contexts[key] = playwright.request.new_context(base_url=base_url)
+    return _request_contexts[key]
+
+
+def get_api_client(playwright: Playwright, base_url, headers=None):
+    """
+    Returns a cached client for the base URL and headers
+
+    :param playwright: a fixture
+    :param base_url: API base URL
+    :param headers: Default headers of the client, for example authorization
+    :return: ApiClient
+    """
+    key = (id(playwright), base_url, tuple(sorted((headers or {}).items())))
+    if key not in _api_clients:
+        _api_clients[key] = ApiClient(get_request_context(playwright, base_url), headers)
+    return _api_clients[key]
+
+
+def get_api_base_url(api_name):
+    """
+    Returns the base URL the API requests are currently sent to
+
+    :param api_name: 'plextera', 'ocrg' or 'mailslurp'
+    :return: base URL
+    """
+    return api_base_urls[api_name]
+
+
+def set_api_base_url(api_name, base_url):
+    """
+    Points the API to another base URL, for example a local stand-in server
+
+    :param api_name: 'plextera', 'ocrg' or 'mailslurp'
+    :param base_url: New base URL
+    :return: Previous base URL
+    """
+    previous_base_url = api_base_urls[api_name]
+    api_base_urls[api_name] = base_url
+    return previous_base_url
+
+
+def build_auth_headers(token):
+    return {
+        "Context-type": "application/json",
+        "Authorization": "Bearer " + token
+    }
+
+
+def plextera_api(playwright: Playwright, token=None):
+    """
+    Returns a client for the Plextera API, authorized with the token if it is given
+    """
+    return get_api_client(playwright, get_api_base_url("plextera"), build_auth_headers(token) if token else None)
+
+
+def ocrg_api(playwright: Playwright, token=None):
+    """
+    Returns a client for the OCRG API, authorized with the token if it is given
+    """
+    return get_api_client(playwright, get_api_base_url("ocrg"), build_auth_headers(token) if token else None)
+
+
+def mailslurp_api(playwright: Playwright, x_api_key):
+    """
+    Returns a client for the MailSlurp API, authorized with the API key
+    """
+    return get_api_client(playwright, get_api_base_url("mailslurp"), {
+        "Context-type": "application/json",
+        "X-API-KEY": x_api_key
+    })
+
+
+def dispose_api_clients(playwright: Playwright):
+    """
+    Disposes all request contexts created for the Playwright instance. Called once at the end of the session.
+
+    :param playwright: a fixture
+    """
+    for key in [key for key in _api_clients if key[0] == id(playwright)]:
+        del _api_clients[key]
+    for key in [key for key in _request_contexts if key[0] == id(playwright)]:
+        _request_contexts.pop(key).dispose()
@@ -1,25 +1,25 @@
 import re
+from datetime import datetime, timezone, timedelta
+
 from playwright.sync_api import Playwright
 
-mailslurp = "https://api.mailslurp.com"
+from utilities.api.api_client import mailslurp_api
+from utilities.data_processing import EMAIL_LINK_PATTERNS
+from utilities.polling import poll_until
+
+# Allowed difference between the local clock and the MailSlurp clock when comparing receive times
+CLOCK_SKEW = timedelta(seconds=5)
 
 
 def create_new_email_address(playwright: Playwright, x_api_key):
     """
     Create a new temporary email address.
 
-    :param playwright: An instance of the Playwright library used to create the API request context.
+    :param playwright: An instance of the Playwright library that owns the shared API request context.
     :param x_api_key: a unique token that identifies the client.
     :return: Email name and its id
     """
-    api_request_context = playwright.request.new_context(base_url=mailslurp)
-    response = api_request_context.post(
-        "/inboxes/withDefaults",
-        headers={
-            "Context-type": "application/json",
-            "X-API-KEY": x_api_key
-        }
-    )
+    response = mailslurp_api(playwright, x_api_key).post("/inboxes/withDefaults")
     response_data = response.json()
     new_email_name = response_data["emailAddress"]
     new_email_id = response_data["id"]
@@ -31,18 +31,13 @@ def wait_for_email_and_read(playwright: Playwright, email_id, x_api_key):
     """
     Wait for email letter and return its html body
 
-    :param playwright: An instance of the Playwright library used to create the API request context.
+    :param playwright: An instance of the Playwright library that owns the shared API request context.
     :param email_id: Email ID
     :param x_api_key: a unique token that identifies the client.
     :return: html body of a letter
     """
-    api_request_context = playwright.request.new_context(base_url=mailslurp)
-    response = api_request_context.get(
-        f"/waitForLatestEmail?inboxId={email_id}&timeout=8000&unreadOnly=true",
-        headers={
-            "Context-type": "application/json",
-            "X-API-KEY": x_api_key
-        }
+    response = mailslurp_api(playwright, x_api_key).get(
+        f"/waitForLatestEmail?inboxId={email_id}&timeout=8000&unreadOnly=true"
     )
     response_data = response.json()
     return response_data['body']
@@ -52,19 +47,12 @@ def delete_email(playwright: Playwright, email_id, x_api_key):
     """
     Delete created temporary email address.
 
-    :param playwright: An instance of the Playwright library used to create the API request context.
+    :param playwright: An instance of the Playwright library that owns the shared API request context.
     :param email_id: Email ID
     :param x_api_key: a unique token that identifies the client.
     :return: Response...
     """
-    api_request_context = playwright.request.new_context(base_url=mailslurp)
-    response = api_request_context.delete(
-        f"/inboxes/{email_id}",
-        headers={
-            "Context-type": "application/json",
-            "X-API-KEY": x_api_key
-        }
-    )
+    response = mailslurp_api(playwright, x_api_key).delete(f"/inboxes/{email_id}")
     return response
 
 
@@ -72,17 +60,109 @@ def delete_emails_in_inbox(playwright: Playwright, inbox_id, x_api_key):
     """
     Delete created temporary email address.
 
-    :param playwright: An instance of the Playwright library used to create the API request context.
+    :param playwright: An instance of the Playwright library that owns the shared API request context.
     :param inbox_id: inbox ID
     :param x_api_key: a unique token that identifies the client.
     :return: Response...
     """
-    api_request_context = playwright.request.new_context(base_url=mailslurp)
-    response = api_request_context.delete(
-        f"/emptyInbox?inboxId={inbox_id}",
-        headers={
-            "Context-type": "application/json",
-            "X-API-KEY": x_api_key
-        }
-    )
+    response = mailslurp_api(playwright, x_api_key).delete(f"/emptyInbox?inboxId={inbox_id}")
     return response
+
+
+def get_emails(playwright: Playwright, inbox_id, x_api_key, since=None):
+    """
+    Returns previews of the emails in the inbox without waiting for new ones.
+
+    :param playwright: An instance of the Playwright library that owns the shared API request context.
+    :param inbox_id: inbox ID
+    :param x_api_key: a unique token that identifies the client.
+    :param since: Optional datetime with timezone, only emails received after it are returned
+    :return: list of email previews, oldest first
+    """
+    params = {"sort": "ASC"}
+    if since is not None:
+        params["since"] = (since - CLOCK_SKEW).astimezone(timezone.utc).isoformat()
+    response = mailslurp_api(playwright, x_api_key).get(f"/inboxes/{inbox_id}/emails", params=params)
+    assert response.ok
+    return response.json()
+
+
+def count_emails(playwright: Playwright, inbox_id, x_api_key, since=None):
+    """
+    Returns number of emails in the inbox without waiting for new ones.
+
+    :param playwright: An instance of the Playwright library that owns the shared API request context.
+    :param inbox_id: inbox ID
+    :param x_api_key: a unique token that identifies the client.
+    :param since: Optional datetime with timezone, only emails received after it are counted
+    :return: number of emails
+    """
+    return len(get_emails(playwright, inbox_id, x_api_key, since))
+
+
+def get_email_body(playwright: Playwright, email_id, x_api_key):
+    """
+    Returns html body of the email.
+
+    :param playwright: An instance of the Playwright library that owns the shared API request context.
+    :param email_id: ID of the email (not of the inbox)
+    :param x_api_key: a unique token that identifies the client.
+    :return: html body of a letter
+    """
+    response = mailslurp_api(playwright, x_api_key).get(f"/emails/{email_id}")
+    assert response.ok
+    return response.json()["body"]
+
+
+def email_matches(email, recipient=None, subject=None, received_after=None):
+    """
+    Checks an email preview against the given criteria. Criteria that are None are not checked.
+
+    :param email: Email preview returned by get_emails
+    :param recipient: Email address that must be in the 'to' list
+    :param subject: Text the subject must contain
+    :param received_after: datetime with timezone, the email must be received after it
+    :return: True or False
+    """
+    if recipient and recipient.lower() not in [address.lower() for address in email.get("to") or []]:
+        return False
+    if subject and subject not in (email.get("subject") or ""):
+        return False
+    if received_after:
+        received = datetime.fromisoformat(email["createdAt"].replace("Z", "+00:00"))
+        if received < received_after - CLOCK_SKEW:
+            return False
+    return True
+
+
+def wait_for_matching_email(playwright: Playwright, inbox_id, x_api_key, recipient=None, subject=None,
+                            link_type=None, received_after=None, timeout=30):
+    """
+    Waits for the first email that matches all the given criteria and returns its html body.
+    The inbox is polled with backoff, so the call returns as soon as the email is received.
+
+    :param playwright: An instance of the Playwright library that owns the shared API request context.
+    :param inbox_id: inbox ID
+    :param x_api_key: a unique token that identifies the client.
+    :param recipient: Email address that must be in the 'to' list
+    :param subject: Text the subject must contain
+    :param link_type: Key of EMAIL_LINK_PATTERNS, the body must contain such a link
+    :param received_after: datetime with timezone, the email must be received after it
+    :param timeout: Deadline in seconds
+    :return: html body of a letter
+    """
+    checked_email_ids = set()
+
+    def find_matching_email():
+        for email in get_emails(playwright, inbox_id, x_api_key, received_after):
+            if email["id"] in checked_email_ids:
+                continue
+            checked_email_ids.add(email["id"])
+            if not email_matches(email, recipient, subject, received_after):
+                continue
+            body = get_email_body(playwright, email["id"], x_api_key)
+            if link_type is None or re.search(EMAIL_LINK_PATTERNS[link_type], body):
+                return body
+        return None
+
+    return poll_until(find_matching_email, timeout, initial_interval=0.5, max_interval=2)
@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import time
+
+from data.constants import DOMAIN_STAGE_URL
+
+# Folder with the cached static resources of the Studio frontend
+ASSET_CACHE_DIR = ".asset_cache"
+# Resource types served from the cache. Documents and API calls always go to the network
+STATIC_RESOURCE_TYPES = {"script", "stylesheet", "font", "image", "media", "manifest"}
+# Response headers stored with the cached body
+STORED_HEADERS = ("content-type", "etag", "last-modified", "cache-control")
+
+# Savings of the asset cache in this process, reported at the end of the session
+asset_cache_stats = {
+    "hits": 0,
+    "misses": 0,
+    "revalidated": 0,
+    "bytes_saved": 0,
+    "bytes_downloaded": 0,
+    "seconds_saved": 0.0,
+}
+
+
+class AssetCache:
+    """
+    Disk cache of the static resources (bundles, styles, fonts, images) of the Studio frontend.
+
+    Every browser context is a fresh profile, so without the cache the whole SPA bundle is downloaded
+    for every test. The cache is installed with page routes on the frontend host: a resource is downloaded
+    once, stored under a hash of its URL together with its ETag, and later requests are fulfilled from disk.
+    An entry read from disk is revalidated with If-None-Match once per session, so a new deployment
+    is picked up. API hosts are not routed, so API calls are never cached.
+
+    The cache directory can be shared by pytest-xdist workers: entries are written atomically.
+    """
+
+    def __init__(self, cache_dir=ASSET_CACHE_DIR, host_url=DOMAIN_STAGE_URL, stats=asset_cache_stats):
+        """
+        :param cache_dir: Folder with the cached resources
+        :param host_url: Origin whose static resources are cached
+        :param stats: Dict the hits, misses, saved bytes and saved seconds are added to
+        """
+        self.cache_dir = cache_dir
+        self.host_url = host_url
+        self.stats = stats
+        # URLs whose cached entry is known to be fresh in this session
+        self.validated_urls = set()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def install(self, context):
+        """
+        Routes the static resources of the frontend host of the context through the cache
+
+        :param context: BrowserContext
+        """
+        context.route(self.host_url + "/**", self._handle_route)
+
+    def _get_entry_path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode()).hexdigest())
+
+    def _read_entry(self, url):
+        path = self._get_entry_path(url)
+        try:
+            with open(path + ".json") as f:
+                meta = json.load(f)
+            with open(path + ".body", "rb") as f:
+                body = f.read()
+        except (FileNotFoundError, ValueError):
+            return None, None
+        return meta, body
+
+    def _write_entry(self, url, response, body, seconds):
+        headers = {name: value for name, value in response.headers.items() if name.lower() in STORED_HEADERS}
+        if "no-store" in headers.get("cache-control", ""):
+            return
+        meta = {"url": url, "status": response.status, "headers": headers, "seconds": seconds}
+        path = self._get_entry_path(url)
+        for suffix, data in ((".body", body), (".json", json.dumps(meta).encode())):
+            tmp_path = f"{path}{suffix}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path + suffix)
+
+    def _handle_route(self, route, request):
+        if request.resource_type not in STATIC_RESOURCE_TYPES or request.method != "GET":
+            route.fallback()
+            return
+        url = request.url
+        meta, body = self._read_entry(url)
+        if meta is not None and url in self.validated_urls:
+            self._fulfill_from_cache(route, meta, body, meta["seconds"])
+            return
+        headers = dict(request.headers)
+        if meta is not None and meta["headers"].get("etag"):
+            headers["if-none-match"] = meta["headers"]["etag"]
+        start = time.monotonic()
+        response = route.fetch(headers=headers)
+        if response.status == 304 and meta is not None:
+            self.validated_urls.add(url)
+            self.stats["revalidated"] += 1
+            # The revalidation round trip is not saved, only the download
+            self._fulfill_from_cache(route, meta, body, max(meta["seconds"] - (time.monotonic() - start), 0))
+            return
+        response_body = response.body()
+        seconds = round(time.monotonic() - start, 3)
+        self.stats["misses"] += 1
+        self.stats["bytes_downloaded"] += len(response_body)
+        if response.status == 200:
+            self._write_entry(url, response, response_body, seconds)
+            self.validated_urls.add(url)
+        route.fulfill(response=response, body=response_body)
+
+    def _fulfill_from_cache(self, route, meta, body, seconds_saved):
+        self.stats["hits"] += 1
+        self.stats["bytes_saved"] += len(body)
+        self.stats["seconds_saved"] += seconds_saved
+        route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
@@ -0,0 +1,120 @@
+import base64
+import json
+import os
+import time
+
+from data.constants import PLEXTERA_STAGE_API_URL
+from utilities.api.api_client import get_api_base_url
+from utilities.file_lock import FileLock
+from utilities.phase_timing import timed_phase
+
+# Folder with cached storage states, one file per user profile from user_credentials.json
+STORAGE_STATE_DIR = ".auth"
+# Log in again when the token expires in less than this amount of seconds
+TOKEN_REFRESH_MARGIN = 120
+AUTH_COOKIE_NAME = "access-token-plextera"
+
+
+def get_token_expiry(token):
+    """
+    Returns the 'exp' claim of a JWT token
+
+    :param token: JWT access token
+    :return: Expiration time as unix timestamp or None if the token has no 'exp' claim
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+    except (IndexError, ValueError):
+        return None
+    return claims.get("exp")
+
+
+def get_storage_state_dir():
+    # Tokens issued by a local API stand-in are cached apart from the real ones
+    if get_api_base_url("plextera") != PLEXTERA_STAGE_API_URL:
+        return os.path.join(STORAGE_STATE_DIR, "stub")
+    return STORAGE_STATE_DIR
+
+
+def get_storage_state_path(user_profile):
+    return os.path.join(get_storage_state_dir(), f"{user_profile}.json")
+
+
+def build_storage_state(user_token):
+    """
+    Builds a Playwright storage state with the access token cookie
+
+    :param user_token: user access token
+    :return: storage state dict
+    """
+    expiry = get_token_expiry(user_token)
+    return {
+        "cookies": [{
+            "name": AUTH_COOKIE_NAME,
+            "value": user_token,
+            "domain": "studio.dev.plextera.com",
+            "path": "/",
+            "expires": expiry if expiry else -1,
+            "httpOnly": False,
+            "secure": True,
+            "sameSite": "Lax"
+        }],
+        "origins": []
+    }
+
+
+def read_cached_token(user_profile):
+    """
+    Returns a token from the cached storage state if it is not going to expire soon
+
+    :param user_profile: A key from a user_credentials.json file
+    :return: user token or None
+    """
+    try:
+        with open(get_storage_state_path(user_profile)) as f:
+            storage_state = json.load(f)
+    except (FileNotFoundError, ValueError):
+        return None
+    for cookie in storage_state["cookies"]:
+        if cookie["name"] == AUTH_COOKIE_NAME:
+            expiry = get_token_expiry(cookie["value"])
+            if expiry and expiry - TOKEN_REFRESH_MARGIN > time.time():
+                return cookie["value"]
+    return None
+
+
+def get_cached_user_token(playwright, user_profile):
+    """
+    Returns a token of the user profile. The user is logged in only when there is no cached token
+    or the cached one is about to expire. Safe to call from several pytest-xdist workers at the same time.
+
+    :param playwright: a fixture
+    :param user_profile: A key from a user_credentials.json file
+    :return: user token
+    """
+    from utilities.utils import get_user_token
+
+    os.makedirs(get_storage_state_dir(), exist_ok=True)
+    with timed_phase("authentication"), FileLock(get_storage_state_path(user_profile) + ".lock"):
+        user_token = read_cached_token(user_profile)
+        if user_token is None:
+            user_token = get_user_token(playwright, user_profile)
+            tmp_path = get_storage_state_path(user_profile) + f".{os.getpid()}.tmp"
+            with open(tmp_path, "w") as f:
+                json.dump(build_storage_state(user_token), f, indent=4)
+            os.replace(tmp_path, get_storage_state_path(user_profile))
+    return user_token
+
+
+def get_storage_state(playwright, user_profile):
+    """
+    Returns path to a fresh storage state of the user profile, to be passed to browser.new_context(storage_state=...)
+
+    :param playwright: a fixture
+    :param user_profile: A key from a user_credentials.json file
+    :return: path to the storage state file
+    """
+    get_cached_user_token(playwright, user_profile)
+    return get_storage_state_path(user_profile)
@@ -0,0 +1,67 @@
+import os
+import sys
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Launch flags that make Chromium behave in containers and on shared CI runners
+CI_CHROMIUM_ARGS = [
+    "--no-sandbox",
+    "--disable-dev-shm-usage",
+    "--disable-gpu",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-renderer-backgrounding",
+    "--mute-audio",
+]
+
+BROWSERS = ["chromium", "firefox", "webkit"]
+PROFILES = ["local", "ci"]
+
+
+def get_default_profile():
+    """
+    Returns 'ci' when the run is started by a CI system (the CI environment variable is set), else 'local'
+    """
+    return "ci" if os.environ.get("CI") else "local"
+
+
+def build_launch_options(config):
+    """
+    Builds keyword arguments for BrowserType.launch from the command line options
+
+    :param config: pytest config object
+    :return: dict with launch options
+    """
+    browser_name = config.getoption("ui_browser")
+    args = list(config.getoption("ui_browser_arg") or [])
+    if config.getoption("profile") == "ci" and browser_name == "chromium":
+        args = CI_CHROMIUM_ARGS + [arg for arg in args if arg not in CI_CHROMIUM_ARGS]
+    launch_options = {
+        "headless": not config.getoption("ui_headed"),
+        "slow_mo": config.getoption("ui_slow_mo"),
+    }
+    if args:
+        launch_options["args"] = args
+    return launch_options
+
+
+def get_peak_rss_mb():
+    """
+    Returns peak resident set size of the test process and of the largest of its finished child processes,
+    in megabytes. The children are the Playwright driver and the browser processes it starts, ru_maxrss of
+    RUSAGE_CHILDREN is the peak of the single largest one of them, not their sum. When no browser was launched
+    it is the driver. Children are only counted after they exit, so call it after the browser is closed.
+
+    :return: dict with 'runner' and 'largest_child' values, or None if the platform does not provide the data
+    """
+    if resource is None:
+        return None
+    # ru_maxrss is reported in bytes on macOS and in kilobytes everywhere else
+    divider = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return {
+        "runner": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / divider, 1),
+        "largest_child": round(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / divider, 1),
+    }
@@ -1,6 +1,15 @@
 import json
 import re
 
+# Path segments that are IDs: UUIDs and numbers
+ID_SEGMENT_PATTERN = re.compile(r"^([0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)$")
+
+# Patterns of the links sent in the emails, by link type
+EMAIL_LINK_PATTERNS = {
+    "register": r'href="([^"]+register-invite[^"]+)"',
+    "create_password": r'href="([^"]+create-password[^"]+)"',
+}
+
 
 def get_key_value_from_file(file_name, key):
     """
@@ -23,7 +32,7 @@ def get_register_link_from_the_email_body(body):
     :param body: html body of a letter
     :return: Register link
     """
-    reg_link = re.search(r'href="([^"]+register-invite[^"]+)"', body)
+    reg_link = re.search(EMAIL_LINK_PATTERNS["register"], body)
     return reg_link.group(1)
 
 
@@ -34,7 +43,7 @@ def get_create_new_password_link_from_the_email_body(body):
     :param body: api request response
     :return: Register link
     """
-    reg_link = re.search(r'href="([^"]+create-password[^"]+)"', body)
+    reg_link = re.search(EMAIL_LINK_PATTERNS["create_password"], body)
     return reg_link.group(1)
 
 def write_new_password_to_temp_email(file_name, new_password):
@@ -43,4 +52,14 @@ def write_new_password_to_temp_email(file_name, new_password):
 
     file_data["temp_email"]["updated_password"] = new_password
     with open("data/" + file_name + "", "w") as f:
-        json.dump(file_data, f, indent=4)
\ No newline at end of file
+        json.dump(file_data, f, indent=4)
+
+
+def normalize_path(path):
+    """
+    Replaces the ID segments of a URL path with '{id}', so requests to the same endpoint have the same path
+
+    :param path: URL path without the query string, for example /api/hubs/42
+    :return: normalized path, for example /api/hubs/{id}
+    """
+    return "/".join("{id}" if ID_SEGMENT_PATTERN.match(segment) else segment for segment in path.split("/"))
@@ -0,0 +1,124 @@
+import math
+from urllib.parse import urlparse
+
+from data.constants import PLEXTERA_STAGE_API_URL, OCRG_STAGE_API_URL
+from utilities.data_processing import normalize_path
+
+# JSON file the per-endpoint summary is written to when the run is started with --endpoint-latency
+ENDPOINT_LATENCY_FILE = "endpoint_latency.json"
+# Backend hosts whose requests are measured
+MEASURED_API_HOSTS = {urlparse(url).hostname for url in (PLEXTERA_STAGE_API_URL, OCRG_STAGE_API_URL)}
+
+# Backend requests measured in this process, reported at the end of the session
+endpoint_samples = []
+
+
+class EndpointLatencyCollector:
+    """
+    Records every backend request the frontend sends during a UI test: endpoint, status, timing breakdown
+    and response size. The UI suite then doubles as a latency monitor of the stage backend.
+
+    Timings come from request.timing and sizes from request.sizes() of the 'requestfinished' event.
+    The size is the transferred body, Content-Length is missing on chunked and compressed responses.
+    """
+
+    def __init__(self, hosts=MEASURED_API_HOSTS, samples=endpoint_samples):
+        """
+        :param hosts: Hostnames of the measured backends
+        :param samples: List the sample of every finished or failed request is appended to
+        """
+        self.hosts = hosts
+        self.samples = samples
+        self._responses = {}
+
+    def install(self, context):
+        """
+        :param context: BrowserContext
+        """
+        context.on("response", self._on_response)
+        context.on("requestfinished", self._on_request_finished)
+        context.on("requestfailed", self._on_request_failed)
+
+    def _is_measured(self, request):
+        return urlparse(request.url).hostname in self.hosts and request.method != "OPTIONS"
+
+    def _on_response(self, response):
+        if self._is_measured(response.request):
+            self._responses[response.request] = response.status
+
+    def _on_request_finished(self, request):
+        if not self._is_measured(request):
+            return
+        status = self._responses.pop(request, None)
+        size = max(request.sizes()["responseBodySize"], 0)
+        timing = request.timing
+        self.samples.append({
+            "endpoint": get_endpoint(request.method, request.url),
+            "status": status,
+            "size": size,
+            "total": round(timing["responseEnd"], 1),
+            "dns": _get_interval(timing, "domainLookupStart", "domainLookupEnd"),
+            "connect": _get_interval(timing, "connectStart", "connectEnd"),
+            "ttfb": _get_interval(timing, "requestStart", "responseStart"),
+            "download": _get_interval(timing, "responseStart", "responseEnd"),
+        })
+
+    def _on_request_failed(self, request):
+        if not self._is_measured(request):
+            return
+        self._responses.pop(request, None)
+        self.samples.append({"endpoint": get_endpoint(request.method, request.url), "status": None, "size": 0,
+                             "total": None, "failure": request.failure})
+
+
+def get_endpoint(method, url):
+    """
+    Returns the endpoint name: method, host and path with IDs replaced by '{id}'. The query string is dropped.
+
+    :param method: HTTP method
+    :param url: Request URL
+    :return: for example 'GET ocrf.ocrgateway.com/api/hubs/{id}'
+    """
+    parsed_url = urlparse(url)
+    return f"{method} {parsed_url.hostname}{normalize_path(parsed_url.path)}"
+
+
+def _get_interval(timing, start_key, end_key):
+    # Timing values are -1 when the phase did not happen, for example a reused connection has no DNS lookup
+    if timing[start_key] < 0 or timing[end_key] < 0:
+        return 0.0
+    return round(timing[end_key] - timing[start_key], 1)
+
+
+def percentile(sorted_values, percent):
+    # Nearest-rank percentile
+    return sorted_values[max(math.ceil(percent / 100 * len(sorted_values)) - 1, 0)]
+
+
+def summarize_endpoints(samples):
+    """
+    Aggregates the samples per endpoint
+
+    :param samples: Samples recorded by EndpointLatencyCollector
+    :return: list of dicts with endpoint, count, errors, p50, p95 and max latency in ms and average size in bytes,
+             the slowest endpoints (by p95) first
+    """
+    by_endpoint = {}
+    for sample in samples:
+        by_endpoint.setdefault(sample["endpoint"], []).append(sample)
+    summary = []
+    for endpoint, samples_of_endpoint in by_endpoint.items():
+        totals = sorted(sample["total"] for sample in samples_of_endpoint if sample["total"] is not None)
+        errors = [sample for sample in samples_of_endpoint if sample["status"] is None or sample["status"] >= 400]
+        summary.append({
+            "endpoint": endpoint,
+            "count": len(samples_of_endpoint),
+            "errors": len(errors),
+            "p50": percentile(totals, 50) if totals else None,
+            "p95": percentile(totals, 95) if totals else None,
+            "max": totals[-1] if totals else None,
+            "ttfb_p50": percentile(sorted(sample["ttfb"] for sample in samples_of_endpoint if "ttfb" in sample), 50)
+            if totals else None,
+            "average_size": round(sum(sample["size"] for sample in samples_of_endpoint) / len(samples_of_endpoint)),
+        })
+    return sorted(summary, key=lambda row: row["p95"] if row["p95"] is not None else -1, reverse=True)
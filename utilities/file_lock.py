@@ -0,0 +1,57 @@
+import os
+import time
+
+
+class FileLock:
+    """
+    Inter-process lock based on exclusive creation of a lock file.
+
+    It lets pytest-xdist workers share files on disk (cached sessions, reports) without
+    overwriting each other. Works on every platform and does not need extra packages.
+    """
+
+    def __init__(self, lock_path, timeout=60, poll_interval=0.1, stale_after=300):
+        """
+        :param lock_path: Path to the lock file
+        :param timeout: How many seconds to wait for the lock before TimeoutError is raised
+        :param poll_interval: How many seconds to wait between attempts
+        :param stale_after: A lock file older than this amount of seconds is treated as left by a crashed process
+        """
+        self.lock_path = lock_path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.stale_after = stale_after
+
+    def acquire(self):
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                fd = os.open(self.lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                os.write(fd, str(os.getpid()).encode())
+                os.close(fd)
+                return
+            except FileExistsError:
+                self._remove_if_stale()
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"Could not acquire the lock {self.lock_path} in {self.timeout} seconds")
+                time.sleep(self.poll_interval)
+
+    def release(self):
+        try:
+            os.remove(self.lock_path)
+        except FileNotFoundError:
+            pass
+
+    def _remove_if_stale(self):
+        try:
+            if time.time() - os.path.getmtime(self.lock_path) > self.stale_after:
+                os.remove(self.lock_path)
+        except FileNotFoundError:
+            pass
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
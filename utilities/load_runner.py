@@ -0,0 +1,286 @@
+"""
+Virtual-user load runner built on the async page objects of pageObjects/asyncApi.
+
+N virtual users run in one process, each one in its own browser context, and repeat the journey
+login -> Documents Insights -> Hubs -> create a value based hub -> back to Hubs -> delete the hub
+until --duration is over or every user ran --iterations journeys. Every journey starts in a fresh context.
+Users are started evenly over --ramp-up seconds and log in with the given user profiles in turn.
+
+The report shows the throughput, the latency percentiles of every step and the error rate per --window seconds.
+Hubs of journeys that failed after the hub was created are deleted through the API at the end.
+
+Usage: python -m utilities.load_runner --users 10 [--duration 300 | --iterations 5] [--ramp-up 30]
+       [--profile support] [--window 30] [--timeout 30000] [--output load_run.jsonl] [--browser chromium]
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from playwright.async_api import async_playwright
+
+from data.constants import DOMAIN_STAGE_URL, LOGIN_PAGE_URL
+from pageObjects.asyncApi.loginPage import LoginPage
+from utilities.auth_state import AUTH_COOKIE_NAME
+from utilities.data_processing import get_key_value_from_file
+from utilities.endpoint_latency import percentile
+from utilities.route_table import async_expect_route_ready
+from utilities.teardown_registry import TeardownRegistry
+
+# Length of the windows the error rate is reported in, in seconds
+DEFAULT_WINDOW = 30
+# Timeout of every page-object action, in ms
+DEFAULT_ACTION_TIMEOUT = 30000
+
+
+class VirtualUser:
+    """
+    One virtual user. Runs the journey again and again and records every step as a dict with
+    user, iteration, step, start (seconds since the start of the run), ms and error (None when successful).
+    """
+
+    def __init__(self, user_id, browser, credentials, records, run_start, action_timeout=DEFAULT_ACTION_TIMEOUT):
+        """
+        :param user_id: Number of the user
+        :param browser: async Browser
+        :param credentials: dict with the email and password of the user profile
+        :param records: List the step records are appended to
+        :param run_start: time.perf_counter() value of the start of the run
+        :param action_timeout: Timeout of every action, in ms
+        """
+        self.user_id = user_id
+        self.browser = browser
+        self.credentials = credentials
+        self.records = records
+        self.run_start = run_start
+        self.action_timeout = action_timeout
+        # Hubs of failed journeys, with the token to delete them
+        self.leftover_hubs = []
+
+    async def run(self, start_delay, deadline, iterations):
+        """
+        :param start_delay: Seconds to wait before the first journey (ramp-up)
+        :param deadline: time.perf_counter() value after which no new journey is started, or None
+        :param iterations: Number of journeys, or None to repeat them until the deadline
+        """
+        await asyncio.sleep(start_delay)
+        iteration = 0
+        while (iterations is None or iteration < iterations) and (deadline is None or time.perf_counter() < deadline):
+            await self.run_journey(iteration)
+            iteration += 1
+
+    async def run_journey(self, iteration):
+        """
+        Runs the journey once in a new browser context. The first failed step ends the journey.
+
+        :param iteration: Number of the journey of this user
+        :return: True when every step was successful
+        """
+        context = await self.browser.new_context()
+        context.set_default_timeout(self.action_timeout)
+        page = await context.new_page()
+        state = {}
+        try:
+            await self.step(iteration, "login", self.login(page, state))
+            await self.step(iteration, "navigate_to_documents_insights_page",
+                            self.navigate_to_documents_insights_page(state))
+            await self.step(iteration, "open_hubs_page", self.open_hubs_page(page, state))
+            await self.step(iteration, "create_value_based_hub", self.create_value_based_hub(state))
+            await self.step(iteration, "navigate_to_hubs_page", self.navigate_to_hubs_page(state))
+            await self.step(iteration, "delete_hub", self.delete_hub(page, state))
+            return True
+        except Exception:
+            if "hub" in state:
+                cookies = {cookie["name"]: cookie["value"] for cookie in await context.cookies()}
+                if AUTH_COOKIE_NAME in cookies:
+                    self.leftover_hubs.append((state["hub"]["id"], cookies[AUTH_COOKIE_NAME]))
+            return False
+        finally:
+            await context.close()
+
+    async def step(self, iteration, name, action):
+        """
+        Runs and records one step of the journey, the exception of a failed step is raised again
+
+        :param iteration: Number of the journey of this user
+        :param name: Step name
+        :param action: Coroutine of the step
+        """
+        start = time.perf_counter()
+        record = {"user": self.user_id, "iteration": iteration, "step": name,
+                  "start": round(start - self.run_start, 3), "ms": None, "error": None}
+        try:
+            await action
+        except Exception as error:
+            record["error"] = f"{type(error).__name__}: {str(error).splitlines()[0] if str(error) else ''}"
+            raise
+        finally:
+            record["ms"] = round((time.perf_counter() - start) * 1000, 1)
+            self.records.append(record)
+
+    async def login(self, page, state):
+        await page.goto(DOMAIN_STAGE_URL + LOGIN_PAGE_URL)
+        home_page = await LoginPage(page).login_with_user_credentials(
+            self.credentials["email"], self.credentials["password"])
+        # The sidebar is rendered when the Home page is loaded
+        await home_page.sidebar.sidebar_bottom_section.wait_for()
+        state["home_page"] = home_page
+
+    async def navigate_to_documents_insights_page(self, state):
+        state["documents_insights_page"] = await state["home_page"].sidebar.navigate_to_documents_insights_page()
+
+    async def open_hubs_page(self, page, state):
+        documents_insights_page = state["documents_insights_page"]
+        async with async_expect_route_ready(page, "Hubs"):
+            await documents_insights_page.hubs_button.click()
+        state["hubs_page"] = documents_insights_page.hubs_page
+
+    async def create_value_based_hub(self, state):
+        state["hub"] = await state["hubs_page"].create_value_based_hub()
+
+    async def navigate_to_hubs_page(self, state):
+        state["hubs_page"] = await state["hubs_page"].hub_page.navigate_to_hubs_page()
+
+    async def delete_hub(self, page, state):
+        hubs_page, hub = state["hubs_page"], state["hub"]
+        # Other virtual users create hubs at the same time, so the card is found by the hub name
+        hub_card = hubs_page.hub_card.filter(has_text=hub["name"])
+        await type(hubs_page).hub_card_meatball_menu.resolve(hub_card).click()
+        await hubs_page.hub_card_meatball_menu_delete_point.click()
+        async with page.expect_response(f"**/api/hubs/{hub['id']}") as resp_info:
+            await hubs_page.popups.delete_button.click()
+        assert (await resp_info.value).ok
+        del state["hub"]
+
+
+async def run_load(users, profiles, duration=None, iterations=None, ramp_up=0, browser_name="chromium",
+                   action_timeout=DEFAULT_ACTION_TIMEOUT):
+    """
+    Runs the virtual users until the duration is over or every user ran its iterations
+
+    :param users: Number of concurrent virtual users
+    :param profiles: Keys from a user_credentials.json file, assigned to the users in turn
+    :param duration: Seconds after which no new journey is started
+    :param iterations: Number of journeys of every user
+    :param ramp_up: Seconds over which the users are started
+    :param browser_name: 'chromium', 'firefox' or 'webkit'
+    :param action_timeout: Timeout of every action, in ms
+    :return: step records and the run duration in seconds
+    """
+    credentials = [get_key_value_from_file("user_credentials.json", profile) for profile in profiles]
+    records = []
+    async with async_playwright() as playwright:
+        browser = await getattr(playwright, browser_name).launch()
+        run_start = time.perf_counter()
+        deadline = run_start + ramp_up + duration if duration else None
+        virtual_users = [VirtualUser(user_id, browser, credentials[user_id % len(credentials)], records, run_start,
+                                     action_timeout) for user_id in range(users)]
+        await asyncio.gather(*(virtual_user.run(ramp_up * user_id / users, deadline, iterations)
+                               for user_id, virtual_user in enumerate(virtual_users)))
+        run_duration = time.perf_counter() - run_start
+        await browser.close()
+    registry = TeardownRegistry()
+    for virtual_user in virtual_users:
+        for hub_id, token in virtual_user.leftover_hubs:
+            registry.register_hub(hub_id, token)
+    registry.flush()
+    registry.wait()
+    return records, run_duration
+
+
+def summarize_load(records, run_duration, window=DEFAULT_WINDOW):
+    """
+    Aggregates the step records of a run
+
+    :param records: Records written by VirtualUser
+    :param run_duration: Run duration in seconds
+    :param window: Length of the error rate windows in seconds
+    :return: dict with the throughput, the latency percentiles per step and the error rate per window
+    """
+    journeys = {}
+    for record in records:
+        journeys.setdefault((record["user"], record["iteration"]), []).append(record)
+    completed = sum(all(record["error"] is None for record in steps) and steps[-1]["step"] == "delete_hub"
+                    for steps in journeys.values())
+    steps = []
+    for step in dict.fromkeys(record["step"] for record in records):
+        step_records = [record for record in records if record["step"] == step]
+        durations = sorted(record["ms"] for record in step_records if record["error"] is None)
+        steps.append({
+            "step": step,
+            "count": len(step_records),
+            "errors": sum(record["error"] is not None for record in step_records),
+            **{name: percentile(durations, percent) if durations else None
+               for name, percent in (("p50", 50), ("p90", 90), ("p95", 95), ("p99", 99))},
+            "max": durations[-1] if durations else None,
+        })
+    windows = {}
+    for record in records:
+        windows.setdefault(int(record["start"] // window) * window, []).append(record)
+    return {
+        "journeys": len(journeys),
+        "completed": completed,
+        "journeys_per_minute": round(completed / run_duration * 60, 2) if run_duration else 0,
+        "steps_per_second": round(len(records) / run_duration, 2) if run_duration else 0,
+        "steps": steps,
+        "windows": [{
+            "start": start,
+            "steps": len(window_records),
+            "errors": sum(record["error"] is not None for record in window_records),
+        } for start, window_records in sorted(windows.items())],
+    }
+
+
+def print_report(summary, records, window=DEFAULT_WINDOW):
+    """
+    :param summary: Output of summarize_load
+    :param records: Records written by VirtualUser
+    :param window: Length of the error rate windows in seconds
+    """
+    print(f"{summary['completed']}/{summary['journeys']} journeys completed, "
+          f"{summary['journeys_per_minute']} journeys/min, {summary['steps_per_second']} steps/s")
+    print()
+    print(f"{'count':>6} {'errors':>6} {'p50 ms':>9} {'p90 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'max ms':>9}  step")
+    for row in summary["steps"]:
+        values = " ".join(f"{row[key]:>9.0f}" if row[key] is not None else f"{'-':>9}"
+                          for key in ("p50", "p90", "p95", "p99", "max"))
+        print(f"{row['count']:>6} {row['errors']:>6} {values}  {row['step']}")
+    print()
+    print(f"{'from s':>6} {'to s':>6} {'steps':>6} {'errors':>6} {'error rate':>10}")
+    for row in summary["windows"]:
+        print(f"{row['start']:>6} {row['start'] + window:>6} {row['steps']:>6} {row['errors']:>6} "
+              f"{row['errors'] / row['steps']:>10.1%}")
+    errors = {}
+    for record in records:
+        if record["error"] is not None:
+            errors[(record["step"], record["error"])] = errors.get((record["step"], record["error"]), 0) + 1
+    if errors:
+        print()
+        for (step, error), count in sorted(errors.items(), key=lambda item: item[1], reverse=True):
+            print(f"{count:>6}  {step}: {error}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Virtual-user load runner")
+    parser.add_argument("--users", type=int, required=True, help="number of concurrent virtual users")
+    limit = parser.add_mutually_exclusive_group(required=True)
+    limit.add_argument("--duration", type=float, help="seconds after the ramp-up in which journeys are started")
+    limit.add_argument("--iterations", type=int, help="journeys per user")
+    parser.add_argument("--ramp-up", type=float, default=0, help="seconds over which the users are started")
+    parser.add_argument("--profile", action="append", dest="profiles",
+                        help="user profile from user_credentials.json, repeat it to spread the users over accounts")
+    parser.add_argument("--window", type=int, default=DEFAULT_WINDOW, help="length of the error rate windows in seconds")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_ACTION_TIMEOUT, help="timeout of every action, in ms")
+    parser.add_argument("--output", help="JSONL file the step records are written to")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    args = parser.parse_args()
+    records, run_duration = asyncio.run(run_load(args.users, args.profiles or ["support"], args.duration,
+                                                 args.iterations, args.ramp_up, args.browser, args.timeout))
+    if args.output:
+        with open(args.output, "w") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+    print_report(summarize_load(records, run_duration, args.window), records, args.window)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Micro-benchmark of the page-object construction cost.
+
+For every page-object class in pageObjects/ it measures:
+- lazy: creating the object and using one locator, what a test that clicks one button pays now
+- eager: creating the object and building all its locators and nested components,
+  what every construction paid when __init__ built all locators
+
+Usage: python -m utilities.page_object_benchmark [--iterations 1000] [--browser chromium]
+"""
+import argparse
+import time
+
+from playwright.sync_api import sync_playwright
+
+from pageObjects.lazyLocator import get_components, get_lazy_locators, get_page_object_classes
+
+
+def build_everything(page_object):
+    """
+    Builds all locators and nested components of the page object, as the eager __init__ did
+
+    :param page_object: Page object instance
+    :return: number of built locators
+    """
+    count = 0
+    for name in get_lazy_locators(type(page_object)):
+        getattr(page_object, name)
+        count += 1
+    for component in get_components(page_object).values():
+        count += build_everything(component)
+    return count
+
+
+def measure(function, iterations):
+    start = time.perf_counter()
+    for _ in range(iterations):
+        function()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Page-object construction benchmark")
+    parser.add_argument("--iterations", type=int, default=1000)
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    args = parser.parse_args()
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, args.browser).launch()
+        page = browser.new_page()
+        print(f"{'locators':>8} {'eager us':>9} {'lazy us':>8}  page object")
+        for name, cls in get_page_object_classes().items():
+            first_locator = next(iter(get_lazy_locators(cls)))
+            locator_count = build_everything(cls(page))
+            eager = measure(lambda: build_everything(cls(page)), args.iterations)
+            lazy = measure(lambda: getattr(cls(page), first_locator), args.iterations)
+            print(f"{locator_count:>8} {eager:>9.1f} {lazy:>8.1f}  {name}")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import json
+import time
+import warnings
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from utilities.data_processing import normalize_path
+
+# Maximum latency and request count per page transition and per backend endpoint
+PERF_BUDGETS_FILE = "data/perf_budgets.json"
+# 'warn' reports a breach as a PerfBudgetWarning, 'fail' fails the test with PerfBudgetExceeded
+PERF_BUDGET_MODES = ("warn", "fail")
+
+# Budget breaches of this process, reported at the end of the session
+budget_breaches = []
+_budgets = {"pages": {}, "endpoints": {}}
+_mode = None
+
+
+class PerfBudgetWarning(UserWarning):
+    """A page transition or an endpoint was slower or sent more requests than its budget allows"""
+
+
+class PerfBudgetExceeded(AssertionError):
+    """Raised instead of PerfBudgetWarning when the budgets are enforced with mode 'fail'"""
+
+
+def configure_budgets(mode, path=PERF_BUDGETS_FILE):
+    """
+    Enables the budget checks of the page objects
+
+    :param mode: A value of PERF_BUDGET_MODES, or None to disable the checks
+    :param path: Path to the budgets file
+    """
+    global _budgets, _mode
+    _mode = mode
+    if mode is None:
+        return
+    with open(path) as f:
+        budgets = json.load(f)
+    _budgets = {"pages": budgets.get("pages", {}), "endpoints": budgets.get("endpoints", {})}
+
+
+def get_endpoint_key(method, url):
+    """
+    :param method: HTTP method
+    :param url: Request URL
+    :return: budget key of the endpoint, for example 'GET /api/hubs/{id}'
+    """
+    return f"{method} {normalize_path(urlparse(url).path)}"
+
+
+@contextmanager
+def within_budget(page, page_name):
+    """
+    Checks the page transition started in the block against the budget of the page: duration of the block
+    and number of requests sent meanwhile. Every backend call sent in the block is checked against
+    the budget of its endpoint: latency and number of calls. Page objects wrap the click together with
+    the wait for the responses the target page needs. Nothing is checked when the budgets are disabled
+    or the block raised.
+
+    :param page: Page
+    :param page_name: Key of the page in the 'pages' section of the budgets file
+    """
+    if _mode is None:
+        yield
+        return
+    requests = []
+    on_request = requests.append
+    page.on("request", on_request)
+    start = time.perf_counter()
+    try:
+        yield
+        elapsed_ms = (time.perf_counter() - start) * 1000
+    finally:
+        page.remove_listener("request", on_request)
+    breaches = []
+    page_budget = _budgets["pages"].get(page_name)
+    if page_budget:
+        breaches += _check(f"page '{page_name}'", page_budget, elapsed_ms, len(requests))
+    requests_by_endpoint = {}
+    for request in requests:
+        requests_by_endpoint.setdefault(get_endpoint_key(request.method, request.url), []).append(request)
+    for endpoint, endpoint_requests in requests_by_endpoint.items():
+        endpoint_budget = _budgets["endpoints"].get(endpoint)
+        if endpoint_budget:
+            breaches += _check(f"endpoint '{endpoint}'", endpoint_budget,
+                               max(_get_latency_ms(request) for request in endpoint_requests), len(endpoint_requests))
+    _report(page_name, breaches)
+
+
+def _get_latency_ms(request):
+    # The block only waited for the response headers, wait until the body is received as well
+    response = request.response()
+    if response is None:
+        return 0.0
+    response.finished()
+    return max(request.timing["responseEnd"], 0.0)
+
+
+def _check(name, budget, latency_ms, request_count):
+    breaches = []
+    if "max_ms" in budget and latency_ms > budget["max_ms"]:
+        breaches.append({"name": name, "metric": "latency", "value": round(latency_ms), "budget": budget["max_ms"]})
+    if "max_requests" in budget and request_count > budget["max_requests"]:
+        breaches.append({"name": name, "metric": "requests", "value": request_count,
+                         "budget": budget["max_requests"]})
+    return breaches
+
+
+def _report(page_name, breaches):
+    if not breaches:
+        return
+    budget_breaches.extend({"page": page_name, "mode": _mode, **breach} for breach in breaches)
+    message = "performance budget exceeded: " + "; ".join(
+        f"{breach['name']} {breach['metric']} {breach['value']} > {breach['budget']}" for breach in breaches)
+    if _mode == "fail":
+        raise PerfBudgetExceeded(message)
+    warnings.warn(message, PerfBudgetWarning, stacklevel=4)
@@ -0,0 +1,150 @@
+import functools
+import time
+from contextlib import contextmanager
+
+from playwright.sync_api import APIResponseAssertions, LocatorAssertions, PageAssertions
+
+# JSONL file the phase timings are written to when the run is started with --phase-timing
+PHASE_TIMING_FILE = "phase_timing.jsonl"
+# Phases every test is split into. 'actions' is the part of the test body not spent in another phase
+PHASES = ("setup", "authentication", "first_goto", "actions", "expect", "teardown")
+
+# Phase timings of the tests finished in this process, reported at the end of the session
+phase_records = []
+_current_timer = None
+
+
+class PhaseTimer:
+    """
+    Collects how long one test spends in every phase.
+
+    Phases can be nested: time spent in an inner phase is not counted in the outer one,
+    so the phases of a test add up to its duration.
+    """
+
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+        self.phases = dict.fromkeys(PHASES, 0.0)
+        self._nested_seconds = []
+        self._first_navigation_start = None
+        self._first_navigation_done = False
+
+    @contextmanager
+    def phase(self, name):
+        start = time.perf_counter()
+        self._nested_seconds.append(0.0)
+        try:
+            yield
+        finally:
+            seconds = time.perf_counter() - start
+            self.phases[name] += seconds - self._nested_seconds.pop()
+            if self._nested_seconds:
+                self._nested_seconds[-1] += seconds
+
+    def watch_first_navigation(self, context):
+        """
+        Measures the first main-frame navigation of the context, from the document request to the 'load' event.
+        The time is moved from the phase it happened in (usually 'actions') to 'first_goto'.
+
+        :param context: BrowserContext
+        """
+        def on_request(request):
+            if (self._first_navigation_start is None and request.is_navigation_request()
+                    and request.frame.parent_frame is None):
+                self._first_navigation_start = time.perf_counter()
+
+        def on_load(page):
+            if self._first_navigation_start is not None and not self._first_navigation_done:
+                self._first_navigation_done = True
+                seconds = time.perf_counter() - self._first_navigation_start
+                self.phases["first_goto"] += seconds
+                if self._nested_seconds:
+                    self._nested_seconds[-1] += seconds
+
+        context.on("request", on_request)
+        context.on("page", lambda page: page.on("load", on_load))
+
+    def to_record(self):
+        return {
+            "nodeid": self.nodeid,
+            "phases": {name: round(seconds, 4) for name, seconds in self.phases.items()},
+            "total": round(sum(self.phases.values()), 4),
+        }
+
+
+def start_test_timer(nodeid):
+    global _current_timer
+    _current_timer = PhaseTimer(nodeid)
+    return _current_timer
+
+
+def finish_test_timer():
+    """
+    Stops timing of the current test and stores its record
+
+    :return: record dict with the seconds per phase, or None if no test is timed
+    """
+    global _current_timer
+    if _current_timer is None:
+        return None
+    record = _current_timer.to_record()
+    phase_records.append(record)
+    _current_timer = None
+    return record
+
+
+def get_current_timer():
+    return _current_timer
+
+
+@contextmanager
+def timed_phase(name):
+    """
+    Counts the time of the block in the given phase of the current test. Does nothing outside a timed test.
+
+    :param name: A phase from PHASES
+    """
+    if _current_timer is None:
+        yield
+        return
+    with _current_timer.phase(name):
+        yield
+
+
+def install_expect_timing():
+    """
+    Counts the time spent waiting in the Playwright assertions, expect(...).to_...() and expect(...).not_to_...(),
+    in the 'expect' phase. The assertion classes of playwright.sync_api are wrapped once per process,
+    the tests keep using playwright.sync_api.expect. Outside a timed test the wrappers only call the assertion.
+    """
+    for assertions_class in (LocatorAssertions, PageAssertions, APIResponseAssertions):
+        for name, assertion in list(vars(assertions_class).items()):
+            if name.startswith(("to_", "not_to_")) and not hasattr(assertion, "__wrapped__"):
+                setattr(assertions_class, name, _timed_assertion(assertion))
+
+
+def _timed_assertion(assertion):
+    @functools.wraps(assertion)
+    def timed_assertion(*args, **kwargs):
+        with timed_phase("expect"):
+            return assertion(*args, **kwargs)
+
+    return timed_assertion
+
+
+def summarize_phases(records, slowest_count=10):
+    """
+    Aggregates the phase records of the suite
+
+    :param records: Records written by finish_test_timer
+    :param slowest_count: Number of the slowest test phases to return
+    :return: total seconds per phase and the slowest (nodeid, phase, seconds) entries
+    """
+    totals = dict.fromkeys(PHASES, 0.0)
+    entries = []
+    for record in records:
+        for name, seconds in record["phases"].items():
+            totals[name] = totals.get(name, 0.0) + seconds
+            entries.append((record["nodeid"], name, seconds))
+    slowest = sorted(entries, key=lambda entry: entry[2], reverse=True)[:slowest_count]
+    return totals, slowest
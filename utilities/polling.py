@@ -0,0 +1,46 @@
+import time
+
+# Hub statuses reported by the OCRG API while the hub is still being processed
+HUB_PENDING_STATUSES = {"CREATING", "PENDING", "PROCESSING", "IN_PROGRESS", "TRAINING", "UPDATING"}
+HUB_STATUS_KEYS = ("status", "state", "processingStatus")
+
+# How long every settle wait of the teardown registry took in this process, reported at the end of the session
+hub_settle_times = []
+
+
+def poll_until(condition, timeout=30, initial_interval=0.25, max_interval=4, backoff_factor=2):
+    """
+    Calls the condition until it returns a truthy value. The interval between calls grows exponentially.
+
+    :param condition: Callable without arguments
+    :param timeout: Deadline in seconds
+    :param initial_interval: Seconds to wait after the first unsuccessful call
+    :param max_interval: Upper limit of the interval in seconds
+    :param backoff_factor: Multiplier applied to the interval after every unsuccessful call
+    :return: The first truthy value returned by the condition
+    """
+    deadline = time.monotonic() + timeout
+    interval = initial_interval
+    while True:
+        result = condition()
+        if result:
+            return result
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise TimeoutError(f"Condition was not met in {timeout} seconds")
+        time.sleep(min(interval, remaining))
+        interval = min(interval * backoff_factor, max_interval)
+
+
+def is_hub_settled(response):
+    """
+    Checks the 'get hub' response: the hub is settled when it can be read and none of its statuses is pending
+
+    :param response: Response of the get_hub request
+    :return: True or False
+    """
+    if not response.ok:
+        return False
+    hub_data = response.json()
+    return all(str(hub_data.get(key, "")).upper() not in HUB_PENDING_STATUSES for key in HUB_STATUS_KEYS)
+
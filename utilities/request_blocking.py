@@ -0,0 +1,99 @@
+import time
+from urllib.parse import urlparse
+
+from data.constants import DOMAIN_STAGE_URL, PLEXTERA_STAGE_API_URL, OCRG_STAGE_API_URL
+
+# Hosts of the application itself, everything else is third party
+FIRST_PARTY_HOSTS = {urlparse(url).hostname for url in (DOMAIN_STAGE_URL, PLEXTERA_STAGE_API_URL, OCRG_STAGE_API_URL)}
+MEDIA_RESOURCE_TYPES = {"image", "media", "font"}
+
+
+def is_third_party(request):
+    return urlparse(request.url).hostname not in FIRST_PARTY_HOSTS
+
+
+def is_media(request):
+    return request.resource_type in MEDIA_RESOURCE_TYPES
+
+
+# What every preset blocks. 'api-only' keeps the documents and scripts of the application, so the frontend
+# still sends its API requests, but drops everything that is only needed to render
+BLOCKING_PRESETS = {
+    "no-media": is_media,
+    "no-third-party": is_third_party,
+    "api-only": lambda request: is_media(request) or is_third_party(request) or request.resource_type == "stylesheet",
+}
+# With --blocking-report every marked test also runs in this mode, with the same listeners but nothing blocked,
+# so the savings of a preset are measured against the same tests
+BLOCKING_MODES = ("blocked", "baseline")
+
+# Traffic per preset and mode in this process, reported at the end of the session
+blocking_stats = {}
+
+
+class RequestBlocker:
+    """
+    Blocks the requests of a browser context according to a preset from BLOCKING_PRESETS and measures
+    the traffic of the context: blocked requests, downloaded bytes and page load times.
+
+    Tests opt in with @pytest.mark.block_requests("<preset>"). In the 'baseline' mode the same tests are
+    measured with nothing blocked, so the report shows what the preset saves in these tests.
+    """
+
+    def __init__(self, preset, mode="blocked", stats=blocking_stats):
+        """
+        :param preset: A key of BLOCKING_PRESETS
+        :param mode: 'blocked', or 'baseline' to only measure the traffic
+        :param stats: Dict the numbers of the preset and mode are added to
+        """
+        if preset not in BLOCKING_PRESETS:
+            raise ValueError(f"Unknown request blocking preset '{preset}', expected one of {list(BLOCKING_PRESETS)}")
+        if mode not in BLOCKING_MODES:
+            raise ValueError(f"Unknown request blocking mode '{mode}', expected one of {BLOCKING_MODES}")
+        self.preset = preset
+        self.mode = mode
+        self.stats = stats.setdefault(preset, {}).setdefault(mode, {
+            "tests": 0,
+            "requests": 0,
+            "blocked": 0,
+            "bytes": 0,
+            "loads": 0,
+            "load_seconds": 0.0,
+        })
+        self._navigation_starts = {}
+
+    def install(self, context):
+        """
+        Adds the blocking route and the traffic listeners to the context.
+        Install it after the other routes of the context, so blocked requests never reach them.
+
+        :param context: BrowserContext
+        """
+        self.stats["tests"] += 1
+        if self.mode == "blocked":
+            context.route("**/*", self._handle_route)
+        context.on("request", self._on_request)
+        context.on("requestfinished", self._on_request_finished)
+        context.on("page", lambda page: page.on("load", self._on_load))
+
+    def _handle_route(self, route, request):
+        if BLOCKING_PRESETS[self.preset](request):
+            self.stats["blocked"] += 1
+            route.abort("blockedbyclient")
+        else:
+            route.fallback()
+
+    def _on_request(self, request):
+        self.stats["requests"] += 1
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            self._navigation_starts[request.frame] = time.monotonic()
+
+    def _on_request_finished(self, request):
+        # Transferred body size as seen by the browser. Content-Length is missing on chunked and compressed responses
+        self.stats["bytes"] += max(request.sizes()["responseBodySize"], 0)
+
+    def _on_load(self, page):
+        start = self._navigation_starts.pop(page.main_frame, None)
+        if start is not None:
+            self.stats["loads"] += 1
+            self.stats["load_seconds"] += time.monotonic() - start
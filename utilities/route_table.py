@@ -0,0 +1,131 @@
+import statistics
+import time
+from contextlib import AsyncExitStack, ExitStack, asynccontextmanager, contextmanager
+
+from data.constants import DOMAIN_STAGE_URL, LOGIN_PAGE_URL, WORKFLOWS_URL, WEB_AUTOMATIONS_URL, \
+    DOCUMENTS_INSIGHTS_PAGE_URL, HUBS_PAGE_URL, FORMS_PAGE_URL, ALERTS_PAGE_URL
+
+# Every page of the application: its URL relative to DOMAIN_STAGE_URL (None when the page can only be opened
+# from the sidebar) and the API calls it needs before it counts as ready, as page.expect_response globs
+ROUTES = {
+    "Home": {"url": "/", "api_calls": []},
+    "Login": {"url": LOGIN_PAGE_URL, "api_calls": []},
+    "Workflows": {"url": WORKFLOWS_URL, "api_calls": ["**/api/studio/workflow/list"]},
+    "Web Automations": {"url": WEB_AUTOMATIONS_URL, "api_calls": [
+        "**/api/sbb/automation/list?page=0&size=25&sortDirection=DESC&sortBy=createdOn",
+        "**/api/sbb/automation/**",
+    ]},
+    "Documents Insights": {"url": DOCUMENTS_INSIGHTS_PAGE_URL, "api_calls": [
+        "**/api/ocr/history?status=done&size=10&searchBy=NAME",
+    ]},
+    "Hubs": {"url": HUBS_PAGE_URL, "api_calls": ["**/api/hubs/page?sortBy=name"]},
+    "SIDES": {"url": None, "api_calls": ["**/api/sides/schedules"]},
+    "Datastores": {"url": None, "api_calls": ["**/api/studio/datasource/configuration?page=0&size=10"]},
+    "Forms": {"url": FORMS_PAGE_URL, "api_calls": ["**/api/studio/forms?page=0&size=10"]},
+    "Alerts": {"url": ALERTS_PAGE_URL, "api_calls": [
+        "**/api/issues-service/issues?page=0&size=10&sortBy=severity&sortDirection=DESC&status=OPEN",
+    ]},
+}
+
+# When every required API call of the page transitions of this process finished, reported at the end of the session
+route_timings = []
+
+
+def get_route_url(page_name):
+    """
+    :param page_name: A key of ROUTES
+    :return: absolute URL of the page
+    """
+    url = ROUTES[page_name]["url"]
+    if url is None:
+        raise ValueError(f"Page '{page_name}' has no URL, it can only be opened from the sidebar")
+    return DOMAIN_STAGE_URL + url
+
+
+@contextmanager
+def expect_route_ready(page, page_name):
+    """
+    Waits in the block for every API call the page needs and asserts that all of them were successful.
+    For every call it is recorded when its response arrived, relative to the start of the block,
+    so the report shows which call is on the critical path of the page.
+
+    :param page: Page
+    :param page_name: A key of ROUTES
+    """
+    api_calls = ROUTES[page_name]["api_calls"]
+    start_ms = time.time() * 1000
+    with ExitStack() as stack:
+        response_infos = [stack.enter_context(page.expect_response(api_call)) for api_call in api_calls]
+        yield
+    _record_arrivals(page_name, api_calls, [response_info.value for response_info in response_infos], start_ms)
+
+
+@asynccontextmanager
+async def async_expect_route_ready(page, page_name):
+    """
+    expect_route_ready for the async API, to be used with the page objects of pageObjects/asyncApi
+
+    :param page: async Page
+    :param page_name: A key of ROUTES
+    """
+    api_calls = ROUTES[page_name]["api_calls"]
+    start_ms = time.time() * 1000
+    async with AsyncExitStack() as stack:
+        response_infos = [await stack.enter_async_context(page.expect_response(api_call)) for api_call in api_calls]
+        yield
+    _record_arrivals(page_name, api_calls, [await response_info.value for response_info in response_infos], start_ms)
+
+
+def _record_arrivals(page_name, api_calls, responses, start_ms):
+    arrivals = {}
+    for api_call, response in zip(api_calls, responses):
+        assert response.ok
+        # startTime is the wall clock time of the request, the other timing values are relative to it
+        timing = response.request.timing
+        arrivals[api_call] = round(max(timing["startTime"] + timing["responseStart"] - start_ms, 0), 1)
+    if arrivals:
+        route_timings.append({"page": page_name, "arrivals": arrivals})
+
+
+def warm_up_routes(page, page_names=None):
+    """
+    Opens every page with a URL once and waits until it is ready, so the static resources are in the
+    asset cache and the backend caches are warm before the measured tests start.
+
+    :param page: Page of a logged in context
+    :param page_names: Keys of ROUTES, all pages with a URL by default
+    """
+    for page_name in page_names or [name for name, route in ROUTES.items() if route["url"] is not None]:
+        with expect_route_ready(page, page_name):
+            page.goto(get_route_url(page_name))
+    # The warm-up navigations are not part of the measured run
+    route_timings.clear()
+
+
+def summarize_critical_path(timings):
+    """
+    Aggregates the recorded page transitions per page
+
+    :param timings: Records written by expect_route_ready
+    :return: list of dicts with page, count, median time until ready in ms and per API call the median
+             arrival in ms and how often it was the last one (on the critical path), the slowest pages first
+    """
+    by_page = {}
+    for record in timings:
+        by_page.setdefault(record["page"], []).append(record["arrivals"])
+    summary = []
+    for page_name, page_arrivals in by_page.items():
+        calls = []
+        for api_call in page_arrivals[0]:
+            calls.append({
+                "api_call": api_call,
+                "arrival": statistics.median(arrivals[api_call] for arrivals in page_arrivals),
+                "critical": sum(max(arrivals, key=arrivals.get) == api_call for arrivals in page_arrivals),
+            })
+        summary.append({
+            "page": page_name,
+            "count": len(page_arrivals),
+            "ready": statistics.median(max(arrivals.values()) for arrivals in page_arrivals),
+            "calls": sorted(calls, key=lambda call: call["critical"], reverse=True),
+        })
+    return sorted(summary, key=lambda row: row["ready"], reverse=True)
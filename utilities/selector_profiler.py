@@ -0,0 +1,131 @@
+"""
+Live profiler of the page-object locators.
+
+Opens a page of the application with a logged in user and resolves every locator of the page object
+on it, nested components included. For every locator it records how long the query took and how many
+elements matched. A locator that matches nothing is waited for up to --timeout, like an action would,
+so broken selectors show up with the seconds they cost. Locators matching several elements fail
+in strict mode on click and fill, so they are flagged as well.
+
+Usage: python -m utilities.selector_profiler --page Hubs [--page-object documentsInsightsPage.DocumentsInsightsPage]
+       [--profile support] [--timeout 5000] [--browser chromium] [--headed]
+"""
+import argparse
+import time
+
+from playwright.sync_api import TimeoutError, sync_playwright
+
+from pageObjects.lazyLocator import get_components, get_lazy_locators, get_page_object_classes
+from utilities.auth_state import get_storage_state
+from utilities.route_table import ROUTES, expect_route_ready, get_route_url
+
+# Page object profiled by default for a page of ROUTES
+PAGE_OBJECTS_BY_PAGE = {
+    "Home": "homePage.HomePage",
+    "Login": "loginPage.LoginPage",
+    "Workflows": "workflowsPage.WorkflowsPage",
+    "Web Automations": "webAutomationsPage.WebAutomationsPage",
+    "Documents Insights": "documentsInsightsPage.DocumentsInsightsPage",
+    "Hubs": "documentsInsightsPage.DocumentsInsightsPage.HubsPage",
+    "Forms": "formsPage.FormsPage",
+    "Alerts": "alertsPage.AlertsPage",
+}
+# Timeout of the wait for a locator without matches, in ms
+DEFAULT_WAIT_TIMEOUT = 5000
+# Steps that pick a single element out of the matches, a locator ending with one of them never matches many
+SINGLE_ELEMENT_STEPS = ("first", "last", "nth")
+
+
+def profile_locator(locator, lazy_locator, wait_timeout):
+    """
+    :param locator: Locator built on the live page
+    :param lazy_locator: Its declaration
+    :param wait_timeout: How long to wait for a locator without matches, in ms
+    :return: dict with the match count, the time until it was resolved in ms and a flag:
+             'no match' when it did not appear in time, 'many' when it matches several elements, otherwise None
+    """
+    start = time.perf_counter()
+    count = locator.count()
+    flag = None
+    if count == 0:
+        try:
+            locator.first.wait_for(state="attached", timeout=wait_timeout)
+            count = locator.count()
+        except TimeoutError:
+            flag = "no match"
+    duration = (time.perf_counter() - start) * 1000
+    if count > 1 and lazy_locator.steps[-1][0] not in SINGLE_ELEMENT_STEPS:
+        flag = "many"
+    return {"count": count, "ms": round(duration, 1), "flag": flag}
+
+
+def profile_page_object(page_object, wait_timeout=DEFAULT_WAIT_TIMEOUT, profiled_classes=None):
+    """
+    Resolves every locator of the page object and its nested components on the current page.
+    Every class is profiled once, so the sidebar and the popups of nested page objects are not repeated.
+
+    :param page_object: Page object instance on a live page
+    :param wait_timeout: How long to wait for a locator without matches, in ms
+    :param profiled_classes: Classes that were already profiled, used for the recursion
+    :return: list of dicts with class, attribute, selector, count, ms and flag
+    """
+    profiled_classes = set() if profiled_classes is None else profiled_classes
+    cls = type(page_object)
+    if cls in profiled_classes:
+        return []
+    profiled_classes.add(cls)
+    results = []
+    for name, lazy_locator in get_lazy_locators(cls).items():
+        results.append({
+            "class": cls.__qualname__,
+            "attribute": name,
+            "selector": lazy_locator.describe(),
+            **profile_locator(getattr(page_object, name), lazy_locator, wait_timeout),
+        })
+    for component in get_components(page_object).values():
+        results.extend(profile_page_object(component, wait_timeout, profiled_classes))
+    return results
+
+
+def print_report(results):
+    """
+    Prints the locators ordered by their resolution time, the slowest first
+
+    :param results: Output of profile_page_object
+    """
+    print(f"{'ms':>8} {'count':>5} {'flag':<8}  locator")
+    for result in sorted(results, key=lambda result: result["ms"], reverse=True):
+        print(f"{result['ms']:>8.1f} {result['count']:>5} {result['flag'] or '':<8}  "
+              f"{result['class']}.{result['attribute']} = {result['selector']}")
+    flagged = [result for result in results if result["flag"]]
+    total = sum(result["ms"] for result in results)
+    print(f"{len(results)} locators, {len(flagged)} flagged, {total / 1000:.1f} s in total, "
+          f"{sum(result['ms'] for result in flagged) / 1000:.1f} s in flagged locators")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Page-object selector profiler")
+    parser.add_argument("--page", required=True, choices=[name for name, route in ROUTES.items() if route["url"]],
+                        help="page to open")
+    parser.add_argument("--page-object", choices=get_page_object_classes(),
+                        help="page object to profile, the one of the page by default")
+    parser.add_argument("--profile", default="support", help="user profile from user_credentials.json")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_WAIT_TIMEOUT,
+                        help="how long to wait for a locator without matches, in ms")
+    parser.add_argument("--browser", default="chromium", choices=("chromium", "firefox", "webkit"))
+    parser.add_argument("--headed", action="store_true")
+    args = parser.parse_args()
+    page_object_class = get_page_object_classes()[args.page_object or PAGE_OBJECTS_BY_PAGE[args.page]]
+    with sync_playwright() as playwright:
+        browser = getattr(playwright, args.browser).launch(headless=not args.headed)
+        storage_state = None if args.page == "Login" else get_storage_state(playwright, args.profile)
+        context = browser.new_context(storage_state=storage_state)
+        page = context.new_page()
+        with expect_route_ready(page, args.page):
+            page.goto(get_route_url(args.page))
+        print_report(profile_page_object(page_object_class(page), args.timeout))
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
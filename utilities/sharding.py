@@ -0,0 +1,91 @@
+import json
+import os
+import re
+import statistics
+
+# File with the historical duration of every test, in seconds
+DURATIONS_FILE = ".test_durations.json"
+# Duration assumed for tests that never ran, when nothing is known about the other tests either
+DEFAULT_TEST_DURATION = 5.0
+# Weight of the latest measurement when it is merged into the stored duration
+DURATION_SMOOTHING = 0.5
+# pytest-xdist --dist loadgroup appends '@<group>' of the xdist_group marker to the node IDs in the workers
+XDIST_GROUP_SUFFIX = re.compile(r"@[^@\[\]/]+$")
+
+
+def get_history_nodeid(nodeid):
+    """
+    :param nodeid: Test node ID, with or without the xdist group suffix
+    :return: node ID the duration of the test is stored under, without the group suffix,
+             so the history matches whether the test ran in a group or not
+    """
+    return XDIST_GROUP_SUFFIX.sub("", nodeid)
+
+
+def load_durations(path=DURATIONS_FILE):
+    """
+    Returns the historical durations
+
+    :param path: Path to the durations file
+    :return: dict nodeid -> seconds, empty if the file does not exist
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_durations(measured, path=DURATIONS_FILE, smoothing=DURATION_SMOOTHING):
+    """
+    Merges the durations measured in this run into the durations file. Stored durations are smoothed,
+    so one slow run does not move a test to another shard.
+
+    :param measured: dict nodeid -> seconds measured in this run
+    :param path: Path to the durations file
+    :param smoothing: Weight of the new measurement, from 0 to 1
+    """
+    durations = load_durations(path)
+    for nodeid, seconds in measured.items():
+        nodeid = get_history_nodeid(nodeid)
+        previous = durations.get(nodeid)
+        durations[nodeid] = round(seconds if previous is None else previous + smoothing * (seconds - previous), 3)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(durations, f, indent=4, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def estimate_durations(nodeids, durations):
+    """
+    Returns the expected duration of every test. Tests without history get the median of the known tests.
+
+    :param nodeids: Test node IDs
+    :param durations: Historical durations
+    :return: dict nodeid -> seconds
+    """
+    known = [durations[get_history_nodeid(nodeid)] for nodeid in nodeids if get_history_nodeid(nodeid) in durations]
+    default = statistics.median(known) if known else DEFAULT_TEST_DURATION
+    return {nodeid: durations.get(get_history_nodeid(nodeid), default) for nodeid in nodeids}
+
+
+def split_into_shards(nodeids, durations, shard_count):
+    """
+    Splits the tests into shards with about the same total duration (longest processing time first:
+    the longest test goes to the shard with the smallest load). The split is deterministic,
+    so every xdist worker and every CI machine computes the same shards.
+
+    :param nodeids: Test node IDs
+    :param durations: Historical durations
+    :param shard_count: Number of shards
+    :return: list of shards, every shard is a dict with 'nodeids' and 'predicted' seconds
+    """
+    expected = estimate_durations(nodeids, durations)
+    shards = [{"nodeids": [], "predicted": 0.0} for _ in range(shard_count)]
+    for nodeid in sorted(nodeids, key=lambda nodeid: (-expected[nodeid], nodeid)):
+        shard = min(shards, key=lambda shard: shard["predicted"])
+        shard["nodeids"].append(nodeid)
+        shard["predicted"] += expected[nodeid]
+    for shard in shards:
+        shard["predicted"] = round(shard["predicted"], 2)
+    return shards
@@ -0,0 +1,362 @@
+import base64
+import json
+import os
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qsl
+
+import requests
+
+from data.constants import PLEXTERA_STAGE_API_URL, OCRG_STAGE_API_URL
+from utilities.data_processing import ID_SEGMENT_PATTERN, normalize_path
+
+# Folder with the recorded responses: one subfolder per fixture version, one file per API
+API_CASSETTE_DIR = "data/api_cassettes"
+API_CASSETTE_VERSION = "v1"
+API_STUB_MODES = ("record", "replay")
+# Real APIs the stand-ins record from
+UPSTREAM_API_URLS = {
+    "plextera": PLEXTERA_STAGE_API_URL,
+    "ocrg": OCRG_STAGE_API_URL,
+}
+# Placeholders written to the cassettes instead of secrets
+SCRUBBED_TOKEN = "<token>"
+SCRUBBED_EMAIL = "user@example.com"
+SCRUBBED_VALUE = "<scrubbed>"
+SECRET_KEYS = {"accessToken", "refreshToken", "idToken", "token", "password"}
+# Lifetime of the tokens issued in replay mode
+STUB_TOKEN_LIFETIME = 3600
+
+JWT_PATTERN = re.compile(r"eyJ[\w-]+\.[\w-]+\.[\w-]*")
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+(\.[\w-]+)+")
+# Path group matching the same ID segments as normalize_path, so '/api/hubs/default-name' is not taken for a hub ID
+ID_GROUP = ID_SEGMENT_PATTERN.pattern.lstrip("^").rstrip("$")
+
+
+class ApiStub:
+    """
+    Local HTTP stand-in for one of the APIs used by utilities/api/api_base.py ('plextera' or 'ocrg').
+
+    Modes:
+    - record: every request is forwarded to the real API, the response is returned unchanged and a copy
+      with tokens and emails scrubbed is saved to data/api_cassettes/<version>/<api>.json
+    - replay: hubs, web automations, organizations and logins are served from a simple in-memory state,
+      all other requests from the recorded responses. Nothing is sent to the network.
+
+    Recorded responses are keyed by method and path, with ID segments of the path replaced by '{id}',
+    so a response recorded for one hub is replayed for every hub.
+
+    Usage:
+        with ApiStub("ocrg", "replay") as stub:
+            set_api_base_url("ocrg", stub.url)
+    """
+
+    def __init__(self, api_name, mode="replay", cassette_dir=os.path.join(API_CASSETTE_DIR, API_CASSETTE_VERSION),
+                 host="127.0.0.1", port=0):
+        """
+        :param api_name: 'plextera' or 'ocrg'
+        :param mode: 'record' or 'replay'
+        :param cassette_dir: Folder with the recorded responses of one fixture version
+        :param host: Interface to listen on
+        :param port: HTTP port, 0 picks a free port
+        """
+        if mode not in API_STUB_MODES:
+            raise ValueError(f"Unknown API stub mode '{mode}', expected one of {API_STUB_MODES}")
+        self.api_name = api_name
+        self.mode = mode
+        self.upstream_url = UPSTREAM_API_URLS[api_name]
+        self.cassette_path = get_cassette_paths(cassette_dir)[api_name]
+        self.cassette = self._load_cassette()
+        self.state = {"hubs": {}, "automations": {}, "organizations": {}}
+        self.routes = STATEFUL_ROUTES[api_name]
+        self._lock = threading.Lock()
+        self._session = requests.Session()
+        self._server = ThreadingHTTPServer((host, port), _ApiStubRequestHandler)
+        self._server.stub = self
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever, name=f"{self.api_name}-stub", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        self._thread.join()
+        if self.mode == "record":
+            self.save_cassette()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def _load_cassette(self):
+        try:
+            with open(self.cassette_path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def save_cassette(self):
+        os.makedirs(os.path.dirname(self.cassette_path), exist_ok=True)
+        with self._lock:
+            with open(self.cassette_path, "w") as f:
+                json.dump(self.cassette, f, indent=4, sort_keys=True)
+
+    def handle(self, method, path, query, headers, body):
+        """
+        Returns the response to the request
+
+        :param method: HTTP method
+        :param path: URL path without the query string
+        :param query: Query string parameters as a list of pairs
+        :param headers: Request headers
+        :param body: Raw request body
+        :return: status code, content type and raw response body
+        """
+        if self.mode == "record":
+            return self._forward(method, path, query, headers, body)
+        for route_method, pattern, handler in self.routes:
+            match = pattern.fullmatch(path)
+            if route_method == method and match:
+                with self._lock:
+                    status, data = handler(self, dict(query), _parse_json(body), *match.groups())
+                return status, "application/json", json.dumps(data).encode() if data is not None else b""
+        recorded = self.cassette.get(get_cassette_key(method, path, query))
+        if recorded is None:
+            data = {"message": f"No recorded response in {self.cassette_path} for {method} {path}"}
+            return 501, "application/json", json.dumps(data).encode()
+        data = _restore_tokens(recorded["body"])
+        if data is None:
+            return recorded["status"], recorded["content_type"], b""
+        if isinstance(data, str) and "json" not in recorded["content_type"]:
+            return recorded["status"], recorded["content_type"], data.encode()
+        return recorded["status"], recorded["content_type"], json.dumps(data).encode()
+
+    def _forward(self, method, path, query, headers, body):
+        forwarded_headers = {key: value for key, value in headers.items()
+                             if key.lower() in ("authorization", "content-type", "accept")}
+        response = self._session.request(method, self.upstream_url + path, params=query, headers=forwarded_headers,
+                                         data=body or None, timeout=60)
+        content_type = response.headers.get("Content-Type", "application/json")
+        if response.status_code >= 500:
+            # Server errors are not recorded, so a flaky moment of the real API does not end up in the cassette
+            return response.status_code, content_type, response.content
+        with self._lock:
+            self.cassette[get_cassette_key(method, path, query)] = {
+                "status": response.status_code,
+                "content_type": content_type,
+                "body": scrub(_parse_json(response.content)),
+            }
+        return response.status_code, content_type, response.content
+
+
+def route_browser_to_stub(context, stub):
+    """
+    Answers the browser requests to the real API (stub.upstream_url) from the stand-in with page.route,
+    so the real frontend runs against recorded or in-memory responses. Fulfilled responses are reported
+    to the page like real ones, so page.expect_response waits in the page objects still resolve.
+
+    :param context: BrowserContext
+    :param stub: ApiStub instance
+    """
+    def handle_route(route, request):
+        cors_headers = {
+            "Access-Control-Allow-Origin": request.headers.get("origin", "*"),
+            "Access-Control-Allow-Credentials": "true",
+            "Access-Control-Allow-Headers": request.headers.get("access-control-request-headers", "*"),
+            "Access-Control-Allow-Methods": "GET, POST, PUT, PATCH, DELETE, OPTIONS",
+        }
+        if request.method == "OPTIONS":
+            route.fulfill(status=204, headers=cors_headers)
+            return
+        parsed_url = urlparse(request.url)
+        status, content_type, body = stub.handle(request.method, parsed_url.path, parse_qsl(parsed_url.query),
+                                                 request.headers, request.post_data_buffer or b"")
+        route.fulfill(status=status, headers={**cors_headers, "Content-Type": content_type}, body=body)
+
+    context.route(stub.upstream_url + "/**", handle_route)
+
+
+def get_cassette_paths(cassette_dir):
+    """
+    :param cassette_dir: Folder with the recorded responses of one fixture version
+    :return: dict with the cassette file per API name
+    """
+    return {api_name: os.path.join(cassette_dir, f"{api_name}.json") for api_name in UPSTREAM_API_URLS}
+
+
+def get_cassette_key(method, path, query):
+    """
+    Returns the key of the recorded response: method, path with IDs replaced by '{id}' and sorted query
+    parameter names. Values of the parameters are ignored, so paging and sorting do not create new records.
+    """
+    names = sorted({name for name, _ in query})
+    return f"{method} {normalize_path(path)}" + (f"?{'&'.join(names)}" if names else "")
+
+
+def scrub(data):
+    """
+    Replaces tokens, emails and secret fields in the response data with placeholders
+
+    :param data: Parsed JSON response
+    :return: scrubbed copy
+    """
+    if isinstance(data, dict):
+        scrubbed = {}
+        for key, value in data.items():
+            if key in SECRET_KEYS and isinstance(value, str) and value:
+                scrubbed[key] = SCRUBBED_VALUE if key == "password" else SCRUBBED_TOKEN
+            else:
+                scrubbed[key] = scrub(value)
+        return scrubbed
+    if isinstance(data, list):
+        return [scrub(item) for item in data]
+    if isinstance(data, str):
+        return EMAIL_PATTERN.sub(SCRUBBED_EMAIL, JWT_PATTERN.sub(SCRUBBED_TOKEN, data))
+    return data
+
+
+def build_stub_token(email):
+    """
+    Returns an unsigned JWT token with 'sub' and 'exp' claims, accepted by utilities/auth_state.py
+
+    :param email: Email of the user
+    :return: token
+    """
+    def encode(data):
+        return base64.urlsafe_b64encode(json.dumps(data).encode()).decode().rstrip("=")
+
+    claims = {"sub": email, "iat": int(time.time()), "exp": int(time.time()) + STUB_TOKEN_LIFETIME}
+    return f"{encode({'alg': 'none', 'typ': 'JWT'})}.{encode(claims)}.stub"
+
+
+def _restore_tokens(data):
+    if isinstance(data, dict):
+        return {key: _restore_tokens(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [_restore_tokens(item) for item in data]
+    if data == SCRUBBED_TOKEN:
+        return build_stub_token(SCRUBBED_EMAIL)
+    return data
+
+
+def _parse_json(body):
+    if not body:
+        return None
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body.decode(errors="replace") if isinstance(body, bytes) else body
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _page(items):
+    return 200, {"content": list(items), "totalElements": len(items), "last": True}
+
+
+def _create(collection, fields):
+    def handler(stub, query, payload):
+        item = {**(payload if isinstance(payload, dict) else {}), **fields(payload or {})}
+        item.setdefault("id", str(uuid.uuid4()))
+        item.setdefault("createdOn", _now_iso())
+        stub.state[collection][item["id"]] = item
+        return 200, item
+    return handler
+
+
+def _get(collection):
+    def handler(stub, query, payload, item_id):
+        item = stub.state[collection].get(item_id)
+        return (200, item) if item else (404, {"message": "Not found"})
+    return handler
+
+
+def _update(collection):
+    def handler(stub, query, payload, item_id):
+        item = stub.state[collection].get(item_id)
+        if not item:
+            return 404, {"message": "Not found"}
+        item.update({key: value for key, value in (payload if isinstance(payload, dict) else {}).items() if key != "id"})
+        return 200, item
+    return handler
+
+
+def _delete(collection):
+    def handler(stub, query, payload, item_id):
+        return (200, None) if stub.state[collection].pop(item_id, None) else (404, {"message": "Not found"})
+    return handler
+
+
+def _list(collection):
+    def handler(stub, query, payload):
+        return _page(list(stub.state[collection].values()))
+    return handler
+
+
+def _login(stub, query, payload):
+    return 200, {"accessToken": build_stub_token((payload or {}).get("email", SCRUBBED_EMAIL))}
+
+
+def _me(stub, query, payload):
+    return 200, {"id": "stub-user", "email": SCRUBBED_EMAIL}
+
+
+# Requests served from the in-memory state in replay mode: method, path pattern, handler
+STATEFUL_ROUTES = {
+    "plextera": [
+        ("POST", re.compile(r"/api/auth/login"), _login),
+        ("GET", re.compile(r"/api/account-service/users/me"), _me),
+        ("POST", re.compile(r"/api/account-service/auth-user/create-invite-owner"),
+         _create("organizations", lambda payload: {"name": f"{payload.get('email', '')} company"})),
+        ("GET", re.compile(r"/api/account-service/admin-console/organizations"), _list("organizations")),
+        ("DELETE", re.compile(r"/api/account-service/admin-console/organizations/" + ID_GROUP), _delete("organizations")),
+    ],
+    "ocrg": [
+        ("POST", re.compile(r"/api/hubs/create"), _create("hubs", lambda payload: {"status": "READY"})),
+        ("GET", re.compile(r"/api/hubs/page"), _list("hubs")),
+        ("GET", re.compile(r"/api/hubs/" + ID_GROUP), _get("hubs")),
+        ("PUT", re.compile(r"/api/hubs/" + ID_GROUP), _update("hubs")),
+        ("PATCH", re.compile(r"/api/hubs/" + ID_GROUP), _update("hubs")),
+        ("DELETE", re.compile(r"/api/hubs/" + ID_GROUP), _delete("hubs")),
+        ("POST", re.compile(r"/api/sbb/automation"), _create("automations", lambda payload: {})),
+        ("GET", re.compile(r"/api/sbb/automation/list"), _list("automations")),
+        ("GET", re.compile(r"/api/sbb/automation/" + ID_GROUP), _get("automations")),
+        ("DELETE", re.compile(r"/api/sbb/automation/" + ID_GROUP), _delete("automations")),
+    ],
+}
+
+
+class _ApiStubRequestHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def _handle(self):
+        parsed_url = urlparse(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, content_type, payload = self.server.stub.handle(
+            self.command, "/" + parsed_url.path.lstrip("/"), parse_qsl(parsed_url.query), dict(self.headers), body)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = _handle
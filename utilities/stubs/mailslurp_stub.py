@@ -0,0 +1,314 @@
+import json
+import re
+import socketserver
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+from email import message_from_bytes, policy
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+# Domain of the addresses of the inboxes created by the stand-in
+STUB_EMAIL_DOMAIN = "mailslurp.local"
+
+
+class MailSlurpStub:
+    """
+    In-process stand-in for the part of the MailSlurp API used by utilities/api/api_temp_email.py.
+
+    Implemented endpoints:
+    - POST /inboxes/withDefaults
+    - GET /waitForLatestEmail?inboxId=&timeout=&unreadOnly=
+    - GET /inboxes/{inbox_id}/emails?since=&sort=
+    - GET /emails/{email_id}
+    - DELETE /emptyInbox?inboxId=
+    - DELETE /inboxes/{inbox_id}
+
+    Emails are accepted with deliver(), with POST /stub/deliver and, if smtp_port is given, by a minimal
+    SMTP listener. Inboxes that are not known yet (for example inbox IDs from user_credentials.json)
+    are created on the first use, so the tests can use their usual data.
+
+    Usage:
+        with MailSlurpStub() as stub:
+            set_api_base_url("mailslurp", stub.url)
+            stub.deliver(inbox_id, "Subject", "<a href=...>")
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, smtp_port=None):
+        """
+        :param host: Interface to listen on
+        :param port: HTTP port, 0 picks a free port
+        :param smtp_port: SMTP port, None disables the SMTP listener, 0 picks a free port
+        """
+        self.inboxes = {}
+        self.emails = {}
+        self._condition = threading.Condition()
+        self._http_server = ThreadingHTTPServer((host, port), _MailSlurpRequestHandler)
+        self._http_server.stub = self
+        self._smtp_server = None
+        if smtp_port is not None:
+            self._smtp_server = socketserver.ThreadingTCPServer((host, smtp_port), _SmtpRequestHandler)
+            self._smtp_server.daemon_threads = True
+            self._smtp_server.stub = self
+        self._threads = []
+        self._stopped = False
+
+    @property
+    def url(self):
+        host, port = self._http_server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def smtp_address(self):
+        return self._smtp_server.server_address[:2] if self._smtp_server else None
+
+    def start(self):
+        for server in (self._http_server, self._smtp_server):
+            if server is not None:
+                thread = threading.Thread(target=server.serve_forever, name="mailslurp-stub", daemon=True)
+                thread.start()
+                self._threads.append(thread)
+        return self
+
+    def stop(self):
+        with self._condition:
+            # Wake up the requests waiting for emails, so the server can shut down
+            self._stopped = True
+            self._condition.notify_all()
+        for server in (self._http_server, self._smtp_server):
+            if server is not None:
+                server.shutdown()
+                server.server_close()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.stop()
+
+    def create_inbox(self, inbox_id=None, email_address=None):
+        """
+        Creates an inbox, or returns the existing one with the same ID or email address
+
+        :param inbox_id: Optional inbox ID, generated if not given
+        :param email_address: Optional email address, generated if not given
+        :return: inbox dict
+        """
+        with self._condition:
+            for inbox in self.inboxes.values():
+                if inbox["id"] == inbox_id or (email_address and inbox["emailAddress"] == email_address.lower()):
+                    return inbox
+            inbox_id = inbox_id or str(uuid.uuid4())
+            inbox = {
+                "id": inbox_id,
+                "emailAddress": (email_address or f"{inbox_id}@{STUB_EMAIL_DOMAIN}").lower(),
+                "createdAt": _now_iso(),
+                "emails": [],
+            }
+            self.inboxes[inbox_id] = inbox
+            return inbox
+
+    def delete_inbox(self, inbox_id):
+        with self._condition:
+            inbox = self.inboxes.pop(inbox_id, None)
+            for email in inbox["emails"] if inbox else []:
+                self.emails.pop(email["id"], None)
+            return inbox is not None
+
+    def empty_inbox(self, inbox_id):
+        with self._condition:
+            inbox = self.create_inbox(inbox_id)
+            for email in inbox["emails"]:
+                self.emails.pop(email["id"], None)
+            inbox["emails"] = []
+
+    def deliver(self, to, subject, body, sender="no-reply@plextera.com"):
+        """
+        Puts an email into the inbox, as if it was received
+
+        :param to: Inbox ID or email address of the recipient
+        :param subject: Email subject
+        :param body: html body of a letter
+        :param sender: Email address of the sender
+        :return: email dict
+        """
+        with self._condition:
+            if "@" in to:
+                inbox = self.create_inbox(email_address=to)
+            else:
+                inbox = self.create_inbox(to)
+            email = {
+                "id": str(uuid.uuid4()),
+                "inboxId": inbox["id"],
+                "to": [inbox["emailAddress"]],
+                "from": sender,
+                "subject": subject,
+                "body": body,
+                "createdAt": _now_iso(),
+                "read": False,
+            }
+            inbox["emails"].append(email)
+            self.emails[email["id"]] = email
+            self._condition.notify_all()
+            return email
+
+    def wait_for_latest_email(self, inbox_id, timeout, unread_only):
+        """
+        Returns the latest email of the inbox and marks it as read. Waits for it if the inbox has no such emails.
+
+        :param inbox_id: inbox ID
+        :param timeout: Deadline in seconds
+        :param unread_only: Skip emails that are already read
+        :return: email dict, or None if nothing was received in time
+        """
+        deadline = time.monotonic() + timeout
+        with self._condition:
+            while True:
+                emails = [email for email in self.create_inbox(inbox_id)["emails"]
+                          if not (unread_only and email["read"])]
+                if emails:
+                    emails[-1]["read"] = True
+                    return emails[-1]
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._stopped:
+                    return None
+                self._condition.wait(remaining)
+
+    def list_emails(self, inbox_id, since=None, sort="ASC"):
+        with self._condition:
+            emails = [email for email in self.create_inbox(inbox_id)["emails"]
+                      if since is None or _parse_iso(email["createdAt"]) >= since]
+        return sorted(emails, key=lambda email: email["createdAt"], reverse=sort.upper() == "DESC")
+
+
+class _MailSlurpRequestHandler(BaseHTTPRequestHandler):
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send_json(self, status, data=None):
+        payload = json.dumps(data).encode() if data is not None else b""
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _parse_request(self):
+        parsed_url = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed_url.query).items()}
+        return parsed_url.path.rstrip("/"), query
+
+    def do_GET(self):
+        stub = self.server.stub
+        path, query = self._parse_request()
+        if path == "/waitForLatestEmail":
+            email = stub.wait_for_latest_email(query["inboxId"], int(query.get("timeout", 8000)) / 1000,
+                                               query.get("unreadOnly", "false") == "true")
+            if email is None:
+                return self._send_json(408, {"message": "No email received in time"})
+            return self._send_json(200, email)
+        match = re.fullmatch(r"/inboxes/([^/]+)/emails", path)
+        if match:
+            since = _parse_iso(query["since"]) if "since" in query else None
+            emails = stub.list_emails(match.group(1), since, query.get("sort", "ASC"))
+            return self._send_json(200, [_email_preview(email) for email in emails])
+        match = re.fullmatch(r"/emails/([^/]+)", path)
+        if match:
+            email = stub.emails.get(match.group(1))
+            return self._send_json(200, email) if email else self._send_json(404, {"message": "Email not found"})
+        self._send_json(404, {"message": f"Not implemented in the stand-in: GET {path}"})
+
+    def do_POST(self):
+        stub = self.server.stub
+        path, query = self._parse_request()
+        if path == "/inboxes/withDefaults":
+            inbox = stub.create_inbox()
+            return self._send_json(201, {key: value for key, value in inbox.items() if key != "emails"})
+        if path == "/stub/deliver":
+            length = int(self.headers.get("Content-Length") or 0)
+            data = json.loads(self.rfile.read(length) or b"{}")
+            email = stub.deliver(data["to"], data.get("subject", ""), data.get("body", ""))
+            return self._send_json(201, email)
+        self._send_json(404, {"message": f"Not implemented in the stand-in: POST {path}"})
+
+    def do_DELETE(self):
+        stub = self.server.stub
+        path, query = self._parse_request()
+        if path == "/emptyInbox":
+            stub.empty_inbox(query["inboxId"])
+            return self._send_json(204)
+        match = re.fullmatch(r"/inboxes/([^/]+)", path)
+        if match:
+            return self._send_json(204 if stub.delete_inbox(match.group(1)) else 404)
+        self._send_json(404, {"message": f"Not implemented in the stand-in: DELETE {path}"})
+
+
+class _SmtpRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Minimal SMTP dialog: HELO/EHLO, MAIL, RCPT, DATA, RSET, NOOP and QUIT. No authentication and no TLS.
+    """
+
+    def _reply(self, line):
+        self.wfile.write(line.encode() + b"\r\n")
+
+    def handle(self):
+        recipients = []
+        self._reply("220 mailslurp-stub ready")
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            command = line.decode(errors="replace").strip()
+            verb = command[:4].upper()
+            if verb in ("HELO", "EHLO"):
+                self._reply("250 mailslurp-stub")
+            elif verb == "MAIL":
+                recipients = []
+                self._reply("250 OK")
+            elif verb == "RCPT":
+                recipients.append(command.split(":", 1)[1].strip().strip("<>"))
+                self._reply("250 OK")
+            elif verb == "DATA":
+                self._reply("354 End data with <CR><LF>.<CR><LF>")
+                self._receive_message(recipients)
+                self._reply("250 OK")
+            elif verb in ("RSET", "NOOP"):
+                recipients = [] if verb == "RSET" else recipients
+                self._reply("250 OK")
+            elif verb == "QUIT":
+                self._reply("221 Bye")
+                return
+            else:
+                self._reply("502 Command not implemented")
+
+    def _receive_message(self, recipients):
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line or line in (b".\r\n", b".\n"):
+                break
+            # Dot-stuffing, see RFC 5321 4.5.2
+            lines.append(line[1:] if line.startswith(b"..") else line)
+        message = message_from_bytes(b"".join(lines), policy=policy.default)
+        part = message.get_body(preferencelist=("html", "plain"))
+        body = part.get_content() if part else ""
+        for recipient in recipients:
+            self.server.stub.deliver(recipient, str(message.get("Subject", "")), body, str(message.get("From", "")))
+
+
+def _email_preview(email):
+    return {key: value for key, value in email.items() if key != "body"}
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def _parse_iso(value):
+    # '+' of the timezone is decoded as a space when it is not escaped in the query string
+    return datetime.fromisoformat(value.replace("Z", "+00:00").replace(" ", "+"))
@@ -0,0 +1,151 @@
+import re
+import time
+from datetime import datetime, timezone
+
+import requests
+
+from utilities.api.api_client import build_auth_headers, get_api_base_url
+from utilities.teardown_registry import TeardownRegistry
+
+# Keys the APIs use for the resource name and creation time
+NAME_KEYS = ("name", "organizationName", "companyName")
+CREATED_KEYS = ("createdOn", "createdAt", "createdDate", "creationDate", "created")
+
+
+def list_all_items(session, url, headers, page_size=100, max_pages=50):
+    """
+    Pages through a paginated list endpoint and returns all items
+
+    :param session: requests session
+    :param url: List URL with '{page}' and '{size}' placeholders
+    :param headers: Request headers
+    :param page_size: Number of items per page
+    :param max_pages: Upper limit of pages to read
+    :return: list of items
+    """
+    items = []
+    for page in range(max_pages):
+        response = session.get(url.format(page=page, size=page_size), headers=headers, timeout=30)
+        response.raise_for_status()
+        data = response.json()
+        page_items = data if isinstance(data, list) else data.get("content", [])
+        items.extend(page_items)
+        if isinstance(data, list) or data.get("last", True) or len(page_items) < page_size:
+            break
+    return items
+
+
+def get_default_hub_name_pattern(session, headers):
+    """
+    Returns a pattern of the names the hub wizard gives to new hubs. Hubs created by the wizard tests keep them.
+    The current default name is read from the API and every number in it is replaced by a wildcard,
+    so the names given by earlier wizard runs, with lower counters, match as well.
+
+    :param session: requests session
+    :param headers: Request headers
+    :return: compiled regex, or None when the API does not return a default name
+    """
+    response = session.get(get_api_base_url("ocrg") + "/api/hubs/default-name", headers=headers, timeout=30)
+    if not response.ok:
+        return None
+    try:
+        data = response.json()
+    except ValueError:
+        data = response.text
+    name = data if isinstance(data, str) else next((data[key] for key in ("name", "defaultName") if data.get(key)), "")
+    if not name.strip():
+        return None
+    return re.compile(re.sub(r"\d+", r"\\d+", re.escape(name.strip())))
+
+
+def get_item_name(item):
+    return next((item[key] for key in NAME_KEYS if item.get(key)), "")
+
+
+def get_item_age_seconds(item, now):
+    """
+    Returns how many seconds ago the item was created, or None if the item has no creation time
+    """
+    value = next((item[key] for key in CREATED_KEYS if item.get(key)), None)
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        # Unix time in milliseconds
+        created = datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    else:
+        try:
+            created = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if created.tzinfo is None:
+            created = created.replace(tzinfo=timezone.utc)
+    return (now - created).total_seconds()
+
+
+def select_orphans(items, name_prefixes, min_age_minutes, now=None, name_patterns=()):
+    """
+    Selects items which name starts with one of the prefixes or matches one of the patterns
+    and which are older than the minimal age. Items without a creation time are selected only when the minimal age is 0.
+
+    :param items: Items returned by a list endpoint
+    :param name_prefixes: List of name prefixes
+    :param min_age_minutes: Minimal age in minutes
+    :param now: Current time, datetime with timezone
+    :param name_patterns: Compiled regexes the whole name has to match
+    :return: list of selected items
+    """
+    now = now or datetime.now(timezone.utc)
+    orphans = []
+    for item in items:
+        name = get_item_name(item)
+        if not name.startswith(tuple(name_prefixes)) and not any(pattern.fullmatch(name) for pattern in name_patterns):
+            continue
+        age = get_item_age_seconds(item, now)
+        if (age is None and min_age_minutes == 0) or (age is not None and age >= min_age_minutes * 60):
+            orphans.append(item)
+    return orphans
+
+
+def sweep_orphans(token, name_prefixes, min_age_minutes, max_workers=8, default_hub_names=False):
+    """
+    Finds hubs, web automations and organizations left by previous runs and deletes them concurrently.
+
+    :param token: Token of a user that can see and delete all the resources (superuser)
+    :param name_prefixes: List of name prefixes of the test resources
+    :param min_age_minutes: Resources younger than this are not deleted
+    :param max_workers: Number of threads deleting the resources
+    :param default_hub_names: If True, hubs that kept the default name of the hub wizard are swept as well.
+                              People creating hubs by hand on the same stage get the same names, so it is opt-in.
+    :return: dict with number of removed resources per type, number of failures and duration in seconds
+    """
+    start = time.monotonic()
+    headers = build_auth_headers(token)
+    session = requests.Session()
+    results = []
+    # Sweep deletions are kept out of the settle waits reported for the test teardowns
+    registry = TeardownRegistry(max_workers=max_workers, results=results, settle_times=[])
+    hubs = list_all_items(session, get_api_base_url("ocrg") + "/api/hubs/page?sortBy=name&page={page}&size={size}", headers)
+    default_hub_name = get_default_hub_name_pattern(session, headers) if default_hub_names else None
+    for hub in select_orphans(hubs, name_prefixes, min_age_minutes, name_patterns=[default_hub_name] if default_hub_name else []):
+        registry.register_hub(hub["id"], token)
+    automations = list_all_items(
+        session,
+        get_api_base_url("ocrg") + "/api/sbb/automation/list?page={page}&size={size}&sortDirection=DESC&sortBy=createdOn",
+        headers)
+    for automation in select_orphans(automations, name_prefixes, min_age_minutes):
+        registry.register_web_automation(automation["id"], token)
+    organizations = list_all_items(
+        session, get_api_base_url("plextera") + "/api/account-service/admin-console/organizations?page={page}&size={size}",
+        headers)
+    for organization in select_orphans(organizations, name_prefixes, min_age_minutes):
+        registry.register_organization(organization["id"], token)
+    registry.wait()
+    removed = {}
+    for result in results:
+        if result["error"] is None:
+            removed[result["type"]] = removed.get(result["type"], 0) + 1
+    return {
+        "removed": removed,
+        "failed": [result for result in results if result["error"]],
+        "seconds": round(time.monotonic() - start, 2),
+    }
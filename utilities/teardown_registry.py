@@ -0,0 +1,121 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from utilities.api.api_client import build_auth_headers, get_api_base_url
+from utilities.polling import poll_until, is_hub_settled, hub_settle_times
+
+# Results of all teardown deletions of this process, reported at the end of the session
+teardown_results = []
+
+
+class TeardownRegistry:
+    """
+    Session-level registry of resources created by the tests.
+
+    Tests register resources right after they are created. When the test is finished (passed or failed),
+    the teardown_registry fixture calls flush() and the registered resources are deleted in a background
+    thread pool, so the next test can start without waiting. Failed deletions are retried with backoff.
+
+    Playwright sync objects cannot be shared between threads, so deletions are sent with requests.
+    """
+
+    def __init__(self, max_workers=8, timeout=60, request_timeout=30, results=teardown_results,
+                 settle_times=hub_settle_times):
+        """
+        :param max_workers: Number of background threads
+        :param timeout: Deadline in seconds for deleting one resource, including retries
+        :param request_timeout: Timeout in seconds of one HTTP request
+        :param results: List the result of every deletion is appended to
+        :param settle_times: List the settle wait of every hub deletion is appended to
+        """
+        self.results = results
+        self.settle_times = settle_times
+        self.timeout = timeout
+        self.request_timeout = request_timeout
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="teardown")
+        self.pending = []
+        self.futures = []
+        self._local = threading.local()
+
+    def register_hub(self, hub_id, token):
+        self.pending.append(("hub", hub_id, get_api_base_url("ocrg") + f"/api/hubs/{hub_id}", build_auth_headers(token)))
+
+    def register_web_automation(self, web_automation_id, token):
+        self.pending.append(("web automation", web_automation_id,
+                             get_api_base_url("ocrg") + f"/api/sbb/automation/{web_automation_id}",
+                             build_auth_headers(token)))
+
+    def register_organization(self, organization_id, superuser_token):
+        self.pending.append(("organization", organization_id,
+                             get_api_base_url("plextera") + f"/api/account-service/admin-console/organizations/{organization_id}",
+                             build_auth_headers(superuser_token)))
+
+    def register_inbox(self, inbox_id, x_api_key):
+        self.pending.append(("inbox", inbox_id, get_api_base_url("mailslurp") + f"/inboxes/{inbox_id}",
+                             {"Context-type": "application/json", "X-API-KEY": x_api_key}))
+
+    def flush(self):
+        """
+        Sends all registered resources to the background threads for deletion
+        """
+        while self.pending:
+            self.futures.append(self.executor.submit(self._delete, *self.pending.pop(0)))
+
+    def wait(self):
+        """
+        Deletes the remaining resources and waits until all deletions are finished
+
+        :return: list of results, one dict per resource
+        """
+        self.flush()
+        self.executor.shutdown(wait=True)
+        return [future.result() for future in self.futures]
+
+    def _get_session(self):
+        # One HTTP session per thread, so the connections are reused
+        if not hasattr(self._local, "session"):
+            self._local.session = requests.Session()
+        return self._local.session
+
+    def _delete(self, resource_type, resource_id, url, headers):
+        session = self._get_session()
+        attempts = 0
+
+        def delete_resource():
+            nonlocal attempts
+            attempts += 1
+            try:
+                if resource_type == "hub":
+                    hub_response = session.get(url + "?include=short_outline,channels", headers=headers,
+                                               timeout=self.request_timeout)
+                    if hub_response.status_code == 404:
+                        return True
+                    if not is_hub_settled(hub_response):
+                        return False
+                response = session.delete(url, headers=headers, timeout=self.request_timeout)
+            except requests.RequestException:
+                # Connection errors and read timeouts are retried like rejected deletions
+                return False
+            # 404 means the resource was already deleted, for example by the test itself
+            return response.ok or response.status_code == 404
+
+        start = time.monotonic()
+        error = None
+        try:
+            poll_until(delete_resource, self.timeout, initial_interval=0.5)
+        except TimeoutError as e:
+            error = str(e)
+        result = {
+            "type": resource_type,
+            "id": resource_id,
+            "seconds": round(time.monotonic() - start, 2),
+            "attempts": attempts,
+            "error": error,
+        }
+        if resource_type == "hub":
+            self.settle_times.append({"hub_id": resource_id, "seconds": result["seconds"], "attempts": attempts})
+        self.results.append(result)
+        return result
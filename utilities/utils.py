@@ -1,4 +1,8 @@
-from utilities.api.api_base import authenticate_with_user
+from datetime import datetime
+
+from data.constants import AUTOTEST_NAME_PREFIX
+from utilities.api.api_base import authenticate_with_user, create_new_hub
+from utilities.auth_state import get_cached_user_token
 from utilities.data_processing import get_key_value_from_file
 
 def build_auth_request_payload(user_profile):
@@ -42,5 +46,47 @@ def set_cookies(context, user_token):
     }])
 
 def authenticate_with_user_profile(playwright, context, user_profile):
-    user_token = get_user_token(playwright, user_profile)
-    set_cookies(context, user_token)
\ No newline at end of file
+    """
+    Sets cookies of the user profile in the context. The login request is sent only once per session,
+    next calls reuse the cached token until it is about to expire.
+
+    :param playwright: a fixture
+    :param context: browser context
+    :param user_profile: A key from a user_credentials.json file
+    :return: user token
+    """
+    user_token = get_cached_user_token(playwright, user_profile)
+    set_cookies(context, user_token)
+    return user_token
+
+
+def generate_test_name(resource_type):
+    """
+    Returns a unique name for a resource created by the autotests
+
+    :param resource_type: Short resource description, for example 'hub'
+    :return: name starting with AUTOTEST_NAME_PREFIX
+    """
+    return f"{AUTOTEST_NAME_PREFIX}{resource_type} {datetime.now().strftime('%Y%m%d%H%M%S%f')}"
+
+
+def create_hub(playwright, token, payload_key, name=None, description=""):
+    """
+    Creates a hub through the API
+
+    :param playwright: a fixture
+    :param token: user token
+    :param payload_key: A key from a payloads.json file, for example 'create_outline_hub_payload'
+    :param name: Hub name, a unique test name is generated if it is not given
+    :param description: Hub description
+    :return: hub ID and hub name
+    """
+    payload = get_key_value_from_file("payloads.json", payload_key)
+    payload["name"] = name or generate_test_name("hub")
+    payload["description"] = description
+    response = create_new_hub(playwright, payload, token)
+    assert response.ok
+    return {
+        "id": response.json()["id"],
+        "name": response.json()["name"]
+    }
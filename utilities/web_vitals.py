@@ -0,0 +1,184 @@
+import statistics
+from contextlib import contextmanager
+from urllib.parse import urlparse
+
+from playwright.sync_api import Error
+
+from utilities.data_processing import normalize_path
+from utilities.route_table import ROUTES
+
+# JSONL file the navigation records are written to when the run is started with --web-vitals
+WEB_VITALS_FILE = "web_vitals.jsonl"
+# Page names of the full page loads, by URL path. Other paths are reported with their IDs replaced by '{id}'
+PAGE_NAMES_BY_PATH = {route["url"]: page_name for page_name, route in ROUTES.items() if route["url"] is not None}
+
+# Added to every document of the context. Largest contentful paint, layout shifts and long tasks are only
+# available through PerformanceObserver, so they are buffered in window.__webVitals until they are collected.
+# Browsers without an entry type (Firefox and WebKit have no 'longtask') just do not report it
+WEB_VITALS_INIT_SCRIPT = """
+(() => {
+    if (window.__webVitals) return;
+    const vitals = window.__webVitals = {lcp: [], shifts: [], longTasks: []};
+    performance.setResourceTimingBufferSize(1000);
+    const observe = (type, callback) => {
+        try {
+            new PerformanceObserver(list => list.getEntries().forEach(callback)).observe({type, buffered: true});
+        } catch (e) {}
+    };
+    observe('largest-contentful-paint', entry => vitals.lcp.push(entry.startTime));
+    observe('layout-shift', entry => { if (!entry.hadRecentInput) vitals.shifts.push([entry.startTime, entry.value]); });
+    observe('longtask', entry => vitals.longTasks.push([entry.startTime, entry.duration]));
+})();
+"""
+# Returns the metrics of everything that happened in the document after the given performance.now() value
+# of the document with the given performance.timeOrigin
+COLLECT_SCRIPT = """
+([since, timeOrigin]) => {
+    // A full page load in the block started a new document, measure it from its start
+    if (performance.timeOrigin !== timeOrigin) since = 0;
+    const vitals = window.__webVitals || {lcp: [], shifts: [], longTasks: []};
+    const round = value => Math.round(value * 10) / 10;
+    const resources = performance.getEntriesByType('resource').filter(entry => entry.startTime >= since);
+    const lcp = vitals.lcp.filter(startTime => startTime >= since);
+    const longTasks = vitals.longTasks.filter(([startTime]) => startTime >= since);
+    const navigation = since === 0 ? performance.getEntriesByType('navigation')[0] : undefined;
+    const now = performance.now();
+    return {
+        duration: round(now - since),
+        navigation: navigation ? {
+            ttfb: round(navigation.responseStart - navigation.requestStart),
+            dom_content_loaded: round(navigation.domContentLoadedEventEnd),
+            load: round(navigation.loadEventEnd || now),
+            transfer_size: navigation.transferSize,
+        } : null,
+        resources: {
+            count: resources.length,
+            transfer_size: resources.reduce((sum, entry) => sum + entry.transferSize, 0),
+            slowest: round(Math.max(0, ...resources.map(entry => entry.duration))),
+        },
+        lcp: lcp.length ? round(lcp[lcp.length - 1] - since) : null,
+        cls: Math.round(vitals.shifts.filter(([startTime]) => startTime >= since)
+            .reduce((sum, [, value]) => sum + value, 0) * 1000) / 1000,
+        long_tasks: {count: longTasks.length, total: round(longTasks.reduce((sum, [, duration]) => sum + duration, 0))},
+    };
+}
+"""
+
+# Navigation records of this process, reported at the end of the session
+web_vitals_records = []
+# Collector of every browser context with web vitals enabled
+_collectors = {}
+
+
+class WebVitalsCollector:
+    """
+    Collects Navigation Timing, Resource Timing, largest contentful paint, cumulative layout shift
+    and long tasks of the pages of a browser context.
+
+    Every full page load (the first page.goto of a test and later reloads) is recorded on the 'load' event.
+    In-app navigations of the single-page frontend do not load a new document, they are recorded
+    by measure_navigation around the click of the page object. The browser stops reporting LCP after
+    the first user input, so LCP is usually only available for full page loads.
+    """
+
+    def __init__(self, nodeid, records=web_vitals_records):
+        """
+        :param nodeid: Node ID of the test the records belong to
+        :param records: List the navigation records are appended to
+        """
+        self.nodeid = nodeid
+        self.records = records
+        # Pages with a measure_navigation block in progress, their loads are part of the measured navigation
+        self.measured_pages = set()
+
+    def install(self, context):
+        """
+        :param context: BrowserContext
+        """
+        context.add_init_script(WEB_VITALS_INIT_SCRIPT)
+        context.on("page", lambda page: page.on("load", self._on_load))
+        context.on("close", lambda context: _collectors.pop(context, None))
+        _collectors[context] = self
+
+    def _on_load(self, page):
+        if page not in self.measured_pages:
+            self.collect(page, get_page_name(page.url), "load", [0, None])
+
+    def collect(self, page, page_name, kind, since):
+        """
+        Reads the metrics of the page and stores the record
+
+        :param page: Page
+        :param page_name: Name the record is tagged with
+        :param kind: 'load' for a full page load, 'navigation' for an in-app navigation
+        :param since: performance.now() and performance.timeOrigin values the navigation started at
+        :return: record dict, or None when the page was closed or navigated away meanwhile
+        """
+        try:
+            metrics = page.evaluate(COLLECT_SCRIPT, since)
+        except Error:
+            return None
+        record = {"nodeid": self.nodeid, "page": page_name, "kind": kind, "url": page.url, **metrics}
+        self.records.append(record)
+        return record
+
+
+@contextmanager
+def measure_navigation(page, page_name):
+    """
+    Records the in-app navigation started in the block, until the block is finished.
+    Page objects wrap the click together with the wait for the responses the target page needs,
+    so the duration is the time until the page is ready. A full page load in the block (fast navigation
+    with page.goto) is part of this record and is not recorded as a 'load' of its own.
+    Does nothing when web vitals are not collected.
+
+    :param page: Page
+    :param page_name: Name of the target page, for example 'Workflows'
+    """
+    collector = _collectors.get(page.context)
+    if collector is None:
+        yield
+        return
+    since = page.evaluate("[performance.now(), performance.timeOrigin]")
+    collector.measured_pages.add(page)
+    try:
+        yield
+    finally:
+        collector.measured_pages.discard(page)
+    collector.collect(page, page_name, "navigation", since)
+
+
+def get_page_name(url):
+    """
+    :param url: Page URL
+    :return: page name from PAGE_NAMES_BY_PATH, or the normalized path for other pages
+    """
+    path = normalize_path(urlparse(url).path.rstrip("/") or "/")
+    return PAGE_NAMES_BY_PATH.get(path, path)
+
+
+def summarize_web_vitals(records):
+    """
+    Aggregates the navigation records per page and kind
+
+    :param records: Records written by WebVitalsCollector
+    :return: list of dicts with page, kind, count and the medians of duration, LCP, transferred bytes
+             and long task time and the maximum CLS, the slowest pages first
+    """
+    by_page = {}
+    for record in records:
+        by_page.setdefault((record["page"], record["kind"]), []).append(record)
+    summary = []
+    for (page_name, kind), page_records in by_page.items():
+        lcp_values = [record["lcp"] for record in page_records if record["lcp"] is not None]
+        summary.append({
+            "page": page_name,
+            "kind": kind,
+            "count": len(page_records),
+            "duration": statistics.median(record["duration"] for record in page_records),
+            "lcp": statistics.median(lcp_values) if lcp_values else None,
+            "cls": max(record["cls"] for record in page_records),
+            "long_tasks": statistics.median(record["long_tasks"]["total"] for record in page_records),
+            "transfer_size": statistics.median(record["resources"]["transfer_size"] for record in page_records),
+        })
+    return sorted(summary, key=lambda row: row["duration"], reverse=True)